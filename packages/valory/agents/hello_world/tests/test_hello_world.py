@@ -70,6 +70,9 @@ STRICT_CHECK_STRINGS = (
     " in period 3 says: HELLO_WORLD!",
 )
 
+# the port of the http server of the first agent, the other agents use the next ones
+HTTP_SERVER_PORT = 8000
+
 
 # normal execution
 @pytest.mark.e2e
@@ -88,6 +91,17 @@ class BaseHelloWorldABCITest(
     ROUND_TIMEOUT_SECONDS = 30
     RESET_PAUSE_DURATION = 10
 
+    def prepare(self, nb_nodes: int) -> None:
+        """Set up the agents, each serving http requests on its own port."""
+        super().prepare(nb_nodes)
+        for i in range(nb_nodes):
+            self.set_agent_context(self._get_agent_name(i))
+            self.set_config(
+                "vendor.valory.connections.http_server.config.port",
+                HTTP_SERVER_PORT + i,
+                type_="int",
+            )
+
 
 @pytest.mark.usefixtures(
     "flask_tendermint", "tendermint_port", "abci_host", "abci_port"
@@ -19,24 +19,53 @@
 
 """This module contains the behaviours for the 'hello_world' skill."""
 
-import random
+import json
+import time
 from abc import ABC
-from typing import Generator, Set, Type, cast
+from typing import Any, Callable, Generator, List, Optional, Set, Tuple, Type, cast
 
+from aea.protocols.base import Message
+
+from packages.valory.skills.abstract_round_abci.base import BaseTxPayload
+from packages.valory.skills.abstract_round_abci.behaviour_utils import TimeoutException
 from packages.valory.skills.abstract_round_abci.behaviours import (
     AbstractRoundBehaviour,
     BaseBehaviour,
 )
-from packages.valory.skills.hello_world_abci.models import HelloWorldParams, SharedState
+from packages.valory.skills.hello_world_abci.instrumentation import (
+    BehaviourTimer,
+    BlockType,
+)
+from packages.valory.skills.hello_world_abci.models import (
+    BenchmarkTool,
+    HelloWorldParams,
+    KeeperSelection,
+    PooledHttp,
+    RandomnessCache,
+    RandomnessRetries,
+    RandomnessSources,
+    Requests,
+    SharedState,
+    WorkQueue,
+)
 from packages.valory.skills.hello_world_abci.payloads import (
     CollectRandomnessPayload,
+    NON_KEEPER_MESSAGE,
+    PRINTED_MESSAGE_FORMAT,
     PrintMessagePayload,
     RegistrationPayload,
     ResetPayload,
     SelectKeeperPayload,
 )
+from packages.valory.skills.hello_world_abci.randomness import (
+    Observation,
+    drand_round_at,
+    is_valid_observation,
+    round_url,
+)
 from packages.valory.skills.hello_world_abci.rounds import (
     CollectRandomnessRound,
+    Event,
     HelloWorldAbciApp,
     PrintMessageRound,
     RegistrationRound,
@@ -44,10 +73,22 @@ from packages.valory.skills.hello_world_abci.rounds import (
     SelectKeeperRound,
     SynchronizedData,
 )
+from packages.valory.skills.hello_world_abci.work_queue import QueuedMessage
 
 
 class HelloWorldABCIBaseBehaviour(BaseBehaviour, ABC):
-    """Base behaviour behaviour for the Hello World abci skill."""
+    """
+    Base behaviour behaviour for the Hello World abci skill.
+
+    The wall-clock time spent by the behaviour is split into the time spent sending transactions,
+    waiting for the round to end, sleeping and waiting for http responses, the remainder being the local
+    compute time. It is recorded in the benchmark tool once the behaviour is done.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        """Initialize the behaviour."""
+        super().__init__(**kwargs)
+        self._timer = BehaviourTimer()
 
     @property
     def synchronized_data(self) -> SynchronizedData:
@@ -61,6 +102,85 @@ class HelloWorldABCIBaseBehaviour(BaseBehaviour, ABC):
         """Return the params."""
         return cast(HelloWorldParams, self.context.params)
 
+    def async_act_wrapper(self) -> Generator:
+        """Do the act, starting the timer of the behaviour the first time."""
+        self._timer.start()
+        yield from super().async_act_wrapper()
+
+    def act_wrapper(self) -> None:
+        """Pass the responses received by the pooled http client to their callbacks, then do the act."""
+        client = cast(PooledHttp, self.context.pooled_http).client
+        if client is not None:
+            client.dispatch()
+        super().act_wrapper()
+
+    def set_done(self) -> None:
+        """Set the behaviour to done, recording the time it took."""
+        if not self.is_done():
+            benchmark_tool = cast(BenchmarkTool, self.context.benchmark_tool)
+            benchmark_tool.record(self.behaviour_id, self._timer.stop())
+        super().set_done()
+
+    def send_a2a_transaction(
+        self, payload: BaseTxPayload, resetting: bool = False
+    ) -> Generator:
+        """Send a transaction, timing it."""
+        return (
+            yield from self._timer.measure(
+                BlockType.TX, super().send_a2a_transaction(payload, resetting)
+            )
+        )
+
+    def wait_until_round_end(
+        self, timeout: Optional[float] = None
+    ) -> Generator[None, None, None]:
+        """Wait until the ABCI application exits from the round, timing it."""
+        yield from self._timer.measure(
+            BlockType.WAIT, super().wait_until_round_end(timeout)
+        )
+
+    def sleep(self, seconds: float) -> Any:
+        """Sleep, timing it."""
+        return (yield from self._timer.measure(BlockType.SLEEP, super().sleep(seconds)))
+
+    def _send_randomness_requests(
+        self,
+        callback: Callable[[Message, BaseBehaviour], None],
+        drand_round: Optional[int] = None,
+    ) -> int:
+        """
+        Send the randomness request to the randomness api and all its mirrors at once, without waiting.
+
+        The requests are sent by the pooled http client, if it is enabled, and otherwise by the http client connection.
+
+        :param callback: the callback to call with each of the responses.
+        :param drand_round: the round of the requested beacon, or `None` to request the latest one.
+        :return: the number of requests sent.
+        """
+        api_specs = self.context.randomness_api.get_spec()
+        sources = cast(RandomnessSources, self.context.randomness_sources)
+        urls = [api_specs["url"], *sources.mirrors]
+        if drand_round is not None:
+            urls = [round_url(url, drand_round) for url in urls]
+        client = cast(PooledHttp, self.context.pooled_http).client
+        if client is not None:
+            for url in urls:
+                client.request(
+                    api_specs["method"], url, lambda message: callback(message, self)
+                )
+            return len(urls)
+
+        requests = cast(Requests, self.context.requests)
+        for url in urls:
+            http_message, http_dialogue = self._build_http_request_message(
+                method=api_specs["method"],
+                url=url,
+            )
+            self.context.outbox.put_message(message=http_message)
+            request_nonce = self._get_request_nonce_from_dialogue(http_dialogue)
+            requests.request_id_to_callback[request_nonce] = callback
+        return len(urls)
+
 
 class RegistrationBehaviour(HelloWorldABCIBaseBehaviour):
     """Register to the next round."""
@@ -83,34 +203,286 @@ class RegistrationBehaviour(HelloWorldABCIBaseBehaviour):
         self.set_done()
 
 
-class CollectRandomnessBehaviour(HelloWorldABCIBaseBehaviour):
+class RandomnessRetrievalBehaviour(HelloWorldABCIBaseBehaviour, ABC):
+    """Base behaviour for the behaviours which retrieve a drand beacon."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        """Initialize the behaviour."""
+        super().__init__(**kwargs)
+        # the drand round of the beacon, if it is pinned
+        self._drand_round: Optional[int] = None
+
+    def _retrieve_randomness(self) -> Generator[None, None, Optional[Observation]]:
+        """
+        Retrieve a beacon from the fastest available source, once.
+
+        The sources are tried in order: the cache, the local randomness sources, the cache shared
+        with the agents of the host, and the race of the requests to the randomness api and its mirrors.
+
+        :yield: None
+        :return: the beacon, or `None` if none of the sources provided a valid one.
+        """
+        cache = cast(RandomnessCache, self.context.randomness_cache)
+        observation = yield from self._first_verified(
+            [cache.get(drand_round=self._drand_round)]
+        )
+        if observation is not None:
+            self.context.logger.info(
+                f"Using cached randomness (cache hits: {cache.stats.hits}, misses: {cache.stats.misses})."
+            )
+            return observation
+        observation = self._get_local_randomness()
+        if observation is None:
+            observation = yield from self._wait_for_shared_randomness()
+        if observation is None:
+            observation = yield from self._race_randomness_requests()
+            if observation is not None:
+                cache.store(observation)
+            else:
+                cache.release_fetch(drand_round=self._drand_round)
+        return observation
+
+    def _pinned_drand_round(self) -> Optional[int]:
+        """
+        Get the drand round which was the latest one at the time of the block which started the round, if it is pinned.
+
+        The time of the block is agreed on by all the agents, and so is the round, while the latest round
+        at the time of their requests may differ between them, when they are close to the start of a round.
+
+        :return: the round, or `None` if the round is not pinned or the time of the block is not known.
+        """
+        if not self.params.pin_drand_round:
+            return None
+        try:
+            timestamp = cast(
+                SharedState, self.context.state
+            ).round_sequence.last_round_transition_timestamp
+        except ValueError:
+            return None
+        cache = cast(RandomnessCache, self.context.randomness_cache)
+        drand_round = drand_round_at(
+            timestamp.timestamp(), cache.genesis_time, cache.period
+        )
+        self.context.logger.info(f"Pinned the drand round {drand_round}.")
+        return drand_round
+
+    def _get_local_randomness(self) -> Optional[Observation]:
+        """Get a beacon from the first local randomness source which can provide a valid one."""
+        sources = cast(RandomnessSources, self.context.randomness_sources)
+        for source in sources.local_sources:
+            observation = source.get_observation(self._drand_round)
+            if is_valid_observation(observation):
+                self.context.logger.info(
+                    f"Retrieved randomness from local source {source.source_id}."
+                )
+                return observation
+        return None
+
+    def _wait_for_shared_randomness(
+        self,
+    ) -> Generator[None, None, Optional[Observation]]:
+        """
+        Wait for the beacon fetched by another agent of the host, if one is fetching it.
+
+        :yield: None
+        :return: the shared beacon, or `None` if the agent has to fetch it on its own.
+        """
+        cache = cast(RandomnessCache, self.context.randomness_cache)
+        if cache.acquire_fetch(drand_round=self._drand_round):
+            return None
+
+        self.context.logger.info(
+            "Waiting for the randomness fetched by another agent of the host."
+        )
+        # the agent fetches the beacon on its own if the lease is released, after a failed fetch, or abandoned
+        is_shared = yield from self._timer.measure(
+            BlockType.HTTP, self._poll_shared_randomness(cache)
+        )
+        if not is_shared:
+            self.context.logger.warning(
+                "The randomness has not been shared in time, fetching it."
+            )
+            return None
+        observation = yield from self._first_verified(
+            [cache.get(drand_round=self._drand_round)]
+        )
+        if observation is not None:
+            self.context.logger.info(
+                f"Using shared randomness (shared hits: {cache.stats.shared_hits})."
+            )
+        return observation
+
+    def _poll_shared_randomness(
+        self, cache: RandomnessCache
+    ) -> Generator[None, None, bool]:
+        """
+        Check the shared cache every `shared_poll_interval` seconds, until the beacon is shared or its lease is free.
+
+        :param cache: the cache of the agent.
+        :yield: None
+        :return: whether the beacon has been shared or its lease taken before `shared_lease_timeout`.
+        """
+        deadline = time.monotonic() + cache.shared_lease_timeout
+        while cache.get_shared(
+            (cache.current_round() if self._drand_round is None else self._drand_round),
+            self._drand_round,
+        ) is None and not cache.acquire_fetch(drand_round=self._drand_round):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            yield from self.sleep(min(cache.shared_poll_interval, remaining))
+        return True
+
+    def _race_randomness_requests(
+        self,
+    ) -> Generator[None, None, Optional[Observation]]:
+        """
+        Send the randomness request to all the urls at once and wait for the first valid response.
+
+        The responses are buffered by the callback, instead of being sent to the behaviour,
+        so that responses arriving together, or after the race has been won, are not lost nor rejected.
+        If hedging is enabled, the requests are sent once more if none of them has answered
+        after the configured percentile of the latencies of the previous races.
+
+        :yield: None
+        :return: the first valid beacon, or `None` if no url responded with a valid one.
+        """
+        retries = cast(RandomnessRetries, self.context.randomness_retries)
+        responses: List[Message] = []
+
+        def _buffer_response(message: Message, _: BaseBehaviour) -> None:
+            """Buffer a response of the race."""
+            responses.append(message)
+
+        start = time.monotonic()
+        hedge_delay = retries.hedge_delay()
+        is_first_response = True
+        n_pending = self._send_randomness_requests(_buffer_response, self._drand_round)
+        while n_pending > 0:
+            timeout = (
+                None
+                if hedge_delay is None
+                else max(start + hedge_delay - time.monotonic(), 0.0)
+            )
+            try:
+                yield from self._timer.measure(
+                    BlockType.HTTP,
+                    self.wait_for_condition(lambda: len(responses) > 0, timeout),
+                )
+            except TimeoutException:
+                self.context.logger.info(
+                    f"No randomness response after {hedge_delay:.3f}s, hedging the requests."
+                )
+                n_pending += self._send_randomness_requests(
+                    _buffer_response, self._drand_round
+                )
+                hedge_delay = None
+                continue
+            if is_first_response:
+                retries.latencies.observe(time.monotonic() - start)
+                is_first_response = False
+            # the responses which arrived together are verified as a single batch
+            observations = [
+                self.context.randomness_api.process_response(message)
+                for message in responses
+            ]
+            n_pending -= len(responses)
+            responses.clear()
+            observation = yield from self._first_verified(observations)
+            if observation is not None:
+                return observation
+
+        return None
+
+    def _first_verified(
+        self, observations: List[Optional[Observation]]
+    ) -> Generator[None, None, Optional[Observation]]:
+        """
+        Get the first valid beacon of the given ones.
+
+        If the drand round is pinned, only the beacons of the round are valid.
+        If the verification of the drand signatures is enabled, the beacons are verified
+        as a batch against the public key of the drand chain, in the background.
+        If the verification takes longer than `drand_verification_timeout`, the beacons are discarded
+        for now. The verification still completes, so a later retry with the same beacons costs no pairing.
+
+        :param observations: the candidate beacons.
+        :yield: None
+        :return: the first valid beacon, or `None` if none of them is valid.
+        """
+        candidates = [
+            o
+            for o in observations
+            if is_valid_observation(o)
+            and (
+                self._drand_round is None
+                or cast(Observation, o)["round"] == self._drand_round
+            )
+        ]
+        verifier = cast(SharedState, self.context.state).drand_verifier
+        if verifier is None or not candidates:
+            return candidates[0] if candidates else None
+
+        verification = verifier.verify_batch_async(candidates)
+        try:
+            yield from self.wait_for_condition(
+                verification.done, self.params.drand_verification_timeout
+            )
+        except TimeoutException:
+            self.context.logger.warning(
+                f"The drand signatures have not been verified in {self.params.drand_verification_timeout}s, "
+                "discarding the beacons."
+            )
+            return None
+        for observation, is_verified in zip(candidates, verification.result()):
+            if is_verified:
+                return observation
+            self.context.logger.warning(
+                f"Discarding drand beacon with an invalid signature: {observation}."
+            )
+        return None
+
+
+class CollectRandomnessBehaviour(RandomnessRetrievalBehaviour):
     """Retrieve randomness."""
 
     matching_round = CollectRandomnessRound
 
+    def __init__(self, **kwargs: Any) -> None:
+        """Initialize the behaviour."""
+        super().__init__(**kwargs)
+        # the time after which the round times out, so that no retry is attempted after it
+        self._deadline: Optional[float] = None
+
     def async_act(self) -> Generator:
         """
-        Check whether tendermint is running or not.
+        Retrieve randomness from the fastest available source.
 
         Steps:
-        - Do a http request to the tendermint health check endpoint
-        - Retry until healthcheck passes or timeout is hit.
-        - If healthcheck passes set done event.
+        - If the drand round is pinned, only use the beacon of the round which was the latest one
+          at the time of the block which started the round, so that all the agents use the same one.
+        - Use the cached beacon, if it is still the latest drand round.
+        - Otherwise, query the local randomness sources, if any is configured.
+        - Otherwise, if the cache is shared with the agents of the host and another one
+          is already fetching the beacon, wait for it to share it.
+        - Otherwise, race http requests to the randomness api and its mirrors,
+          taking the first valid response.
+        - If the verification of the drand signatures is enabled, the beacons of the cache
+          and of the randomness api are only used if their signature is valid.
+        - Retry with a jittered exponential backoff, until a valid beacon is retrieved,
+          the retries are exceeded or the next retry would start after the round has timed out.
+        - If a beacon is retrieved, send it in a transaction and set done event.
         """
+        if self._deadline is None:
+            self._deadline = time.monotonic() + self._round_timeout()
+            self._drand_round = self._pinned_drand_round()
         if self.context.randomness_api.is_retries_exceeded():
             # now we need to wait and see if the other agents progress the round
             yield from self.wait_until_round_end()
             self.set_done()
             return
 
-        api_specs = self.context.randomness_api.get_spec()
-        http_message, http_dialogue = self._build_http_request_message(
-            method=api_specs["method"],
-            url=api_specs["url"],
-        )
-        response = yield from self._do_request(http_message, http_dialogue)
-        observation = self.context.randomness_api.process_response(response)
-
+        observation = yield from self._retrieve_randomness()
         if observation:
             self.context.logger.info(f"Retrieved DRAND values: {observation}.")
             payload = CollectRandomnessPayload(
@@ -125,9 +497,31 @@ class CollectRandomnessBehaviour(HelloWorldABCIBaseBehaviour):
             self.context.logger.error(
                 f"Could not get randomness from {self.context.randomness_api.api_id}"
             )
-            yield from self.sleep(self.params.sleep_time)
+            retries_info = self.context.randomness_api.retries_info
+            delay = cast(
+                RandomnessRetries, self.context.randomness_retries
+            ).backoff.delay(
+                self.params.sleep_time,
+                retries_info.backoff_factor,
+                retries_info.retries_attempted,
+            )
+            if time.monotonic() + delay > self._deadline:
+                self.context.logger.warning(
+                    f"Not retrying in {delay:.3f}s, after the timeout of the round."
+                )
+                yield from self.wait_until_round_end()
+                self.set_done()
+                return
+            yield from self.sleep(delay)
             self.context.randomness_api.increment_retries()
 
+    def _round_timeout(self) -> float:
+        """Get the timeout of the round, as scheduled by the app, which adapts it to the round durations if enabled."""
+        abci_app = cast(SharedState, self.context.state).round_sequence.abci_app
+        return abci_app.event_to_timeout.get(
+            Event.ROUND_TIMEOUT, self.params.round_timeout_seconds
+        )
+
     def clean_up(self) -> None:
         """
         Clean up the resources due to a 'stop' event.
@@ -147,20 +541,27 @@ class SelectKeeperBehaviour(HelloWorldABCIBaseBehaviour, ABC):
         Do the action.
 
         Steps:
-        - Select a keeper randomly.
-        - Send the transaction with the keeper and wait for it to be mined.
+        - Select the keepers deterministically from the randomness.
+        - Send the transaction with the keepers and wait for it to be mined.
         - Wait until ABCI application transitions to the next round.
         - Go to the next behaviour (set done event).
         """
 
-        participants = sorted(self.synchronized_data.participants)
-        random.seed(self.synchronized_data.most_voted_randomness, 2)  # nosec
-        index = random.randint(0, len(participants) - 1)  # nosec
-
-        keeper_address = participants[index]
+        selector = cast(KeeperSelection, self.context.keeper_selection).selector
+        keepers = selector.select_keepers(
+            self.synchronized_data.participants,
+            self.synchronized_data.most_voted_randomness,
+            self.synchronized_data.last_keeper_address,
+        )
 
-        self.context.logger.info(f"Selected a new keeper: {keeper_address}.")
-        payload = SelectKeeperPayload(self.context.agent_address, keeper_address)
+        if len(keepers) == 1:
+            self.context.logger.info(f"Selected a new keeper: {keepers[0]}.")
+            payload = SelectKeeperPayload(self.context.agent_address, keepers[0])
+        else:
+            self.context.logger.info(f"Selected new keepers: {', '.join(keepers)}.")
+            payload = SelectKeeperPayload(
+                self.context.agent_address, keepers[0], keepers=json.dumps(keepers)
+            )
 
         yield from self.send_a2a_transaction(payload)
         yield from self.wait_until_round_end()
@@ -168,7 +569,7 @@ class SelectKeeperBehaviour(HelloWorldABCIBaseBehaviour, ABC):
         self.set_done()
 
 
-class PrintMessageBehaviour(HelloWorldABCIBaseBehaviour, ABC):
+class PrintMessageBehaviour(RandomnessRetrievalBehaviour, ABC):
     """Prints the celebrated 'HELLO WORLD!' message."""
 
     matching_round = PrintMessageRound
@@ -178,33 +579,110 @@ class PrintMessageBehaviour(HelloWorldABCIBaseBehaviour, ABC):
         Do the action.
 
         Steps:
-        - Determine if this agent is the current keeper agent.
-        - Print the appropriate to the local console.
-        - Send the transaction with the printed message and wait for it to be mined.
+        - Determine if this agent is one of the current keeper agents.
+        - Print the appropriate message to the configured output. If there are several keepers,
+          each of them prints its own slice of the message.
+        - If this agent is a keeper and the work queue is enabled, print a batch of the queued messages of its slice.
+        - If the randomness is pipelined, retrieve the randomness of the next period, from a later drand round
+          than the randomness of this period.
+        - Send the transaction with the printed message, the batch and the randomness of the next period if any,
+          and wait for it to be mined.
         - Wait until ABCI application transitions to the next round.
         - Go to the next behaviour (set done event).
         """
 
-        if (
-            self.context.agent_address
-            == self.synchronized_data.most_voted_keeper_address
-        ):
+        keepers = self.synchronized_data.keepers
+        if self.context.agent_address not in keepers:
+            message = NON_KEEPER_MESSAGE
+        elif len(keepers) == 1:
             message = self.params.hello_world_string
         else:
-            message = ":|"
-
-        printed_message = f"Agent {self.context.agent_name} (address {self.context.agent_address}) in period {self.synchronized_data.period_count} says: {message}"
-
-        print(printed_message)
-        self.context.logger.info(f"printed_message={printed_message}")
+            index = keepers.index(self.context.agent_address)
+            message = f"{self.params.hello_world_string} ({index + 1}/{len(keepers)})"
+
+        printed_message = PRINTED_MESSAGE_FORMAT.format(
+            agent_name=self.context.agent_name,
+            address=self.context.agent_address,
+            period=self.synchronized_data.period_count,
+            message=message,
+        )
 
-        payload = PrintMessagePayload(self.context.agent_address, printed_message)
+        # the message is written by a background thread, so a slow console does not stall the agent
+        self.context.printed_messages_output.sink.write(printed_message)
+        self.context.logger.info("printed_message=%s", printed_message)
+        batch = self._print_batch(keepers)
+
+        next_observation = None
+        if self.params.pipeline_randomness:
+            self._drand_round = self._next_drand_round()
+            next_observation = yield from self._retrieve_randomness()
+            if next_observation is None:
+                self.context.logger.warning(
+                    "Could not get the randomness of the next period, it will be collected in its own round."
+                )
+        payload = PrintMessagePayload(
+            self.context.agent_address,
+            printed_message,
+            next_round_id=(
+                None if next_observation is None else next_observation["round"]
+            ),
+            next_randomness=(
+                None if next_observation is None else next_observation["randomness"]
+            ),
+            batch=json.dumps(batch) if batch else None,
+        )
 
         yield from self.send_a2a_transaction(payload)
         yield from self.wait_until_round_end()
 
         self.set_done()
 
+    def _next_drand_round(self) -> int:
+        """
+        Get the drand round of the randomness of the next period.
+
+        It is the pinned round if the drand round is pinned, and the latest one otherwise, unless it is not later
+        than the round of the randomness of this period, which the next period must not reuse. It is then the round
+        which follows it.
+
+        :return: the round.
+        """
+        drand_round = self._pinned_drand_round()
+        if drand_round is None:
+            drand_round = cast(
+                RandomnessCache, self.context.randomness_cache
+            ).current_round()
+        current_round = self.synchronized_data.most_voted_randomness_round
+        if current_round is None:
+            return drand_round
+        return max(drand_round, current_round + 1)
+
+    def _print_batch(self, keepers: Tuple[str, ...]) -> List[QueuedMessage]:
+        """Print the batch of the queued messages of the slice of this agent, if it is a keeper."""
+        queue = cast(WorkQueue, self.context.work_queue).queue
+        if queue is None or self.context.agent_address not in keepers:
+            return []
+        batch = queue.batch(
+            PrintMessageRound.max_batch_size,
+            PrintMessageRound.max_batch_bytes,
+            keepers.index(self.context.agent_address),
+            len(keepers),
+        )
+        for _, message in batch:
+            self.context.printed_messages_output.sink.write(
+                PRINTED_MESSAGE_FORMAT.format(
+                    agent_name=self.context.agent_name,
+                    address=self.context.agent_address,
+                    period=self.synchronized_data.period_count,
+                    message=message,
+                )
+            )
+        if batch:
+            self.context.logger.info(
+                f"Printed a batch of {len(batch)} queued messages, {len(queue) - len(batch)} remain queued."
+            )
+        return batch
+
 
 class ResetAndPauseBehaviour(HelloWorldABCIBaseBehaviour):
     """Reset behaviour."""
@@ -218,15 +696,23 @@ class ResetAndPauseBehaviour(HelloWorldABCIBaseBehaviour):
 
         Steps:
         - Trivially log the behaviour.
-        - Sleep for configured interval.
+        - Remove the messages of the committed batches from the work queue, if it is enabled.
+        - Sleep for the pause of the period, which is the configured interval unless it is adaptive.
+        - Prefetch the randomness of the next period in the background, if enabled
+          and if it has not been agreed on already.
         - Build a registration transaction.
         - Send the transaction and wait for it to be mined.
         - Wait until ABCI application transitions to the next round.
         - Go to the next behaviour (set done event).
         """
         if self.pause:
-            self.context.logger.info("Period end.")
-            yield from self.sleep(self.params.reset_pause_duration)
+            pause = self.synchronized_data.reset_pause
+            if pause is None:
+                pause = self.params.reset_pause_duration
+            self.context.logger.info(f"Period end. Pausing for {pause}s.")
+            self._acknowledge_committed_batch()
+            yield from self.sleep(pause)
+            self._prefetch_randomness()
         else:
             self.context.logger.info(
                 f"Period {self.synchronized_data.period_count} was not finished. Resetting!"
@@ -240,9 +726,44 @@ class ResetAndPauseBehaviour(HelloWorldABCIBaseBehaviour):
         yield from self.wait_until_round_end()
         self.set_done()
 
+    def _acknowledge_committed_batch(self) -> None:
+        """Remove the messages printed by the keepers in the period from the work queue."""
+        queue = cast(WorkQueue, self.context.work_queue).queue
+        committed_batch = self.synchronized_data.committed_batch
+        if queue is None or not committed_batch:
+            return
+        try:
+            removed = queue.acknowledge(id_ for id_, _ in committed_batch)
+        except OSError as exc:
+            self.context.logger.warning(f"Could not update the work queue: {exc}")
+            return
+        self.context.logger.info(
+            f"Acknowledged {removed} committed messages, {len(queue)} remain queued."
+        )
+
+    def _prefetch_randomness(self) -> None:
+        """Request the randomness of the next period without waiting, storing the valid responses in the cache."""
+        cache = cast(RandomnessCache, self.context.randomness_cache)
+        if not cache.prefetch or self.synchronized_data.next_randomness is not None:
+            return
+
+        def _store_response(message: Message, _: BaseBehaviour) -> None:
+            """Store a prefetched beacon."""
+            observation = self.context.randomness_api.process_response(message)
+            if is_valid_observation(observation):
+                cache.store(observation)
+
+        self._send_randomness_requests(_store_response)
+
 
 class HelloWorldRoundBehaviour(AbstractRoundBehaviour):
-    """This behaviour manages the consensus stages for the Hello World abci app."""
+    """
+    This behaviour manages the consensus stages for the Hello World abci app.
+
+    It acts every `tick_interval` seconds. If the `wake_on_round_transition` parameter is set, it also acts
+    as soon as the app moves to a new round, so that the behaviour of the new round starts right away
+    instead of at the next tick. The behaviours waiting for a response or sleeping still resume at a tick.
+    """
 
     initial_behaviour_cls = RegistrationBehaviour
     abci_app_cls = HelloWorldAbciApp
@@ -253,3 +774,21 @@ class HelloWorldRoundBehaviour(AbstractRoundBehaviour):
         PrintMessageBehaviour,  # type: ignore
         ResetAndPauseBehaviour,  # type: ignore
     }
+
+    def __init__(self, **kwargs: Any) -> None:
+        """Initialize the behaviour."""
+        tick_interval = float(kwargs.pop("tick_interval", self._tick_interval))
+        if tick_interval <= 0:
+            raise ValueError(
+                f"The tick interval must be positive, got {tick_interval}."
+            )
+        super().__init__(**kwargs)
+        self._tick_interval = tick_interval
+
+    def setup(self) -> None:
+        """Set up the behaviours, and register to the round transitions if enabled."""
+        super().setup()
+        if cast(HelloWorldParams, self.context.params).wake_on_round_transition:
+            cast(SharedState, self.context.state).add_round_transition_callback(
+                self.act_wrapper
+            )
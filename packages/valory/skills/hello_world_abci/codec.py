@@ -0,0 +1,481 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""
+This module contains a compact binary codec for the payloads of the skill.
+
+An encoded batch of payloads is laid out as follows, where `uvarint` is an unsigned LEB128 integer:
+
+    version: u8 | n_addresses: uvarint | addresses | n_payloads: uvarint | payloads
+
+The addresses of the senders, keepers and printed messages are interned in the address table,
+and the payloads refer to them by their index. An ethereum address takes 20 raw bytes, plus
+5 bytes for the case of its letters if it is checksummed. Each payload is laid out as:
+
+    type: u8 | sender: uvarint | round_count: zigzag varint | id_: hex | fields
+
+with the fields of each payload type:
+
+- `RegistrationPayload`: none.
+- `CollectRandomnessPayload`: `round_id: u64 | randomness: hex`.
+- `PrintMessagePayload`: the message, split in its parts if it follows `PRINTED_MESSAGE_FORMAT`,
+  then `has_next: u8`, followed by `next_round_id: u64 | next_randomness: hex` if it is set,
+  then the kind of the batch, followed by `n_messages: uvarint` and `id: hex | message: string` for each
+  message if it is a json list of them, or by the raw string otherwise.
+- `SelectKeeperPayload`: `keeper: uvarint`, the index of the keeper in the address table,
+  then the kind of the keepers, followed by `n_keepers: uvarint` and their indexes in the address table
+  if they are a json list of addresses, or by the raw string otherwise.
+- `ResetPayload`: `period_count: uvarint`.
+
+The hex strings are stored as raw bytes whenever they are lowercase and of even length.
+
+The transactions sent to Tendermint are still encoded by the `Transaction` of `abstract_round_abci`,
+which only supports json; `scripts/benchmark_payload_codec.py` compares both encodings.
+"""
+
+import json
+import re
+import struct
+from typing import Callable, Dict, List, Sequence, Tuple, Type
+
+from packages.valory.skills.abstract_round_abci.base import BaseTxPayload
+from packages.valory.skills.hello_world_abci.payloads import (
+    CollectRandomnessPayload,
+    PRINTED_MESSAGE_FORMAT,
+    PrintMessagePayload,
+    RegistrationPayload,
+    ResetPayload,
+    SelectKeeperPayload,
+    parse_printed_message,
+)
+from packages.valory.skills.hello_world_abci.work_queue import parse_batch
+
+
+CODEC_VERSION = 4
+
+ADDRESS_BYTES = 20
+ADDRESS_REGEX = re.compile(r"0x[0-9a-fA-F]{40}")
+LOWERCASE_HEX_REGEX = re.compile(r"(?:[0-9a-f]{2})*")
+U64 = struct.Struct(">Q")
+
+# the kinds of the encoded strings
+_RAW, _LOWERCASE, _MIXED_CASE = 0, 1, 2
+# the kinds of the encoded json lists, which are either absent, encoded item by item, or kept raw
+_ABSENT, _JSON_LIST, _JSON_RAW = 0, 1, 2
+
+
+class _Writer:
+    """Append the encoded values to a buffer."""
+
+    def __init__(self) -> None:
+        """Initialize the writer."""
+        self.buffer = bytearray()
+
+    def uvarint(self, value: int) -> None:
+        """Write an unsigned integer, 7 bits per byte."""
+        if value < 0:
+            raise ValueError(f"Cannot encode negative integer {value} as unsigned.")
+        while value > 0x7F:
+            self.buffer.append((value & 0x7F) | 0x80)
+            value >>= 7
+        self.buffer.append(value)
+
+    def varint(self, value: int) -> None:
+        """Write a signed integer, using the zigzag encoding."""
+        self.uvarint(value * 2 if value >= 0 else -value * 2 - 1)
+
+    def raw(self, value: bytes) -> None:
+        """Write raw bytes, prefixed by their length."""
+        self.uvarint(len(value))
+        self.buffer += value
+
+    def string(self, value: str) -> None:
+        """Write a utf-8 string."""
+        self.raw(value.encode("utf-8"))
+
+    def hex(self, value: str) -> None:
+        """Write a hex string, as raw bytes if possible."""
+        if LOWERCASE_HEX_REGEX.fullmatch(value):
+            self.buffer.append(_LOWERCASE)
+            self.raw(bytes.fromhex(value))
+        else:
+            self.buffer.append(_RAW)
+            self.string(value)
+
+    def address(self, value: str) -> None:
+        """Write an address, as raw bytes if it is an ethereum address."""
+        if not ADDRESS_REGEX.fullmatch(value):
+            self.buffer.append(_RAW)
+            self.string(value)
+            return
+        digits = value[2:]
+        case_mask = sum(1 << i for i, char in enumerate(digits) if char.isupper())
+        self.buffer.append(_MIXED_CASE if case_mask else _LOWERCASE)
+        self.buffer += bytes.fromhex(digits)
+        if case_mask:
+            self.buffer += case_mask.to_bytes(5, "big")
+
+
+class _Reader:
+    """Read the encoded values from a buffer."""
+
+    def __init__(self, data: bytes) -> None:
+        """Initialize the reader."""
+        self._data = bytes(data)
+        self._offset = 0
+
+    @property
+    def is_exhausted(self) -> bool:
+        """Check whether all the data have been read."""
+        return self._offset == len(self._data)
+
+    def take(self, n: int) -> bytes:
+        """Read `n` raw bytes."""
+        end = self._offset + n
+        if end > len(self._data):
+            raise ValueError("Truncated payload encoding.")
+        value = self._data[self._offset : end]
+        self._offset = end
+        return value
+
+    def byte(self) -> int:
+        """Read a single byte."""
+        try:
+            value = self._data[self._offset]
+        except IndexError as e:
+            raise ValueError("Truncated payload encoding.") from e
+        self._offset += 1
+        return value
+
+    def uvarint(self) -> int:
+        """Read an unsigned integer."""
+        value = self.byte()
+        if value < 0x80:
+            return value
+        value &= 0x7F
+        shift = 7
+        while True:
+            byte = self.byte()
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value
+            shift += 7
+
+    def varint(self) -> int:
+        """Read a signed integer."""
+        value = self.uvarint()
+        return value >> 1 if value % 2 == 0 else -((value + 1) >> 1)
+
+    def raw(self) -> bytes:
+        """Read raw bytes, prefixed by their length."""
+        return self.take(self.uvarint())
+
+    def string(self) -> str:
+        """Read a utf-8 string."""
+        return self.raw().decode("utf-8")
+
+    def hex(self) -> str:
+        """Read a hex string."""
+        kind = self.byte()
+        if kind == _LOWERCASE:
+            return self.raw().hex()
+        if kind == _RAW:
+            return self.string()
+        raise ValueError(f"Unknown hex string kind {kind}.")
+
+    def address(self) -> str:
+        """Read an address."""
+        kind = self.byte()
+        if kind == _RAW:
+            return self.string()
+        if kind not in (_LOWERCASE, _MIXED_CASE):
+            raise ValueError(f"Unknown address kind {kind}.")
+        digits = self.take(ADDRESS_BYTES).hex()
+        if kind == _MIXED_CASE:
+            case_mask = int.from_bytes(self.take(5), "big")
+            digits = "".join(
+                char.upper() if case_mask >> i & 1 else char
+                for i, char in enumerate(digits)
+            )
+        return "0x" + digits
+
+
+class _AddressTable:  # pylint: disable=too-few-public-methods
+    """Intern the addresses of a batch, mapping each of them to its index."""
+
+    def __init__(self) -> None:
+        """Initialize the table."""
+        self.indexes: Dict[str, int] = {}
+
+    def index(self, address: str) -> int:
+        """Get the index of an address, adding it to the table if needed."""
+        return self.indexes.setdefault(address, len(self.indexes))
+
+
+_FieldsEncoder = Callable[[_Writer, _AddressTable, BaseTxPayload], None]
+_FieldsDecoder = Callable[[_Reader, List[str]], Dict]
+
+
+def _encode_print_message(
+    writer: _Writer, addresses: _AddressTable, payload: BaseTxPayload
+) -> None:
+    """Encode the fields of a `PrintMessagePayload`, splitting its message in its parts if possible."""
+    message = payload.message  # type: ignore
+    fields = parse_printed_message(message)
+    if fields is None:
+        writer.buffer.append(_RAW)
+        writer.string(message)
+    else:
+        writer.buffer.append(_LOWERCASE)
+        writer.string(fields["agent_name"])
+        writer.uvarint(addresses.index(fields["address"]))
+        writer.uvarint(int(fields["period"]))
+        writer.string(fields["message"])
+
+    next_round_id = payload.next_round_id  # type: ignore
+    next_randomness = payload.next_randomness  # type: ignore
+    if next_round_id is None or next_randomness is None:
+        writer.buffer.append(0)
+    else:
+        writer.buffer.append(1)
+        writer.buffer += U64.pack(next_round_id)
+        writer.hex(next_randomness)
+
+    batch = payload.batch  # type: ignore
+    messages = parse_batch(batch)
+    if batch is None:
+        writer.buffer.append(_ABSENT)
+    elif messages is None or json.dumps(messages) != batch:
+        writer.buffer.append(_JSON_RAW)
+        writer.string(batch)
+    else:
+        writer.buffer.append(_JSON_LIST)
+        writer.uvarint(len(messages))
+        for id_, message in messages:
+            writer.hex(id_)
+            writer.string(message)
+
+
+def _decode_print_message(reader: _Reader, addresses: List[str]) -> Dict:
+    """Decode the fields of a `PrintMessagePayload`."""
+    kind = reader.byte()
+    if kind == _RAW:
+        fields: Dict = dict(message=reader.string())
+    elif kind == _LOWERCASE:
+        agent_name = reader.string()
+        address = addresses[reader.uvarint()]
+        period = reader.uvarint()
+        message = reader.string()
+        fields = dict(
+            message=PRINTED_MESSAGE_FORMAT.format(
+                agent_name=agent_name, address=address, period=period, message=message
+            )
+        )
+    else:
+        raise ValueError(f"Unknown message kind {kind}.")
+
+    if reader.byte():
+        (fields["next_round_id"],) = U64.unpack(reader.take(U64.size))
+        fields["next_randomness"] = reader.hex()
+
+    kind = reader.byte()
+    if kind == _JSON_LIST:
+        messages = [(reader.hex(), reader.string()) for _ in range(reader.uvarint())]
+        fields["batch"] = json.dumps(messages)
+    elif kind == _JSON_RAW:
+        fields["batch"] = reader.string()
+    elif kind != _ABSENT:
+        raise ValueError(f"Unknown batch kind {kind}.")
+    return fields
+
+
+def _encode_collect_randomness(
+    writer: _Writer, _: _AddressTable, payload: BaseTxPayload
+) -> None:
+    """Encode the fields of a `CollectRandomnessPayload`."""
+    writer.buffer += U64.pack(payload.round_id)  # type: ignore
+    writer.hex(payload.randomness)  # type: ignore
+
+
+def _decode_collect_randomness(reader: _Reader, _: List[str]) -> Dict:
+    """Decode the fields of a `CollectRandomnessPayload`."""
+    (round_id,) = U64.unpack(reader.take(U64.size))
+    return dict(round_id=round_id, randomness=reader.hex())
+
+
+def _encode_select_keeper(
+    writer: _Writer, addresses: _AddressTable, payload: BaseTxPayload
+) -> None:
+    """Encode the fields of a `SelectKeeperPayload`, interning the keepers if they are a json list."""
+    writer.uvarint(addresses.index(payload.keeper))  # type: ignore
+    keepers = payload.keepers  # type: ignore
+    if keepers is None:
+        writer.buffer.append(_ABSENT)
+        return
+    try:
+        parsed = json.loads(keepers)
+    except ValueError:
+        parsed = None
+    if (
+        not isinstance(parsed, list)
+        or not all(isinstance(keeper, str) for keeper in parsed)
+        or json.dumps(parsed) != keepers
+    ):
+        writer.buffer.append(_JSON_RAW)
+        writer.string(keepers)
+        return
+    writer.buffer.append(_JSON_LIST)
+    writer.uvarint(len(parsed))
+    for keeper in parsed:
+        writer.uvarint(addresses.index(keeper))
+
+
+def _decode_select_keeper(reader: _Reader, addresses: List[str]) -> Dict:
+    """Decode the fields of a `SelectKeeperPayload`."""
+    fields: Dict = dict(keeper=addresses[reader.uvarint()])
+    kind = reader.byte()
+    if kind == _JSON_LIST:
+        keepers = [addresses[reader.uvarint()] for _ in range(reader.uvarint())]
+        fields["keepers"] = json.dumps(keepers)
+    elif kind == _JSON_RAW:
+        fields["keepers"] = reader.string()
+    elif kind != _ABSENT:
+        raise ValueError(f"Unknown keepers kind {kind}.")
+    return fields
+
+
+# the payload types, indexed by their tag; new types must only be appended
+_PAYLOAD_TYPES: Tuple[
+    Tuple[Type[BaseTxPayload], _FieldsEncoder, _FieldsDecoder], ...
+] = (
+    (
+        RegistrationPayload,
+        lambda writer, addresses, payload: None,
+        lambda reader, addresses: {},
+    ),
+    (
+        CollectRandomnessPayload,
+        _encode_collect_randomness,
+        _decode_collect_randomness,
+    ),
+    (
+        PrintMessagePayload,
+        _encode_print_message,
+        _decode_print_message,
+    ),
+    (
+        SelectKeeperPayload,
+        _encode_select_keeper,
+        _decode_select_keeper,
+    ),
+    (
+        ResetPayload,
+        lambda writer, addresses, payload: writer.uvarint(
+            payload.period_count  # type: ignore
+        ),
+        lambda reader, addresses: dict(period_count=reader.uvarint()),
+    ),
+)
+_PAYLOAD_TAGS = {
+    payload_type: tag for tag, (payload_type, _, _) in enumerate(_PAYLOAD_TYPES)
+}
+
+
+def encode_payloads(payloads: Sequence[BaseTxPayload]) -> bytes:
+    """
+    Encode a batch of payloads, interning their addresses.
+
+    :param payloads: the payloads to encode.
+    :return: the encoded batch.
+    :raises ValueError: if a payload is not a payload of the skill.
+    """
+    addresses = _AddressTable()
+    body = _Writer()
+    body.uvarint(len(payloads))
+    for payload in payloads:
+        tag = _PAYLOAD_TAGS.get(type(payload))
+        if tag is None:
+            raise ValueError(f"Cannot encode payload of type {type(payload)}.")
+        body.buffer.append(tag)
+        body.uvarint(addresses.index(payload.sender))
+        body.varint(payload.round_count)
+        body.hex(payload.id_)
+        _, encode_fields, _ = _PAYLOAD_TYPES[tag]
+        encode_fields(body, addresses, payload)
+
+    header = _Writer()
+    header.buffer.append(CODEC_VERSION)
+    header.uvarint(len(addresses.indexes))
+    for address in addresses.indexes:
+        header.address(address)
+    return bytes(header.buffer + body.buffer)
+
+
+def decode_payloads(data: bytes) -> List[BaseTxPayload]:
+    """
+    Decode a batch of payloads.
+
+    :param data: the encoded batch.
+    :return: the decoded payloads.
+    :raises ValueError: if the data are not a valid encoding of a batch of the supported version.
+    """
+    reader = _Reader(data)
+    version = reader.byte()
+    if version != CODEC_VERSION:
+        raise ValueError(f"Unsupported payload codec version {version}.")
+    addresses = [reader.address() for _ in range(reader.uvarint())]
+
+    payloads = []
+    try:
+        for _ in range(reader.uvarint()):
+            tag = reader.byte()
+            if tag >= len(_PAYLOAD_TYPES):
+                raise ValueError(f"Unknown payload type {tag}.")
+            payload_type, _, decode_fields = _PAYLOAD_TYPES[tag]
+            sender = addresses[reader.uvarint()]
+            round_count = reader.varint()
+            id_ = reader.hex()
+            payload = payload_type(sender, **decode_fields(reader, addresses))  # type: ignore
+            object.__setattr__(payload, "round_count", round_count)
+            object.__setattr__(payload, "id_", id_)
+            payloads.append(payload)
+    except IndexError as e:
+        raise ValueError("Unknown address index in payload encoding.") from e
+    if not reader.is_exhausted:
+        raise ValueError("Trailing bytes after the payload encoding.")
+    return payloads
+
+
+def encode_payload(payload: BaseTxPayload) -> bytes:
+    """Encode a single payload."""
+    return encode_payloads([payload])
+
+
+def decode_payload(data: bytes) -> BaseTxPayload:
+    """
+    Decode a single payload.
+
+    :param data: the encoded payload.
+    :return: the decoded payload.
+    :raises ValueError: if the data are not the encoding of a single payload.
+    """
+    payloads = decode_payloads(data)
+    if len(payloads) != 1:
+        raise ValueError(f"Expected a single payload, got {len(payloads)}.")
+    return payloads[0]
@@ -19,6 +19,14 @@
 
 """This module contains the classes required for dialogue management."""
 
+from typing import Any
+
+from aea.common import Address
+from aea.protocols.base import Message
+from aea.protocols.dialogue.base import Dialogue as BaseDialogue
+from aea.skills.base import Model
+
+from packages.valory.protocols.http.dialogues import HttpDialogues as HttpDialoguesBase
 from packages.valory.skills.abstract_round_abci.dialogues import (
     AbciDialogue as BaseAbciDialogue,
 )
@@ -34,9 +42,6 @@ from packages.valory.skills.abstract_round_abci.dialogues import (
 from packages.valory.skills.abstract_round_abci.dialogues import (
     HttpDialogue as BaseHttpDialogue,
 )
-from packages.valory.skills.abstract_round_abci.dialogues import (
-    HttpDialogues as BaseHttpDialogues,
-)
 from packages.valory.skills.abstract_round_abci.dialogues import (
     IpfsDialogue as BaseIpfsDialogue,
 )
@@ -68,7 +73,42 @@ AbciDialogues = BaseAbciDialogues
 
 
 HttpDialogue = BaseHttpDialogue
-HttpDialogues = BaseHttpDialogues
+
+
+class HttpDialogues(Model, HttpDialoguesBase):
+    """
+    This class keeps track of all http dialogues.
+
+    The skill is the client of the dialogues it initiates, e.g. the randomness requests,
+    and the server of the dialogues initiated by the http server connection.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        """
+        Initialize dialogues.
+
+        :param kwargs: keyword arguments
+        """
+        Model.__init__(self, **kwargs)
+
+        def role_from_first_message(
+            message: Message, receiver_address: Address
+        ) -> BaseDialogue.Role:
+            """Infer the role of the agent from an incoming/outgoing first message
+
+            :param message: an incoming/outgoing first message
+            :param receiver_address: the address of the receiving agent
+            :return: The role of the agent
+            """
+            if message.sender == receiver_address:
+                return BaseHttpDialogue.Role.CLIENT
+            return BaseHttpDialogue.Role.SERVER
+
+        HttpDialoguesBase.__init__(
+            self,
+            self_address=str(self.skill_id),
+            role_from_first_message=role_from_first_message,
+        )
 
 
 SigningDialogue = BaseSigningDialogue
@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the verification of the drand beacons."""
+
+import hashlib
+import secrets
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, List, Optional, Sequence, Tuple
+
+from eth_typing import BLSPubkey, BLSSignature
+from py_ecc.bls import G2Basic
+from py_ecc.bls.g2_primitives import pubkey_to_G1, signature_to_G2, subgroup_check
+from py_ecc.bls.hash_to_curve import hash_to_G2
+from py_ecc.fields import optimized_bls12_381_FQ12 as FQ12
+from py_ecc.optimized_bls12_381 import (
+    G1,
+    Z2,
+    add,
+    final_exponentiate,
+    multiply,
+    neg,
+    pairing,
+)
+
+from packages.valory.skills.hello_world_abci.randomness import (
+    Observation,
+    is_valid_observation,
+)
+
+
+# the size in bits of the random scalars used to combine the beacons of a batch
+BATCH_SCALAR_BITS = 64
+# the number of verified beacons which are remembered, so that they are not verified twice
+VERIFIED_CACHE_SIZE = 16
+
+SignedBeacon = Tuple[int, bytes, bytes]
+
+
+def beacon_message(round_: int, previous_signature: Optional[str] = None) -> bytes:
+    """
+    Get the message signed by a drand chain in the given round.
+
+    :param round_: the round of the beacon.
+    :param previous_signature: the signature of the previous round, for chained schemes.
+    :return: the sha256 digest of the previous signature, if any, followed by the round in big-endian.
+    """
+    previous = b"" if previous_signature is None else bytes.fromhex(previous_signature)
+    return hashlib.sha256(previous + round_.to_bytes(8, "big")).digest()
+
+
+class DrandVerifier:
+    """
+    Verify the BLS signatures of the beacons of a drand chain.
+
+    The public key of the chain is deserialized and validated once, when the verifier is built,
+    and the decoded key point is reused by every verification. The beacons which have been verified
+    are remembered, so serving a beacon again, e.g. from a cache, costs no pairing.
+
+    Several beacons can be verified at once with `verify_batch`, which combines them with random
+    scalars and checks the combination with two pairings, instead of two pairings per beacon.
+    The pairings take about a second, so `verify_batch_async` runs the verification in a background
+    thread, for the behaviours to poll its result instead of blocking the agent.
+    """
+
+    def __init__(self, public_key: str) -> None:
+        """
+        Initialize the verifier.
+
+        :param public_key: the hex-encoded, compressed G1 public key of the drand chain.
+        :raises ValueError: if the public key is not a valid BLS public key.
+        """
+        try:
+            public_key_bytes = bytes.fromhex(public_key)
+        except ValueError as e:
+            raise ValueError(f"Invalid drand public key {public_key!r}: {e}") from e
+        if not G2Basic.KeyValidate(BLSPubkey(public_key_bytes)):
+            raise ValueError(f"Invalid drand public key {public_key!r}.")
+        self._public_key = pubkey_to_G1(BLSPubkey(public_key_bytes))
+        self._neg_generator = neg(G1)
+        self._verified: "OrderedDict[Tuple[int, str], None]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @staticmethod
+    def _decode(observation: Any) -> Optional[SignedBeacon]:
+        """Decode a beacon into its round, signed message and signature, or `None` if it is malformed."""
+        if not is_valid_observation(observation) or not isinstance(
+            observation.get("signature"), str
+        ):
+            return None
+        try:
+            signature = bytes.fromhex(observation["signature"])
+            message = beacon_message(
+                observation["round"], observation.get("previous_signature")
+            )
+        except (TypeError, ValueError):
+            return None
+        # the randomness of a beacon is the hash of its signature
+        if hashlib.sha256(signature).hexdigest() != observation["randomness"]:
+            return None
+        return observation["round"], message, signature
+
+    def _check(self, beacons: Sequence[SignedBeacon]) -> bool:
+        """Check that a random linear combination of the signatures verifies against the combined messages."""
+        if len(beacons) == 1:
+            scalars = [1]
+        else:
+            scalars = [secrets.randbits(BATCH_SCALAR_BITS) | 1 for _ in beacons]
+        signature_sum, message_sum = Z2, Z2
+        try:
+            for scalar, (_, message, signature) in zip(scalars, beacons):
+                signature_point = signature_to_G2(BLSSignature(signature))
+                if not subgroup_check(signature_point):
+                    return False
+                message_point = hash_to_G2(
+                    message, G2Basic.DST, G2Basic.xmd_hash_function  # type: ignore
+                )
+                signature_sum = add(signature_sum, multiply(signature_point, scalar))
+                message_sum = add(message_sum, multiply(message_point, scalar))
+        except (ValueError, AssertionError):
+            return False
+        product = pairing(
+            signature_sum, self._neg_generator, final_exponentiate=False
+        ) * pairing(message_sum, self._public_key, final_exponentiate=False)
+        return final_exponentiate(product) == FQ12.one()
+
+    def _remember(self, observation: Observation) -> None:
+        """Remember a verified beacon, forgetting the oldest one if needed."""
+        with self._lock:
+            self._verified[(observation["round"], observation["signature"])] = None
+            while len(self._verified) > VERIFIED_CACHE_SIZE:
+                self._verified.popitem(last=False)
+
+    def _is_known(self, observation: Any) -> bool:
+        """Check whether a beacon has already been verified."""
+        if not is_valid_observation(observation):
+            return False
+        with self._lock:
+            return (
+                observation["round"],
+                observation.get("signature"),
+            ) in self._verified
+
+    def verify(self, observation: Any) -> bool:
+        """Verify a single beacon."""
+        return self.verify_batch([observation])[0]
+
+    def verify_batch_async(self, observations: Sequence[Any]) -> "Future[List[bool]]":
+        """
+        Verify several beacons at once in a background thread, see `verify_batch`.
+
+        The beacons which have all been verified before are resolved at once, without a thread.
+
+        :param observations: the beacons to verify.
+        :return: the future of whether each of the beacons is valid.
+        """
+        observations = list(observations)
+        if all(map(self._is_known, observations)):
+            future: "Future[List[bool]]" = Future()
+            future.set_result([True] * len(observations))
+            return future
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="drand-verifier"
+            )
+        return self._executor.submit(self.verify_batch, observations)
+
+    def close(self) -> None:
+        """Stop the background thread, without waiting for the pending verifications."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def verify_batch(self, observations: Sequence[Any]) -> List[bool]:
+        """
+        Verify several beacons at once.
+
+        The distinct beacons which have not been verified before are checked together.
+        If the combined check fails, the batch is split in halves to find the invalid beacons.
+
+        :param observations: the beacons to verify.
+        :return: whether each of the beacons is valid.
+        """
+        results = [False] * len(observations)
+        pending: "OrderedDict[Tuple[int, str], Tuple[SignedBeacon, List[int]]]" = (
+            OrderedDict()
+        )
+        for i, observation in enumerate(observations):
+            beacon = self._decode(observation)
+            if beacon is None:
+                continue
+            if self._is_known(observation):
+                results[i] = True
+                continue
+            key = (observation["round"], observation["signature"])
+            pending.setdefault(key, (beacon, []))[1].append(i)
+
+        groups = list(pending.values())
+        for valid_group in self._bisect(groups):
+            _, indexes = valid_group
+            for i in indexes:
+                results[i] = True
+                self._remember(observations[i])
+        return results
+
+    def _bisect(
+        self, groups: List[Tuple[SignedBeacon, List[int]]]
+    ) -> List[Tuple[SignedBeacon, List[int]]]:
+        """Get the valid groups of beacons, splitting the batch whenever the combined check fails."""
+        if not groups:
+            return []
+        if self._check([beacon for beacon, _ in groups]):
+            return groups
+        if len(groups) == 1:
+            return []
+        middle = len(groups) // 2
+        return self._bisect(groups[:middle]) + self._bisect(groups[middle:])
@@ -19,6 +19,15 @@
 
 """This module contains the handler for the Hello World skill."""
 
+import json
+from typing import Optional, Tuple, cast
+from urllib.parse import urlparse
+
+from aea.protocols.base import Message
+
+from packages.valory.protocols.abci import AbciMessage
+from packages.valory.protocols.http.message import HttpMessage
+from packages.valory.skills.abstract_round_abci.dialogues import AbciDialogue
 from packages.valory.skills.abstract_round_abci.handlers import (
     ABCIRoundHandler as BaseABCIRoundHandler,
 )
@@ -40,10 +49,241 @@ from packages.valory.skills.abstract_round_abci.handlers import (
 from packages.valory.skills.abstract_round_abci.handlers import (
     TendermintHandler as BaseTendermintHandler,
 )
+from packages.valory.skills.hello_world_abci.dialogues import (
+    HttpDialogue,
+    HttpDialogues,
+)
+from packages.valory.skills.hello_world_abci.models import (
+    BenchmarkTool,
+    PeriodSnapshots,
+    PooledHttp,
+    SharedState,
+    WorkQueue,
+)
+from packages.valory.skills.hello_world_abci.rounds import CollectRandomnessRound
+from packages.valory.skills.hello_world_abci.snapshot import PeriodSnapshot
+from packages.valory.skills.hello_world_abci.work_queue import MessageQueue
+
+
+LATENCY_PATH = "/latency"
+CONNECTIONS_PATH = "/connections"
+MESSAGES_PATH = "/messages"
+
+
+class ABCIHandler(BaseABCIRoundHandler):
+    """
+    The ABCI handler.
+
+    If the period snapshots are enabled, a snapshot is saved at the first block of each period,
+    and the latest one is restored when Tendermint asks for the state of an agent which has no block yet,
+    e.g. after a restart. Tendermint then only replays the blocks committed after the snapshot.
+    A snapshot of another chain than the one of the `genesis_config` is not restored,
+    and the agent starts from a fresh database instead.
+
+    Once a request has moved the app to a new round, and its response has been sent, the shared state
+    notifies the round transition, so that the behaviours start the next round right away.
+    """
+
+    def handle(self, message: Message) -> None:
+        """Handle an ABCI request, notifying the round transition if the app has moved to a new round."""
+        state = cast(SharedState, self.context.state)
+        round_height = state.round_sequence.current_round_height
+        super().handle(message)
+        if state.round_sequence.current_round_height != round_height:
+            state.notify_round_transition()
+
+    def info(self, message: AbciMessage, dialogue: AbciDialogue) -> AbciMessage:
+        """Handle the 'info' request, restoring the latest snapshot first if the agent has no block yet."""
+        self._restore_snapshot()
+        return super().info(message, dialogue)
+
+    def commit(self, message: AbciMessage, dialogue: AbciDialogue) -> AbciMessage:
+        """Handle the 'commit' request, saving a snapshot if a period has started with the committed block."""
+        response = super().commit(message, dialogue)
+        self._save_snapshot()
+        return response
+
+    def _restore_snapshot(self) -> None:
+        """Restore the latest snapshot, if the agent has no block yet."""
+        snapshots = cast(PeriodSnapshots, self.context.period_snapshots)
+        round_sequence = self.context.state.round_sequence
+        if snapshots.store is None or round_sequence.height != 0:
+            return
+        snapshot = snapshots.store.latest()
+        if snapshot is None:
+            return
+        genesis_config = self.context.params.genesis_config
+        try:
+            snapshot.restore(
+                round_sequence, genesis_config.chain_id, genesis_config.genesis_time
+            )
+        except ValueError as exc:
+            self.context.logger.warning(
+                f"Could not restore the snapshot, starting from a fresh database: {exc}"
+            )
+            return
+        snapshots.last_period = snapshot.period_count
+        self.context.logger.info(
+            f"Restored the snapshot of period {snapshot.period_count} at height {snapshot.height}."
+        )
+
+    def _save_snapshot(self) -> None:
+        """Save a snapshot, if a period has started with the latest committed block."""
+        snapshots = cast(PeriodSnapshots, self.context.period_snapshots)
+        if snapshots.store is None:
+            return
+        round_sequence = self.context.state.round_sequence
+        period_count = round_sequence.latest_synchronized_data.period_count
+        if (
+            round_sequence.current_round_id != CollectRandomnessRound.auto_round_id()
+            or period_count in (0, snapshots.last_period)
+            # the snapshot is only taken at the block where the round started
+            or round_sequence.last_round_transition_height != round_sequence.height
+        ):
+            return
+        genesis_config = self.context.params.genesis_config
+        snapshot = PeriodSnapshot.take(
+            round_sequence, genesis_config.chain_id, genesis_config.genesis_time
+        )
+        try:
+            snapshots.store.save(snapshot)
+        except OSError as exc:
+            self.context.logger.warning(f"Could not save the snapshot: {exc}")
+            return
+        snapshots.last_period = period_count
+
+
+class HttpHandler(BaseHttpHandler):
+    """
+    The HTTP handler.
+
+    On top of the responses to the requests of the skill, it serves the requests received from
+    the http server connection. `GET /latency` returns the latency histograms of the behaviours,
+    and `GET /connections` the connection metrics of the pooled http client, if it is enabled.
+
+    If the work queue is enabled, `POST /messages` queues the messages of a `{"messages": [...]}` body,
+    to be printed by the keepers, and `GET /messages` returns the state of the queue. When the queue
+    does not have room for all the messages, none of them is queued, and the response is a
+    `429 Too Many Requests` whose `Retry-After` header is the pause between the periods.
+    """
+
+    def handle(self, message: Message) -> None:
+        """
+        Handle an http message.
+
+        The responses are dispatched to the pending requests of the skill, as the base handler does.
+
+        :param message: the message to handle.
+        """
+        http_msg = cast(HttpMessage, message)
+        if http_msg.performative != HttpMessage.Performative.REQUEST:
+            super().handle(message)
+            return
+
+        http_dialogues = cast(HttpDialogues, self.context.http_dialogues)
+        http_dialogue = cast(Optional[HttpDialogue], http_dialogues.update(http_msg))
+        if http_dialogue is None:
+            self._handle_unidentified_dialogue(http_msg)
+            return
+
+        status_code, status_text, body = self._serve(http_msg)
+        headers = "Content-Type: application/json\n"
+        if status_code == 429:
+            headers += f"Retry-After: {self.context.params.reset_pause_duration}\n"
+        response = http_dialogue.reply(
+            performative=HttpMessage.Performative.RESPONSE,
+            target_message=http_msg,
+            version=http_msg.version,
+            status_code=status_code,
+            status_text=status_text,
+            headers=headers,
+            body=json.dumps(body).encode("utf-8"),
+        )
+        self.context.outbox.put_message(message=response)
+
+    def _serve(self, http_msg: HttpMessage) -> Tuple[int, str, object]:
+        """Get the status code, status text and json body of the response to a request."""
+        path = urlparse(http_msg.url).path
+        if path == MESSAGES_PATH:
+            return self._serve_messages(http_msg)
+        if path not in (LATENCY_PATH, CONNECTIONS_PATH):
+            return 404, "Not Found", {"error": f"Unknown path {path!r}."}
+        if http_msg.method.lower() != "get":
+            return 405, "Method Not Allowed", {"error": "Only GET is allowed."}
+        if path == CONNECTIONS_PATH:
+            client = cast(PooledHttp, self.context.pooled_http).client
+            if client is None:
+                return (
+                    404,
+                    "Not Found",
+                    {"error": "The pooled http client is disabled."},
+                )
+            return 200, "OK", client.metrics.to_json()
+        benchmark_tool = cast(BenchmarkTool, self.context.benchmark_tool)
+        return 200, "OK", benchmark_tool.latency_data
+
+    def _serve_messages(self, http_msg: HttpMessage) -> Tuple[int, str, object]:
+        """Queue the submitted messages, or get the state of the work queue."""
+        queue = cast(WorkQueue, self.context.work_queue).queue
+        if queue is None:
+            return 404, "Not Found", {"error": "The work queue is disabled."}
+        method = http_msg.method.lower()
+        if method == "get":
+            return self._get_messages(queue)
+        if method == "post":
+            return self._post_messages(queue, http_msg.body)
+        return (
+            405,
+            "Method Not Allowed",
+            {"error": "Only GET and POST are allowed."},
+        )
+
+    @staticmethod
+    def _get_messages(queue: MessageQueue) -> Tuple[int, str, object]:
+        """Get the state of the work queue."""
+        return 200, "OK", queue.to_json()
+
+    def _post_messages(
+        self, queue: MessageQueue, body: bytes
+    ) -> Tuple[int, str, object]:
+        """Queue the submitted messages."""
+        try:
+            messages = json.loads(body)["messages"]
+        except (ValueError, KeyError, TypeError):
+            messages = None
+        if not isinstance(messages, list) or not all(
+            isinstance(message, str) for message in messages
+        ):
+            return (
+                400,
+                "Bad Request",
+                {
+                    "error": 'The body must be a json object {"messages": [...]} of strings.'
+                },
+            )
+        try:
+            ids = queue.submit(messages)
+        except ValueError as exc:
+            return 413, "Payload Too Large", {"error": str(exc)}
+        except OSError as exc:
+            self.context.logger.warning(f"Could not update the work queue: {exc}")
+            return (
+                503,
+                "Service Unavailable",
+                {"error": "The work queue is unavailable."},
+            )
+        if ids is None:
+            self.context.logger.warning(
+                f"The work queue is full, rejected {len(messages)} messages."
+            )
+            return (
+                429,
+                "Too Many Requests",
+                {"error": "The work queue is full.", **queue.to_json()},
+            )
+        return 202, "Accepted", {"ids": ids, **queue.to_json()}
 
 
-ABCIHandler = BaseABCIRoundHandler
-HttpHandler = BaseHttpHandler
 SigningHandler = BaseSigningHandler
 LedgerApiHandler = BaseLedgerApiHandler
 ContractApiHandler = BaseContractApiHandler
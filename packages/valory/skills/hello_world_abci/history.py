@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the storage and the bounded history of the printed messages."""
+
+import json
+import sys
+from collections import deque
+from itertools import islice
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
+
+from packages.valory.skills.hello_world_abci.payloads import (
+    PRINTED_MESSAGE_FORMAT,
+    parse_printed_message,
+)
+
+
+DEFAULT_HISTORY_SIZE = 10
+
+PeriodMessages = Tuple[int, List[str]]
+# a period of the history, with its messages encoded as the json string of their `PrintedMessages` records
+HistoryEntry = Tuple[int, str]
+# a message which follows `PRINTED_MESSAGE_FORMAT` is stored as `[address index, agent name, period, text index]`
+MessageRecord = Union[str, List[Any]]
+
+
+class PrintedMessages:
+    """
+    The messages printed in a period, stored as structured records.
+
+    The messages of the agents differ only by the agent, and by whether it is the keeper, so their texts
+    are mostly the same, e.g. `":|"`. A message which follows `PRINTED_MESSAGE_FORMAT` is stored as a record
+    referring to the table of the addresses and to the table of the distinct texts, any other message
+    as it is. The messages are only rendered when they are accessed, see `render`.
+    """
+
+    def __init__(
+        self,
+        addresses: Optional[List[str]] = None,
+        texts: Optional[Iterable[str]] = None,
+        records: Optional[List[MessageRecord]] = None,
+    ) -> None:
+        """Initialize the printed messages, interning their texts."""
+        self.addresses: List[str] = [] if addresses is None else addresses
+        self.texts: List[str] = [] if texts is None else list(map(sys.intern, texts))
+        self.records: List[MessageRecord] = [] if records is None else records
+        self._address_ids = {address: i for i, address in enumerate(self.addresses)}
+        self._text_ids = {text: i for i, text in enumerate(self.texts)}
+
+    def __len__(self) -> int:
+        """Get the number of printed messages."""
+        return len(self.records)
+
+    @classmethod
+    def from_messages(cls, messages: Iterable[str]) -> "PrintedMessages":
+        """
+        Store the given messages, keeping their order.
+
+        :param messages: the printed messages.
+        :return: the stored messages.
+        """
+        printed_messages = cls()
+        for message in messages:
+            printed_messages.insert(len(printed_messages), message)
+        return printed_messages
+
+    def insert(self, index: int, message: str) -> None:
+        """
+        Store a message before the given position, parsing it only once.
+
+        :param index: the position of the message in the records.
+        :param message: the printed message.
+        """
+        fields = parse_printed_message(message)
+        if fields is None:
+            self.records.insert(index, message)
+            return
+        address_id = self._table_id(
+            self.addresses, self._address_ids, fields["address"]
+        )
+        text_id = self._table_id(
+            self.texts, self._text_ids, sys.intern(fields["message"])
+        )
+        self.records.insert(
+            index, [address_id, fields["agent_name"], int(fields["period"]), text_id]
+        )
+
+    @staticmethod
+    def _table_id(table: List[str], ids: Dict[str, int], value: str) -> int:
+        """Get the index of a value in a table, appending it if it is not in the table yet."""
+        table_id = ids.get(value, None)
+        if table_id is None:
+            table_id = ids[value] = len(table)
+            table.append(value)
+        return table_id
+
+    def render(self) -> List[str]:
+        """Render the printed messages."""
+        messages = []
+        for record in self.records:
+            if isinstance(record, str):
+                messages.append(record)
+                continue
+            address_id, agent_name, period, text_id = record
+            messages.append(
+                PRINTED_MESSAGE_FORMAT.format(
+                    agent_name=agent_name,
+                    address=self.addresses[address_id],
+                    period=period,
+                    message=self.texts[text_id],
+                )
+            )
+        return messages
+
+    def to_json(self) -> Dict[str, Any]:
+        """Get a json serializable representation of the printed messages."""
+        return {
+            "addresses": self.addresses,
+            "texts": self.texts,
+            "records": self.records,
+        }
+
+    @classmethod
+    def from_json(
+        cls, data: Union[Dict[str, Any], Sequence[str], None]
+    ) -> "PrintedMessages":
+        """
+        Load the printed messages from their json representation.
+
+        :param data: the json representation of the messages. A list of rendered messages, as stored
+            by the previous versions of the skill, is loaded as is.
+        :return: the printed messages.
+        """
+        if data is None:
+            return cls()
+        if not isinstance(data, dict):
+            return cls(records=list(data))
+        return cls(list(data["addresses"]), data["texts"], list(data["records"]))
+
+
+class PrintedMessagesHistory:
+    """
+    A fixed-capacity history of the messages printed in each period.
+
+    The history is stored in the synchronized data, and kept across periods, as a tuple of
+    `(period, encoded messages)` entries, oldest first, see `to_json` and `from_json`. Each period is
+    encoded once, when it is appended, and only the periods returned by `latest` are decoded.
+    Appending a period evicts the oldest one once the history is full, so the prior entries are
+    never re-encoded, re-sorted nor copied, only referred to by the new tuple.
+    """
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_HISTORY_SIZE,
+        entries: Iterable[HistoryEntry] = (),
+    ) -> None:
+        """Initialize the history, keeping the latest `capacity` of the given entries."""
+        if capacity < 1:
+            raise ValueError(f"History capacity must be positive, got {capacity}.")
+        self._entries: Deque[HistoryEntry] = deque(entries, maxlen=capacity)
+
+    @property
+    def capacity(self) -> int:
+        """Get the maximum number of periods kept in the history."""
+        return cast(int, self._entries.maxlen)
+
+    def __len__(self) -> int:
+        """Get the number of periods currently kept in the history."""
+        return len(self._entries)
+
+    def append(
+        self, period: int, messages: Union[PrintedMessages, Sequence[str]]
+    ) -> None:
+        """Store the messages printed in the given period, evicting the oldest period if full."""
+        if not isinstance(messages, PrintedMessages):
+            messages = PrintedMessages.from_messages(messages)
+        encoded = json.dumps(messages.to_json(), separators=(",", ":"))
+        self._entries.append((period, encoded))
+
+    def latest(self, n: Optional[int] = None) -> List[PeriodMessages]:
+        """
+        Get the latest `n` periods of the history, oldest first.
+
+        :param n: the number of periods to return. All the kept periods are returned if not given.
+        :return: a list of `(period, messages)` tuples.
+        """
+        n = len(self._entries) if n is None else max(min(n, len(self._entries)), 0)
+        return [
+            (period, PrintedMessages.from_json(json.loads(encoded)).render())
+            for period, encoded in islice(self._entries, len(self._entries) - n, None)
+        ]
+
+    def to_json(self) -> Tuple[HistoryEntry, ...]:
+        """Get a json serializable representation of the history."""
+        return tuple(self._entries)
+
+    @classmethod
+    def from_json(
+        cls, data: Optional[Sequence[Sequence[Any]]], capacity: Optional[int] = None
+    ) -> "PrintedMessagesHistory":
+        """
+        Load a history from its json representation.
+
+        :param data: the json representation of the history, or `None` for an empty history.
+        :param capacity: the capacity of the loaded history. If it is smaller than the number of
+            stored periods, only the latest periods are kept. Defaults to the number of stored periods.
+        :return: the history.
+        """
+        entries = [(int(period), str(encoded)) for period, encoded in data or ()]
+        if capacity is None:
+            capacity = max(len(entries), 1)
+        return cls(capacity, entries)
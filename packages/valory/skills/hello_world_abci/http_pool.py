@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the pooled, keep-alive http client of the randomness requests."""
+
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from traceback import format_exc
+from typing import Any, Callable, Dict, Type
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from packages.valory.protocols.http.message import HttpMessage
+from packages.valory.skills.hello_world_abci.instrumentation import LatencyHistogram
+
+
+# the status code of the responses to the requests which failed, as used by the http client connection
+EXCEPTION_STATUS_CODE = 600
+
+ResponseCallback = Callable[[HttpMessage], None]
+
+
+class ConnectionMetrics:
+    """
+    The metrics of the connections of a `PooledHttpClient`.
+
+    The setup time of a connection covers the TCP connection and, for https, the TLS handshake.
+    The metrics are updated by the worker threads of the client, under a lock.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self.requests = 0
+        self.errors = 0
+        self.connections = 0
+        self.connection_setup = LatencyHistogram()
+        self.request_latency = LatencyHistogram()
+        self._lock = threading.Lock()
+
+    def record_connection(self, seconds: float) -> None:
+        """Record the setup of a new connection."""
+        with self._lock:
+            self.connections += 1
+            self.connection_setup.observe(seconds)
+
+    def record_request(self, seconds: float, is_error: bool) -> None:
+        """Record a request, from the moment it is sent until its response is read."""
+        with self._lock:
+            self.requests += 1
+            self.errors += int(is_error)
+            self.request_latency.observe(seconds)
+
+    @property
+    def reused(self) -> int:
+        """Get the number of successful requests which were sent over an already open connection."""
+        return max(self.requests - self.errors - self.connections, 0)
+
+    def to_json(self) -> Dict[str, Any]:
+        """Get a json serializable representation of the metrics."""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "errors": self.errors,
+                "connections": self.connections,
+                "reused": self.reused,
+                "connection_setup": self.connection_setup.to_json(),
+                "request_latency": self.request_latency.to_json(),
+            }
+
+
+def _timed_pool_classes(
+    metrics: ConnectionMetrics,
+) -> Dict[str, Type[HTTPConnectionPool]]:
+    """Get the connection pool classes whose connections record their setup time in the given metrics."""
+
+    def _timed(connection_cls: Type[HTTPConnection]) -> Type[HTTPConnection]:
+        """Get a connection class which times its setup."""
+
+        def connect(self: HTTPConnection) -> None:
+            """Connect, timing it."""
+            start = time.perf_counter()
+            connection_cls.connect(self)
+            metrics.record_connection(time.perf_counter() - start)
+
+        return type(
+            f"Timed{connection_cls.__name__}", (connection_cls,), {"connect": connect}
+        )
+
+    return {
+        "http": type(
+            "TimedHTTPConnectionPool",
+            (HTTPConnectionPool,),
+            {"ConnectionCls": _timed(HTTPConnection)},
+        ),
+        "https": type(
+            "TimedHTTPSConnectionPool",
+            (HTTPSConnectionPool,),
+            {"ConnectionCls": _timed(HTTPSConnection)},
+        ),
+    }
+
+
+class _TimedHTTPAdapter(HTTPAdapter):
+    """An http adapter whose connections record their setup time."""
+
+    def __init__(self, metrics: ConnectionMetrics, **kwargs: Any) -> None:
+        """Initialize the adapter."""
+        self.metrics = metrics
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the pool manager, with the timed connection pools."""
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = _timed_pool_classes(self.metrics)
+
+
+class PooledHttpClient:
+    """
+    An http client which keeps its connections alive across requests.
+
+    The http client connection opens a new session, and so a new TCP connection and TLS handshake,
+    for every request. This client keeps up to `max_connections_per_host` open connections to each of
+    the latest `max_hosts` hosts, and reuses them for the next requests to the same host.
+
+    The requests are sent by worker threads, so that they never block the agent. The responses are
+    queued, and only passed to their callbacks by `dispatch`, from the thread of the agent.
+    """
+
+    def __init__(
+        self,
+        max_hosts: int = 10,
+        max_connections_per_host: int = 4,
+        timeout: float = 10.0,
+    ) -> None:
+        """
+        Initialize the client.
+
+        :param max_hosts: the number of hosts whose connections are kept.
+        :param max_connections_per_host: the maximum number of open connections to a host.
+        :param timeout: the timeout of the connection and of the response of a request, in seconds.
+        :raises ValueError: if the configuration is invalid.
+        """
+        if max_hosts < 1 or max_connections_per_host < 1:
+            raise ValueError(
+                f"The number of hosts ({max_hosts}) and of connections per host "
+                f"({max_connections_per_host}) must be positive."
+            )
+        self.timeout = timeout
+        self.metrics = ConnectionMetrics()
+        self._session = requests.Session()
+        # the requests to a host wait for one of its connections to be free, instead of opening more
+        adapter = _TimedHTTPAdapter(
+            self.metrics,
+            pool_connections=max_hosts,
+            pool_maxsize=max_connections_per_host,
+            pool_block=True,
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        # a worker for each connection, so that the requests to a host do not wait for the other hosts
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_hosts * max_connections_per_host,
+            thread_name_prefix="pooled-http",
+        )
+        # the callbacks bound to their responses
+        self._responses: "queue.SimpleQueue[Callable[[], None]]" = queue.SimpleQueue()
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        """Get the number of requests whose response has not been dispatched yet."""
+        return self._pending
+
+    def request(self, method: str, url: str, callback: ResponseCallback) -> None:
+        """
+        Send a request, without waiting for its response.
+
+        :param method: the http method.
+        :param url: the url.
+        :param callback: the callback to pass the response to, when it is dispatched.
+        """
+        self._pending += 1
+        future = self._executor.submit(self._send, method, url)
+        # the response is queued, to be dispatched from the thread of the agent
+        future.add_done_callback(
+            lambda done: self._responses.put(partial(callback, done.result()))
+        )
+
+    def dispatch(self) -> int:
+        """
+        Pass the received responses to their callbacks.
+
+        :return: the number of dispatched responses.
+        """
+        n_dispatched = 0
+        while True:
+            try:
+                dispatch_response = self._responses.get_nowait()
+            except queue.Empty:
+                return n_dispatched
+            self._pending -= 1
+            n_dispatched += 1
+            dispatch_response()
+
+    def close(self) -> None:
+        """Close the connections, without waiting for the pending requests."""
+        self._executor.shutdown(wait=False)
+        self._session.close()
+
+    def _send(self, method: str, url: str) -> HttpMessage:
+        """Send a request and read its response, as an http message."""
+        start = time.perf_counter()
+        try:
+            response = self._session.request(method, url, timeout=self.timeout)
+            message = self._to_message(
+                response.status_code,
+                response.reason or "",
+                response.headers,
+                response.content,
+            )
+        except Exception:  # pylint: disable=broad-except
+            # the failure is reported in the response, as the http client connection does
+            message = self._to_message(
+                EXCEPTION_STATUS_CODE,
+                "HTTPConnection request error.",
+                {},
+                format_exc().encode("utf-8"),
+            )
+        self.metrics.record_request(
+            time.perf_counter() - start,
+            is_error=message.status_code == EXCEPTION_STATUS_CODE,
+        )
+        return message
+
+    @staticmethod
+    def _to_message(
+        status_code: int, status_text: str, headers: Any, body: bytes
+    ) -> HttpMessage:
+        """Build the http message of a response."""
+        return HttpMessage(
+            performative=HttpMessage.Performative.RESPONSE,
+            version="",
+            status_code=status_code,
+            status_text=status_text,
+            headers="".join(f"{key}: {value}\n" for key, value in headers.items()),
+            body=body,
+        )
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the latency instrumentation of the behaviours."""
+
+import time
+from bisect import bisect_left
+from enum import Enum
+from typing import Any, Dict, Generator, List, Optional, Sequence, TypeVar
+
+
+# the upper bounds of the histogram buckets, in seconds
+DEFAULT_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+ReturnType = TypeVar("ReturnType")
+
+
+class BlockType(Enum):
+    """The blocks in which the time spent by a behaviour is split."""
+
+    LOCAL = "local"
+    HTTP = "http"
+    TX = "tx"
+    WAIT = "wait"
+    SLEEP = "sleep"
+    TOTAL = "total"
+
+
+class LatencyHistogram:
+    """
+    A histogram of latencies, with fixed buckets.
+
+    Each latency is counted in the first bucket whose upper bound is not lower than it,
+    or in the overflow bucket if it exceeds all the bounds.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        """Initialize the histogram."""
+        self.buckets = tuple(sorted(buckets))
+        self.counts: List[int] = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Count a latency."""
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+
+    def to_json(self) -> Dict[str, Any]:
+        """Get a json serializable representation of the histogram."""
+        return {
+            "buckets": {
+                **{
+                    str(bound): count for bound, count in zip(self.buckets, self.counts)
+                },
+                "inf": self.counts[-1],
+            },
+            "count": self.count,
+            "sum": self.sum,
+            "max": self.max,
+        }
+
+
+class BehaviourTimer:
+    """
+    Measure the wall-clock time spent by a behaviour in each block.
+
+    The blocks can be nested, e.g. a `sleep` while sending a transaction, in which case
+    the time is only accounted for the outermost block. The time which is not spent in any
+    block is the local compute time.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the timer."""
+        self._start: Optional[float] = None
+        self._active: Optional[BlockType] = None
+        self._totals: Dict[BlockType, float] = {}
+
+    def start(self) -> None:
+        """Start the timer, if it has not been started yet."""
+        if self._start is None:
+            self._start = time.perf_counter()
+
+    def measure(
+        self, block_type: BlockType, generator: Generator[Any, Any, ReturnType]
+    ) -> Generator[Any, Any, ReturnType]:
+        """
+        Run a generator, accounting the time it takes for the given block.
+
+        :param block_type: the block to account the time for.
+        :param generator: the generator to run.
+        :yield: the values yielded by the generator.
+        :return: the value returned by the generator.
+        """
+        if self._active is not None:
+            return (yield from generator)
+
+        self._active = block_type
+        start = time.perf_counter()
+        try:
+            return (yield from generator)
+        finally:
+            elapsed = time.perf_counter() - start
+            self._totals[block_type] = self._totals.get(block_type, 0.0) + elapsed
+            self._active = None
+
+    def stop(self) -> Dict[BlockType, float]:
+        """
+        Stop the timer.
+
+        :return: the time spent in each block, including the local and total times.
+        """
+        total = 0.0 if self._start is None else time.perf_counter() - self._start
+        timings = dict(self._totals)
+        timings[BlockType.LOCAL] = max(total - sum(self._totals.values()), 0.0)
+        timings[BlockType.TOTAL] = total
+        return timings
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the deterministic selection of the keeper."""
+
+import hashlib
+from bisect import bisect_right
+from itertools import accumulate
+from typing import AbstractSet, List, Mapping, Optional, Tuple
+
+
+DEFAULT_WEIGHT = 1
+
+
+def randomness_to_int(randomness: str) -> int:
+    """Map a randomness value to an integer, using its sha256 hash."""
+    return int.from_bytes(hashlib.sha256(randomness.encode("utf-8")).digest(), "big")
+
+
+class KeeperSelector:
+    """
+    Select the keeper of a period deterministically from the agreed randomness.
+
+    The keeper is drawn among the sorted participants, each one being weighted by its configured
+    weight, or `DEFAULT_WEIGHT` if it has none, using the sha256 hash of the randomness modulo the
+    total weight. No global state is used, so every agent holding the same participants and
+    randomness selects the same keeper.
+
+    The sorted participants and their cumulative weights are cached until the participants change.
+    If `avoid_previous_keeper` is set, the keeper of the previous period is left out of the draw,
+    so that the load is spread over consecutive periods.
+
+    If `n_keepers` is more than one, `select_keepers` selects that many distinct keepers, in order,
+    the first one being the keeper selected by `select`.
+    """
+
+    def __init__(
+        self,
+        weights: Optional[Mapping[str, int]] = None,
+        avoid_previous_keeper: bool = False,
+        n_keepers: int = 1,
+    ) -> None:
+        """Initialize the selector."""
+        weights = dict(weights or {})
+        negative = {address for address, weight in weights.items() if weight < 0}
+        if negative:
+            raise ValueError(
+                f"Keeper weights must not be negative: {sorted(negative)}."
+            )
+        if n_keepers < 1:
+            raise ValueError(
+                f"The number of keepers must be positive, got {n_keepers}."
+            )
+        self._weights = weights
+        self.avoid_previous_keeper = avoid_previous_keeper
+        self.n_keepers = n_keepers
+        self._participants: Optional[AbstractSet[str]] = None
+        self._sorted_participants: Tuple[str, ...] = ()
+        self._sorted_weights: List[int] = []
+        self._cumulative_weights: List[int] = []
+
+    def sorted_participants(self, participants: AbstractSet[str]) -> Tuple[str, ...]:
+        """Get the sorted participants, sorting them only if they changed since the last call."""
+        if participants != self._participants:
+            self._participants = frozenset(participants)
+            self._sorted_participants = tuple(sorted(participants))
+            weights = [
+                self._weights.get(address, DEFAULT_WEIGHT)
+                for address in self._sorted_participants
+            ]
+            if sum(weights) == 0:
+                weights = [DEFAULT_WEIGHT] * len(weights)
+            self._sorted_weights = weights
+            self._cumulative_weights = list(accumulate(weights))
+        return self._sorted_participants
+
+    def select(
+        self,
+        participants: AbstractSet[str],
+        randomness: str,
+        previous_keeper: Optional[str] = None,
+    ) -> str:
+        """
+        Select the keeper.
+
+        :param participants: the participants among which the keeper is selected.
+        :param randomness: the randomness agreed by the participants.
+        :param previous_keeper: the keeper of the previous period, if any.
+        :return: the address of the keeper.
+        """
+        ordered = self.sorted_participants(participants)
+        if not ordered:
+            raise ValueError("Cannot select a keeper without participants.")
+        cumulative = self._cumulative_weights
+        total = cumulative[-1]
+        point = randomness_to_int(randomness)
+
+        excluded = self._excluded_range(ordered, previous_keeper)
+        if excluded is None:
+            return ordered[bisect_right(cumulative, point % total)]
+
+        # draw among the remaining weight, skipping over the weight of the previous keeper
+        start, weight = excluded
+        point %= total - weight
+        if point >= start:
+            point += weight
+        return ordered[bisect_right(cumulative, point)]
+
+    def select_keepers(
+        self,
+        participants: AbstractSet[str],
+        randomness: str,
+        previous_keeper: Optional[str] = None,
+    ) -> Tuple[str, ...]:
+        """
+        Select the ordered keepers of a period.
+
+        The first keeper is the one selected by `select`. Each of the next ones is drawn among
+        the participants which have not been selected yet, using the sha256 hash of the randomness
+        and of its rank. If all of them have no weight, they are drawn with the default weight.
+
+        :param participants: the participants among which the keepers are selected.
+        :param randomness: the randomness agreed by the participants.
+        :param previous_keeper: the first keeper of the previous period, if any.
+        :return: the addresses of the `n_keepers` keepers, or of all the participants if there are fewer.
+        """
+        keepers = [self.select(participants, randomness, previous_keeper)]
+        n_keepers = min(self.n_keepers, len(self._sorted_participants))
+        while len(keepers) < n_keepers:
+            remaining = [
+                (address, weight)
+                for address, weight in zip(
+                    self._sorted_participants, self._sorted_weights
+                )
+                if address not in keepers
+            ]
+            total = sum(weight for _, weight in remaining)
+            if total == 0:
+                remaining = [(address, DEFAULT_WEIGHT) for address, _ in remaining]
+                total = DEFAULT_WEIGHT * len(remaining)
+            point = randomness_to_int(f"{randomness}:{len(keepers)}") % total
+            for address, weight in remaining:
+                if point < weight:
+                    keepers.append(address)
+                    break
+                point -= weight
+        return tuple(keepers)
+
+    def _excluded_range(
+        self, ordered: Tuple[str, ...], previous_keeper: Optional[str]
+    ) -> Optional[Tuple[int, int]]:
+        """Get the start and the size of the weight range of the previous keeper, if it should be left out."""
+        participants = self._participants or frozenset()
+        if (
+            not self.avoid_previous_keeper
+            or previous_keeper is None
+            or previous_keeper not in participants
+        ):
+            return None
+        cumulative = self._cumulative_weights
+        index = bisect_right(ordered, previous_keeper) - 1
+        weight = cumulative[index] - (cumulative[index - 1] if index > 0 else 0)
+        if weight in (0, cumulative[-1]):
+            # nothing to leave out, or nobody else can be selected
+            return None
+        return cumulative[index] - weight, weight
@@ -19,7 +19,11 @@
 
 """This module contains the shared state for the Hello World application."""
 
-from typing import Any
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from aea.skills.base import Model
 
 from packages.valory.skills.abstract_round_abci.models import ApiSpecs, BaseParams
 from packages.valory.skills.abstract_round_abci.models import (
@@ -29,30 +33,159 @@ from packages.valory.skills.abstract_round_abci.models import Requests as BaseRe
 from packages.valory.skills.abstract_round_abci.models import (
     SharedState as BaseSharedState,
 )
-from packages.valory.skills.hello_world_abci.rounds import Event, HelloWorldAbciApp
+from packages.valory.skills.abstract_round_abci.models import TypeCheckMixin
+from packages.valory.skills.hello_world_abci.drand import DrandVerifier
+from packages.valory.skills.hello_world_abci.http_pool import PooledHttpClient
+from packages.valory.skills.hello_world_abci.instrumentation import (
+    BlockType,
+    LatencyHistogram,
+)
+from packages.valory.skills.hello_world_abci.keeper import KeeperSelector
+from packages.valory.skills.hello_world_abci.output import (
+    OutputSink,
+    OutputTarget,
+    OverflowPolicy,
+)
+from packages.valory.skills.hello_world_abci.randomness import (
+    DeterministicBeacon,
+    LocalRandomnessSource,
+    Observation,
+    drand_round_at,
+)
+from packages.valory.skills.hello_world_abci.reset_pause import ResetPauseController
+from packages.valory.skills.hello_world_abci.retry import BackoffPolicy, LatencyWindow
+from packages.valory.skills.hello_world_abci.round_timeout import RoundTimeoutController
+from packages.valory.skills.hello_world_abci.rounds import (
+    CollectRandomnessRound,
+    Event,
+    HelloWorldAbciApp,
+    PrintMessageRound,
+    ResetAndPauseRound,
+)
+from packages.valory.skills.hello_world_abci.shared_cache import SharedRandomnessCache
+from packages.valory.skills.hello_world_abci.snapshot import SnapshotStore
+from packages.valory.skills.hello_world_abci.work_queue import (
+    MessageQueue,
+    batch_budget,
+)
 
 
 MARGIN = 5
 
 
 Requests = BaseRequests
-BenchmarkTool = BaseBenchmarkTool
+
+
+class BenchmarkTool(BaseBenchmarkTool):
+    """
+    Tool to benchmark the behaviours of the Hello World ABCI app.
+
+    On top of the logs of the base tool, it aggregates the wall-clock time spent by each behaviour
+    into latency histograms, one per behaviour and block type, which live for the lifetime of the agent.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the benchmark tool."""
+        # the base tool is frozen once initialized
+        self.latency_histograms: Dict[str, Dict[str, LatencyHistogram]] = {}
+        super().__init__(*args, **kwargs)
+
+    def record(self, behaviour_id: str, timings: Dict[BlockType, float]) -> None:
+        """Record the time spent by a behaviour in each block."""
+        histograms = self.latency_histograms.setdefault(behaviour_id, {})
+        for block_type, seconds in timings.items():
+            histogram = histograms.setdefault(block_type.value, LatencyHistogram())
+            histogram.observe(seconds)
+
+    @property
+    def latency_data(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Get a json serializable representation of the latency histograms."""
+        return {
+            behaviour_id: {
+                block_type: histogram.to_json()
+                for block_type, histogram in histograms.items()
+            }
+            for behaviour_id, histograms in self.latency_histograms.items()
+        }
 
 
 class SharedState(BaseSharedState):
-    """Keep the current shared state of the skill."""
+    """
+    Keep the current shared state of the skill.
+
+    The callbacks registered with `add_round_transition_callback` are called by the ABCI handler
+    as soon as a request has moved the app to a new round, so that the behaviours do not have to
+    wait for their next tick to notice it.
+    """
 
     abci_app_cls = HelloWorldAbciApp
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the state."""
+        super().__init__(*args, **kwargs)
+        self.drand_verifier: Optional[DrandVerifier] = None
+        self._round_transition_callbacks: List[Callable[[], None]] = []
+
+    def add_round_transition_callback(self, callback: Callable[[], None]) -> None:
+        """Register a callback to be called after each round transition, unless it is already registered."""
+        if callback not in self._round_transition_callbacks:
+            self._round_transition_callbacks.append(callback)
+
+    def notify_round_transition(self) -> None:
+        """Call the callbacks registered for the round transitions."""
+        for callback in self._round_transition_callbacks:
+            callback()
+
     def setup(self) -> None:
         """Set up."""
         super().setup()
         HelloWorldAbciApp.event_to_timeout[
             Event.ROUND_TIMEOUT
         ] = self.context.params.round_timeout_seconds
+        params = self.context.params
+        round_timeouts = self.context.round_timeouts
+        HelloWorldAbciApp.timeout_controller = RoundTimeoutController(
+            params.round_timeout_seconds,
+            round_timeouts.min_seconds,
+            round_timeouts.max_seconds,
+            round_timeouts.percentile,
+            round_timeouts.multiplier,
+            round_timeouts.adaptive,
+        )
+        reset_pause = self.context.reset_pause
+        pause_controller = ResetPauseController(
+            params.reset_pause_duration,
+            reset_pause.min_duration,
+            reset_pause.max_duration,
+            reset_pause.adaptive,
+        )
+        ResetAndPauseRound.pause_controller = pause_controller
+        # the timeout must not expire before the longest pause that the round may take
         HelloWorldAbciApp.event_to_timeout[Event.RESET_TIMEOUT] = (
-            self.context.params.reset_pause_duration + MARGIN
+            pause_controller.longest_pause + MARGIN
+        )
+        CollectRandomnessRound.select_keeper_locally = (
+            self.context.params.select_keeper_locally
         )
+        CollectRandomnessRound.keeper_selector = self.context.keeper_selection.selector
+        PrintMessageRound.history_size = (
+            self.context.params.printed_messages_history_size
+        )
+        PrintMessageRound.pipeline_randomness = self.context.params.pipeline_randomness
+        work_queue = self.context.work_queue
+        PrintMessageRound.max_batch_size = work_queue.max_batch_size
+        PrintMessageRound.max_batch_bytes = batch_budget(
+            work_queue.max_batch_bytes,
+            int(params.genesis_config.consensus_params.block.max_bytes),
+        )
+        if self.context.params.verify_drand_signatures:
+            self.drand_verifier = DrandVerifier(self.context.params.drand_public_key)
+
+    def teardown(self) -> None:
+        """Tear down, stopping the verification of the drand signatures."""
+        super().teardown()
+        if self.drand_verifier is not None:
+            self.drand_verifier.close()
 
 
 class HelloWorldParams(BaseParams):
@@ -61,7 +194,380 @@ class HelloWorldParams(BaseParams):
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         """Initialize the parameters."""
         self.hello_world_string: str = self._ensure("hello_world_message", kwargs, str)
+        self.printed_messages_history_size: int = self._ensure(
+            "printed_messages_history_size", kwargs, int
+        )
+        self.select_keeper_locally: bool = self._ensure(
+            "select_keeper_locally", kwargs, bool
+        )
+        self.verify_drand_signatures: bool = self._ensure(
+            "verify_drand_signatures", kwargs, bool
+        )
+        self.drand_verification_timeout: float = self._ensure(
+            "drand_verification_timeout", kwargs, float
+        )
+        self.pin_drand_round: bool = self._ensure("pin_drand_round", kwargs, bool)
+        self.pipeline_randomness: bool = self._ensure(
+            "pipeline_randomness", kwargs, bool
+        )
+        self.wake_on_round_transition: bool = self._ensure(
+            "wake_on_round_transition", kwargs, bool
+        )
+        super().__init__(*args, **kwargs)
+
+
+class RoundTimeouts(Model, TypeCheckMixin):
+    """
+    The tuning of the round timeouts.
+
+    If `adaptive` is set, the timeout of each round is `multiplier` times the `percentile` of its latest
+    durations, within `min_seconds` and `max_seconds`, instead of the `round_timeout_seconds` of the params.
+    See `RoundTimeoutController` for the details.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the round timeouts."""
+        self.adaptive: bool = self._ensure("adaptive", kwargs, bool)
+        self.min_seconds: float = self._ensure("min_seconds", kwargs, float)
+        self.max_seconds: float = self._ensure("max_seconds", kwargs, float)
+        self.percentile: int = self._ensure("percentile", kwargs, int)
+        self.multiplier: float = self._ensure("multiplier", kwargs, float)
+        super().__init__(*args, **kwargs)
+
+
+class ResetPause(Model, TypeCheckMixin):
+    """
+    The tuning of the pause between two periods.
+
+    If `adaptive` is set, the pause adapts to the health of the periods, within `min_duration`
+    and `max_duration`, starting from the `reset_pause_duration` of the params.
+    See `ResetPauseController` for the details.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the reset pause."""
+        self.adaptive: bool = self._ensure("adaptive", kwargs, bool)
+        self.min_duration: int = self._ensure("min_duration", kwargs, int)
+        self.max_duration: int = self._ensure("max_duration", kwargs, int)
         super().__init__(*args, **kwargs)
 
 
 RandomnessApi = ApiSpecs
+
+
+class RandomnessSources(Model, TypeCheckMixin):
+    """
+    The randomness sources which are raced against the randomness api.
+
+    The `mirrors` are queried concurrently with the url of the randomness api and
+    their responses are processed by it, so they must serve the same response format.
+    The local sources are queried before any request is sent.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the randomness sources."""
+        self.mirrors: List[str] = self._ensure("mirrors", kwargs, List[str])
+        local_beacon_seed: Optional[str] = self._ensure(
+            "local_beacon_seed", kwargs, Optional[str]
+        )
+        super().__init__(*args, **kwargs)
+        self.local_sources: List[LocalRandomnessSource] = []
+        if local_beacon_seed is not None:
+            self.local_sources.append(DeterministicBeacon(local_beacon_seed))
+
+
+class KeeperSelection(Model, TypeCheckMixin):
+    """
+    The configuration of the keeper selection.
+
+    The participants missing from `weights` have the default weight.
+    See `KeeperSelector` for the details of the selection.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the keeper selection."""
+        weights: Dict[str, int] = self._ensure("weights", kwargs, Dict[str, int])
+        avoid_previous_keeper: bool = self._ensure(
+            "avoid_previous_keeper", kwargs, bool
+        )
+        n_keepers: int = self._ensure("n_keepers", kwargs, int)
+        super().__init__(*args, **kwargs)
+        self.selector = KeeperSelector(weights, avoid_previous_keeper, n_keepers)
+
+
+class PooledHttp(Model, TypeCheckMixin):
+    """
+    The configuration of the pooled, keep-alive http client of the randomness requests.
+
+    If it is `enabled`, the randomness requests are sent by the `client`, which reuses its connections
+    across periods, instead of by the http client connection, which opens a new one for every request.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the pooled http client."""
+        enabled: bool = self._ensure("enabled", kwargs, bool)
+        max_hosts: int = self._ensure("max_hosts", kwargs, int)
+        max_connections_per_host: int = self._ensure(
+            "max_connections_per_host", kwargs, int
+        )
+        timeout: float = self._ensure("timeout", kwargs, float)
+        super().__init__(*args, **kwargs)
+        self.client = (
+            PooledHttpClient(max_hosts, max_connections_per_host, timeout)
+            if enabled
+            else None
+        )
+
+    def teardown(self) -> None:
+        """Close the connections of the client."""
+        super().teardown()
+        if self.client is not None:
+            self.client.close()
+
+
+class RandomnessRetries(Model, TypeCheckMixin):
+    """
+    The scheduling of the retries of the randomness requests.
+
+    A retry waits `sleep_time * backoff_factor ** n`, the backoff factor being the one of the randomness api,
+    capped to `max_backoff` and with up to a `jitter` fraction taken off. A retry which would start after
+    the round has timed out is not attempted.
+    If `hedge_requests` is enabled, the requests are sent again if none of them has answered after
+    the `hedge_percentile` of the latencies of the latest `latency_window` races,
+    once at least `min_latency_samples` of them have been recorded.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the retries."""
+        max_backoff: float = self._ensure("max_backoff", kwargs, float)
+        jitter: float = self._ensure("jitter", kwargs, float)
+        self.hedge_requests: bool = self._ensure("hedge_requests", kwargs, bool)
+        self.hedge_percentile: int = self._ensure("hedge_percentile", kwargs, int)
+        latency_window: int = self._ensure("latency_window", kwargs, int)
+        self.min_latency_samples: int = self._ensure("min_latency_samples", kwargs, int)
+        super().__init__(*args, **kwargs)
+        self.backoff = BackoffPolicy(max_backoff, jitter)
+        self.latencies = LatencyWindow(latency_window)
+
+    def hedge_delay(self) -> Optional[float]:
+        """Get the time after which the requests are hedged, or `None` if they are not."""
+        if not self.hedge_requests or len(self.latencies) < self.min_latency_samples:
+            return None
+        return self.latencies.percentile(self.hedge_percentile)
+
+
+class PrintedMessagesOutput(Model, TypeCheckMixin):
+    """
+    The configuration of the output of the printed messages.
+
+    The messages are written by the non-blocking `sink`, to stdout, to a file or to memory.
+    See `OutputSink` for the details of the batching and of the overflow policies.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the output."""
+        target: str = self._ensure("target", kwargs, str)
+        path: Optional[str] = self._ensure("path", kwargs, Optional[str])
+        capacity: int = self._ensure("capacity", kwargs, int)
+        batch_size: int = self._ensure("batch_size", kwargs, int)
+        overflow_policy: str = self._ensure("overflow_policy", kwargs, str)
+        super().__init__(*args, **kwargs)
+        self.sink = OutputSink(
+            OutputTarget(target),
+            path,
+            capacity,
+            batch_size,
+            OverflowPolicy(overflow_policy),
+        )
+
+    def teardown(self) -> None:
+        """Write the queued messages and stop the sink."""
+        super().teardown()
+        self.sink.stop(timeout=self.sink.block_timeout)
+
+
+class PeriodSnapshots(Model, TypeCheckMixin):
+    """
+    The snapshots of the synchronized data taken at the period boundaries.
+
+    When a `directory` is configured, a snapshot is saved at the first block of each period,
+    and an agent which restarts loads the latest one, so that only the blocks committed after it are replayed.
+    Snapshots are disabled if the `directory` is `None`.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the snapshots."""
+        directory: Optional[str] = self._ensure("directory", kwargs, Optional[str])
+        keep: int = self._ensure("keep", kwargs, int)
+        super().__init__(*args, **kwargs)
+        self.store = None if directory is None else SnapshotStore(directory, keep)
+        # the period of the latest saved snapshot
+        self.last_period: Optional[int] = None
+
+
+class WorkQueue(Model, TypeCheckMixin):
+    """
+    The queue of the messages submitted to the agent through `POST /messages`.
+
+    When a `directory` is configured, the queue is persisted in it, and the keepers print a batch of
+    the oldest queued messages of their slice in each period. A batch holds up to `max_batch_size` messages
+    and `max_batch_bytes` bytes, capped so that its transaction fits in a block. Once a batch is committed
+    by the `PrintMessageRound`, every agent removes its messages from its own queue.
+    The queue is disabled if the `directory` is `None`.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the work queue."""
+        directory: Optional[str] = self._ensure("directory", kwargs, Optional[str])
+        capacity: int = self._ensure("capacity", kwargs, int)
+        max_message_bytes: int = self._ensure("max_message_bytes", kwargs, int)
+        self.max_batch_size: int = self._ensure("max_batch_size", kwargs, int)
+        self.max_batch_bytes: int = self._ensure("max_batch_bytes", kwargs, int)
+        super().__init__(*args, **kwargs)
+        self.queue = (
+            None
+            if directory is None
+            else MessageQueue(directory, capacity, max_message_bytes)
+        )
+
+
+@dataclass
+class CacheStats:
+    """The hits and misses of a `RandomnessCache`, the hits of the shared cache being counted as hits too."""
+
+    hits: int = 0
+    shared_hits: int = 0
+    misses: int = 0
+
+
+class RandomnessCache(Model, TypeCheckMixin):
+    """
+    A cache of the latest drand beacon.
+
+    When `prefetch` is enabled, the beacon is requested in the background at the end of each period,
+    so that the next period can use it without waiting for a network round-trip.
+    A cached beacon is only served while its round is still the latest one of the drand chain,
+    which is computed from the chain's `genesis_time` and `period`.
+    When a `shared_directory` is configured, the beacons are also shared with the other agents
+    of the host through it, so that a single agent fetches the beacon of a round for all of them.
+    An agent waits up to `shared_lease_timeout` seconds for the beacon fetched by another one,
+    checking the shared cache every `shared_poll_interval` seconds,
+    and falls back to fetching it on its own if the shared cache cannot be used.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the cache."""
+        self.prefetch: bool = self._ensure("prefetch", kwargs, bool)
+        self.genesis_time: int = self._ensure("genesis_time", kwargs, int)
+        self.period: int = self._ensure("period", kwargs, int)
+        shared_directory: Optional[str] = self._ensure(
+            "shared_directory", kwargs, Optional[str]
+        )
+        self.shared_lease_timeout: float = self._ensure(
+            "shared_lease_timeout", kwargs, float
+        )
+        self.shared_poll_interval: float = self._ensure(
+            "shared_poll_interval", kwargs, float
+        )
+        super().__init__(*args, **kwargs)
+        self.shared = (
+            None
+            if shared_directory is None
+            else SharedRandomnessCache(
+                shared_directory, lease_timeout=self.shared_lease_timeout
+            )
+        )
+        self._observation: Optional[Observation] = None
+        self.stats = CacheStats()
+
+    def current_round(self, now: Optional[float] = None) -> int:
+        """Get the latest round of the drand chain at the given time."""
+        now = time.time() if now is None else now
+        return drand_round_at(now, self.genesis_time, self.period)
+
+    def _store_locally(self, observation: Observation) -> None:
+        """Store a beacon in the memory of the agent, unless a more recent one is already cached."""
+        if (
+            self._observation is None
+            or observation["round"] > self._observation["round"]
+        ):
+            self._observation = dict(observation)
+
+    def store(self, observation: Observation) -> None:
+        """Store a beacon, unless a more recent one is already cached, and share it with the agents of the host."""
+        self._store_locally(observation)
+        if self.shared is None:
+            return
+        try:
+            self.shared.store(observation)
+        except OSError as exc:
+            self.context.logger.warning(f"Could not share the randomness: {exc}")
+
+    def get(
+        self, now: Optional[float] = None, drand_round: Optional[int] = None
+    ) -> Optional[Observation]:
+        """
+        Get the cached beacon, counting the hits and misses.
+
+        :param now: the current time.
+        :param drand_round: the round of the beacon, if it is pinned.
+        :return: the beacon of the given round if any, and otherwise the cached beacon if its round is still the latest one.
+        """
+        min_round = self.current_round(now) if drand_round is None else drand_round
+        cached = self._observation
+        if (
+            cached is not None
+            and cached["round"] >= min_round
+            and (drand_round is None or cached["round"] == drand_round)
+        ):
+            self.stats.hits += 1
+            return dict(cached)
+        shared = self.get_shared(min_round, drand_round)
+        if shared is not None:
+            self.stats.hits += 1
+            self.stats.shared_hits += 1
+            self._store_locally(shared)
+            return dict(shared)
+        self.stats.misses += 1
+        return None
+
+    def get_shared(
+        self, min_round: int, drand_round: Optional[int] = None
+    ) -> Optional[Observation]:
+        """Get the beacon of the given round from the shared cache if any, and otherwise its latest one if its round is at least the given one."""
+        if self.shared is None:
+            return None
+        return self.shared.load(min_round, drand_round)
+
+    def acquire_fetch(
+        self, now: Optional[float] = None, drand_round: Optional[int] = None
+    ) -> bool:
+        """
+        Check whether the agent should fetch the beacon of the given round, or of the latest one.
+
+        :param now: the current time.
+        :param drand_round: the round of the beacon, if it is pinned.
+        :return: `False` if another agent of the host is fetching it or has shared it, and `True` otherwise.
+        """
+        if self.shared is None:
+            return True
+        try:
+            if drand_round is None:
+                return self.shared.acquire(self.current_round(now))
+            return self.shared.acquire(drand_round, exact=True)
+        except OSError as exc:
+            self.context.logger.warning(f"Could not use the shared randomness: {exc}")
+            return True
+
+    def release_fetch(
+        self, now: Optional[float] = None, drand_round: Optional[int] = None
+    ) -> None:
+        """Let the other agents of the host fetch the beacon of the given round, or of the latest one, after a failed fetch."""
+        if self.shared is None:
+            return
+        try:
+            self.shared.release(
+                self.current_round(now) if drand_round is None else drand_round
+            )
+        except OSError as exc:
+            self.context.logger.warning(f"Could not use the shared randomness: {exc}")
@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the non-blocking sink of the printed messages."""
+
+import sys
+import threading
+from collections import deque
+from enum import Enum
+from typing import Deque, List, Optional, TextIO
+
+
+class OutputTarget(Enum):
+    """The destinations of the lines written to an `OutputSink`."""
+
+    STDOUT = "stdout"
+    FILE = "file"
+    MEMORY = "memory"
+
+
+class OverflowPolicy(Enum):
+    """What an `OutputSink` does with a line written while its queue is full."""
+
+    # wait for the writer thread to make room, up to the block timeout, then drop the line
+    BLOCK = "block"
+    # drop the written line
+    DROP_NEWEST = "drop_newest"
+    # drop the oldest queued line to make room for the written one
+    DROP_OLDEST = "drop_oldest"
+
+
+class OutputSink:  # pylint: disable=too-many-instance-attributes
+    """
+    A bounded queue of lines, drained by a writer thread.
+
+    Writing a line only appends it to the queue, so a slow console, e.g. under a container log driver,
+    never stalls the caller. The writer thread, started on the first write, writes the queued lines
+    in batches of up to `batch_size` lines and flushes the stream once per batch.
+    When the queue holds `capacity` lines, the `policy` decides which line is dropped,
+    and the dropped lines are counted. A memory sink keeps up to `max_lines` written lines,
+    under the same policy, until they are taken with `take_lines`.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        target: OutputTarget = OutputTarget.STDOUT,
+        path: Optional[str] = None,
+        capacity: int = 1024,
+        batch_size: int = 64,
+        policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        block_timeout: float = 1.0,
+        max_lines: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize the sink.
+
+        :param target: where the lines are written.
+        :param path: the path of the file the lines are appended to, if the target is a file.
+        :param capacity: the maximum number of queued lines.
+        :param batch_size: the maximum number of lines written at once.
+        :param policy: what to do with a line written while the queue is full.
+        :param block_timeout: the longest time a write waits for room with the `BLOCK` policy.
+        :param max_lines: the maximum number of lines kept by a memory sink, the capacity by default.
+        :raises ValueError: if the configuration is invalid.
+        """
+        if target == OutputTarget.FILE and not path:
+            raise ValueError("A path is required to write the output to a file.")
+        max_lines = capacity if max_lines is None else max_lines
+        if capacity < 1 or batch_size < 1 or max_lines < 1:
+            raise ValueError(
+                f"The capacity ({capacity}), the batch size ({batch_size}) "
+                f"and the maximum number of kept lines ({max_lines}) must be positive."
+            )
+        self.target = target
+        self.path = path
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.policy = policy
+        self.block_timeout = block_timeout
+        # the lines written by a memory sink
+        self.max_lines = max_lines
+        self.lines: Deque[str] = deque(maxlen=max_lines)
+        self.written = 0
+        self.dropped = 0
+        self._queue: Deque[str] = deque()
+        self._condition = threading.Condition()
+        self._pending = 0
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+
+    def write(self, line: str) -> bool:
+        """
+        Queue a line to be written.
+
+        :param line: the line, without its trailing newline.
+        :return: whether the line was queued.
+        """
+        with self._condition:
+            if self._stopped:
+                self.dropped += 1
+                return False
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="output-sink", daemon=True
+                )
+                self._thread.start()
+            if len(self._queue) >= self.capacity:
+                if self.policy == OverflowPolicy.DROP_NEWEST:
+                    self.dropped += 1
+                    return False
+                if self.policy == OverflowPolicy.DROP_OLDEST:
+                    self._queue.popleft()
+                    self._pending -= 1
+                    self.dropped += 1
+                elif not self._condition.wait_for(
+                    lambda: len(self._queue) < self.capacity or self._stopped,
+                    self.block_timeout,
+                ):
+                    self.dropped += 1
+                    return False
+            self._queue.append(line)
+            self._pending += 1
+            self._condition.notify_all()
+            return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until the queued lines are written.
+
+        :param timeout: the longest time to wait, or `None` to wait until the lines are written.
+        :return: whether all the queued lines were written.
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self._pending == 0, timeout)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Write the queued lines and stop the writer thread.
+
+        :param timeout: the longest time to wait for the writer thread.
+        """
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def take_lines(self) -> List[str]:
+        """
+        Take the lines kept by a memory sink, making room for the next ones.
+
+        :return: the kept lines, oldest first.
+        """
+        with self._condition:
+            lines = list(self.lines)
+            self.lines.clear()
+            self._condition.notify_all()
+            return lines
+
+    def _open(self) -> Optional[TextIO]:
+        """Open the stream the lines are written to."""
+        if self.target == OutputTarget.STDOUT:
+            return sys.stdout
+        if self.target == OutputTarget.FILE:
+            return open(  # pylint: disable=consider-using-with
+                str(self.path), "a", encoding="utf-8"
+            )
+        return None
+
+    def _run(self) -> None:
+        """Write the queued lines in batches until the sink is stopped."""
+        try:
+            stream = self._open()
+        except OSError:
+            # the file cannot be opened: the sink stops, and the lines are dropped
+            with self._condition:
+                self._stopped = True
+                self.dropped += len(self._queue)
+                self._pending = 0
+                self._queue.clear()
+                self._condition.notify_all()
+            return
+        try:
+            while True:
+                with self._condition:
+                    self._condition.wait_for(lambda: self._queue or self._stopped)
+                    if not self._queue:
+                        return
+                    batch = [
+                        self._queue.popleft()
+                        for _ in range(min(self.batch_size, len(self._queue)))
+                    ]
+                    # room was made for the blocked writers
+                    self._condition.notify_all()
+                n_written = self._write(stream, batch)
+                with self._condition:
+                    self._pending -= len(batch)
+                    self.written += n_written
+                    self.dropped += len(batch) - n_written
+                    self._condition.notify_all()
+        finally:
+            if stream is not None and self.target == OutputTarget.FILE:
+                stream.close()
+
+    def _write(self, stream: Optional[TextIO], batch: List[str]) -> int:
+        """Write a batch of lines, returning the number of lines written."""
+        if stream is None:
+            return self._keep(batch)
+        try:
+            stream.write("".join(f"{line}\n" for line in batch))
+            stream.flush()
+        except (OSError, ValueError):
+            # the stream is broken or closed, e.g. stdout of a detached container
+            return 0
+        return len(batch)
+
+    def _keep(self, batch: List[str]) -> int:
+        """Keep a batch of lines in memory, within `max_lines`, returning the number of lines kept."""
+        with self._condition:
+            if self.policy == OverflowPolicy.DROP_OLDEST:
+                # the bounded deque evicts the oldest lines, which may include lines of the batch
+                overflow = max(0, len(self.lines) + len(batch) - self.max_lines)
+                evicted = min(overflow, len(self.lines))
+                self.dropped += evicted
+                self.lines.extend(batch)
+                return len(batch) - (overflow - evicted)
+            kept = 0
+            for line in batch:
+                if len(self.lines) >= self.max_lines and (
+                    self.policy == OverflowPolicy.DROP_NEWEST
+                    or not self._condition.wait_for(
+                        lambda: len(self.lines) < self.max_lines, self.block_timeout
+                    )
+                ):
+                    break
+                self.lines.append(line)
+                kept += 1
+            return kept
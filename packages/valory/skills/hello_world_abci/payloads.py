@@ -19,40 +19,116 @@
 
 """This module contains the transaction payloads for the Hello World skill."""
 
+import re
+import sys
 from dataclasses import dataclass
+from typing import ClassVar, Dict, Optional, Tuple
 
 from packages.valory.skills.abstract_round_abci.base import BaseTxPayload
 
 
+# the message printed by the agents which are not keepers
+NON_KEEPER_MESSAGE = ":|"
+
+# the format of the messages printed by the agents
+PRINTED_MESSAGE_FORMAT = (
+    "Agent {agent_name} (address {address}) in period {period} says: {message}"
+)
+PRINTED_MESSAGE_REGEX = re.compile(
+    re.escape(PRINTED_MESSAGE_FORMAT)
+    .replace(r"\{agent_name\}", "(?P<agent_name>.*?)")
+    .replace(r"\{address\}", "(?P<address>.*?)")
+    .replace(r"\{period\}", "(?P<period>0|[1-9][0-9]*)")
+    .replace(r"\{message\}", "(?P<message>.*)"),
+    re.DOTALL,
+)
+
+
+def parse_printed_message(message: str) -> Optional[Dict[str, str]]:
+    """
+    Split a printed message in its parts.
+
+    :param message: the printed message.
+    :return: the fields of `PRINTED_MESSAGE_FORMAT`, or `None` if the message cannot be rendered back from them.
+    """
+    match = PRINTED_MESSAGE_REGEX.fullmatch(message)
+    if match is None:
+        return None
+    fields = match.groupdict()
+    if PRINTED_MESSAGE_FORMAT.format(**fields) != message:
+        return None
+    return fields
+
+
+@dataclass(frozen=True)
+class HelloWorldABCIBasePayload(BaseTxPayload):
+    """
+    Base payload for the Hello World abci skill.
+
+    The string fields listed in `interned_fields`, whose values are shared by the payloads of many agents
+    and periods, are interned, so that the payloads decoded from the transactions of a block, or replayed
+    while catching up, share a single copy of each value instead of allocating their own.
+    """
+
+    interned_fields: ClassVar[Tuple[str, ...]] = ("sender",)
+
+    def __post_init__(self) -> None:
+        """Intern the shared string fields."""
+        for name in self.interned_fields:
+            value = getattr(self, name)
+            if type(value) is str:  # pylint: disable=unidiomatic-typecheck
+                object.__setattr__(self, name, sys.intern(value))
+
+
 @dataclass(frozen=True)
-class RegistrationPayload(BaseTxPayload):
+class RegistrationPayload(HelloWorldABCIBasePayload):
     """Represent a transaction payload of type 'registration'."""
 
 
 @dataclass(frozen=True)
-class CollectRandomnessPayload(BaseTxPayload):
+class CollectRandomnessPayload(HelloWorldABCIBasePayload):
     """Represent a transaction payload of type 'randomness'."""
 
+    interned_fields = ("sender", "randomness")
+
     round_id: int
     randomness: str
 
 
 @dataclass(frozen=True)
-class PrintMessagePayload(BaseTxPayload):
-    """Represent a transaction payload of type 'randomness'."""
+class PrintMessagePayload(HelloWorldABCIBasePayload):
+    """
+    Represent a transaction payload of type 'randomness'.
+
+    If the randomness is pipelined, the payload also carries the drand beacon of the next period.
+    The payload of a keeper also carries the batch of queued messages it printed, if any,
+    as a json list of their ids and messages.
+    """
+
+    interned_fields = ("sender", "next_randomness")
 
     message: str
+    next_round_id: Optional[int] = None
+    next_randomness: Optional[str] = None
+    batch: Optional[str] = None
 
 
 @dataclass(frozen=True)
-class SelectKeeperPayload(BaseTxPayload):
-    """Represent a transaction payload of type 'select_keeper'."""
+class SelectKeeperPayload(HelloWorldABCIBasePayload):
+    """
+    Represent a transaction payload of type 'select_keeper'.
+
+    If several keepers are selected, the payload also carries all of them, in order, as a json list.
+    """
+
+    interned_fields = ("sender", "keeper", "keepers")
 
     keeper: str
+    keepers: Optional[str] = None
 
 
 @dataclass(frozen=True)
-class ResetPayload(BaseTxPayload):
+class ResetPayload(HelloWorldABCIBasePayload):
     """Represent a transaction payload of type 'reset'."""
 
     period_count: int
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the randomness sources for the Hello World skill."""
+
+import hashlib
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+
+# the genesis time and period of the drand mainnet chain
+DRAND_GENESIS_TIME = 1595431050
+DRAND_PERIOD = 30
+
+Observation = Dict[str, Any]
+
+
+def drand_round_at(
+    now: float, genesis_time: int = DRAND_GENESIS_TIME, period: int = DRAND_PERIOD
+) -> int:
+    """Get the round of a drand chain which is the latest one at the given time."""
+    return max(int(now - genesis_time) // period + 1, 1)
+
+
+def round_url(url: str, drand_round: int) -> str:
+    """
+    Get the url of the beacon of a round, from the url of the latest beacon of a drand api.
+
+    :param url: the url of the latest beacon, e.g. `https://api.drand.sh/public/latest`.
+    :param drand_round: the round.
+    :return: the url of the beacon of the round, e.g. `https://api.drand.sh/public/42`.
+    :raises ValueError: if the url is not the one of the latest beacon.
+    """
+    base, separator, latest = url.rpartition("/")
+    if separator == "" or latest != "latest":
+        raise ValueError(f"The url {url!r} is not the url of the latest drand beacon.")
+    return f"{base}/{drand_round}"
+
+
+def is_valid_observation(observation: Any) -> bool:
+    """Check whether an observation has the shape of a drand beacon."""
+    return (
+        isinstance(observation, dict)
+        and isinstance(observation.get("round"), int)
+        and isinstance(observation.get("randomness"), str)
+        and len(observation["randomness"]) > 0
+    )
+
+
+class LocalRandomnessSource(ABC):  # pylint: disable=too-few-public-methods
+    """A randomness source which can be queried without any network round-trip."""
+
+    source_id: str
+
+    @abstractmethod
+    def get_observation(
+        self, drand_round: Optional[int] = None
+    ) -> Optional[Observation]:
+        """Get the beacon of the given round, or the latest one, or `None` if it is not available."""
+
+
+class DeterministicBeacon(LocalRandomnessSource):
+    """
+    A local stand-in for drand, deriving the randomness from a shared seed.
+
+    The beacon follows the round schedule of a drand chain, and the randomness of a round
+    is the sha256 hash of the seed and the round number. Therefore, agents sharing the
+    seed and observing the same round produce the same randomness.
+    """
+
+    source_id = "local_beacon"
+
+    def __init__(
+        self,
+        seed: str,
+        genesis_time: int = DRAND_GENESIS_TIME,
+        period: int = DRAND_PERIOD,
+    ) -> None:
+        """Initialize the beacon."""
+        super().__init__()
+        self._seed = bytes.fromhex(seed)
+        self._genesis_time = genesis_time
+        self._period = period
+
+    def current_round(self, now: Optional[float] = None) -> int:
+        """Get the round of the beacon at the given time."""
+        now = time.time() if now is None else now
+        return drand_round_at(now, self._genesis_time, self._period)
+
+    def randomness(self, round_: int) -> str:
+        """Get the randomness of the given round."""
+        return hashlib.sha256(self._seed + round_.to_bytes(8, "big")).hexdigest()
+
+    def get_observation(
+        self, drand_round: Optional[int] = None
+    ) -> Optional[Observation]:
+        """Get the beacon of the given round, or of the current round, unless the given round is in the future."""
+        round_ = self.current_round()
+        if drand_round is not None:
+            if drand_round > round_:
+                return None
+            round_ = drand_round
+        return {"round": round_, "randomness": self.randomness(round_)}
+
+
+class StaticRandomnessSource(
+    LocalRandomnessSource
+):  # pylint: disable=too-few-public-methods
+    """An in-process source always returning the same beacon, meant for tests."""
+
+    source_id = "static"
+
+    def __init__(self, round_: int, randomness: str) -> None:
+        """Initialize the source."""
+        super().__init__()
+        self._observation = {"round": round_, "randomness": randomness}
+
+    def get_observation(
+        self, drand_round: Optional[int] = None
+    ) -> Optional[Observation]:
+        """Get the configured beacon, if it is of the given round."""
+        if drand_round is not None and drand_round != self._observation["round"]:
+            return None
+        return dict(self._observation)
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the adaptation of the pause between the periods."""
+
+from typing import Optional
+
+
+# the factor applied to the pause after a period which went through the minimal number of rounds
+SHRINK_FACTOR = 0.5
+# the factor applied to the pause after a period which needed more rounds, e.g. after a timeout
+GROWTH_FACTOR = 2.0
+# the pauses are rounded to the millisecond, so that all the agents agree on their values
+PAUSE_DECIMALS = 3
+
+
+class ResetPauseController:
+    """
+    Compute the pause of the next period from the health of the latest one.
+
+    A period is healthy if it went through the minimal number of rounds. Any retry, timeout or
+    lack of majority makes the app go through more rounds before the reset, in which case the
+    pause grows, to relieve the backpressure. Otherwise, it shrinks. The pause always stays within
+    `[min_pause, max_pause]`.
+
+    The number of rounds is taken from the synchronized data, so every agent computes the same pause.
+    If the controller is not `adaptive`, the pause is always `pause`.
+    """
+
+    def __init__(
+        self,
+        pause: float,
+        min_pause: Optional[float] = None,
+        max_pause: Optional[float] = None,
+        adaptive: bool = False,
+    ) -> None:
+        """
+        Initialize the controller.
+
+        :param pause: the pause of the first period, and of all the periods if the pause is not adaptive.
+        :param min_pause: the shortest pause. Defaults to `pause`.
+        :param max_pause: the longest pause. Defaults to `pause`.
+        :param adaptive: whether the pause adapts to the health of the periods.
+        :raises ValueError: if the pause is adaptive and the bounds do not contain it.
+        """
+        self.pause = pause
+        self.min_pause = pause if min_pause is None else min_pause
+        self.max_pause = pause if max_pause is None else max_pause
+        self.adaptive = adaptive
+        if adaptive and not 0 <= self.min_pause <= self.pause <= self.max_pause:
+            raise ValueError(
+                f"The reset pause bounds must satisfy 0 <= min ({self.min_pause}) <= "
+                f"pause ({self.pause}) <= max ({self.max_pause})."
+            )
+
+    @property
+    def longest_pause(self) -> float:
+        """Get the longest pause that a period can take."""
+        return self.max_pause if self.adaptive else self.pause
+
+    def next_pause(self, pause: Optional[float], is_healthy: Optional[bool]) -> float:
+        """
+        Get the pause of the next period.
+
+        :param pause: the pause of the latest period, or `None` if it is unknown.
+        :param is_healthy: whether the latest period was healthy, or `None` if it is unknown.
+        :return: the pause of the next period.
+        """
+        if not self.adaptive:
+            return self.pause
+        if pause is None:
+            pause = self.pause
+        if is_healthy is not None:
+            pause *= SHRINK_FACTOR if is_healthy else GROWTH_FACTOR
+        return round(min(max(pause, self.min_pause), self.max_pause), PAUSE_DECIMALS)
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the scheduling of the retries and of the hedged randomness requests."""
+
+import math
+import random
+from collections import deque
+from typing import Deque, Optional
+
+
+class BackoffPolicy:  # pylint: disable=too-few-public-methods
+    """
+    An exponential backoff with jitter.
+
+    The n-th retry waits `base_delay * backoff_factor ** n`, capped to `max_delay`. The jitter takes
+    a random fraction, of up to `jitter`, off each delay, so that the agents which failed together do not
+    all retry at the same time.
+    """
+
+    def __init__(
+        self,
+        max_delay: float,
+        jitter: float = 0.5,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        """
+        Initialize the policy.
+
+        :param max_delay: the maximum delay of a retry, in seconds.
+        :param jitter: the maximum fraction taken off a delay, between 0 and 1.
+        :param rng: the random number generator of the jitter.
+        :raises ValueError: if the configuration is invalid.
+        """
+        if max_delay <= 0:
+            raise ValueError(f"The maximum delay must be positive, got {max_delay}.")
+        if not 0 <= jitter <= 1:
+            raise ValueError(f"The jitter must be between 0 and 1, got {jitter}.")
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self._rng = random.Random() if rng is None else rng  # nosec
+
+    def delay(self, base_delay: float, backoff_factor: float, attempt: int) -> float:
+        """
+        Get the delay before a retry.
+
+        :param base_delay: the delay before the first retry, in seconds.
+        :param backoff_factor: the factor the delay grows by at each retry.
+        :param attempt: the number of retries already attempted.
+        :return: the delay, in seconds.
+        """
+        try:
+            delay = min(self.max_delay, base_delay * backoff_factor**attempt)
+        except OverflowError:
+            delay = self.max_delay
+        return delay * (1 - self.jitter * self._rng.random())
+
+
+class LatencyWindow:
+    """The latencies of the latest responses, to estimate their percentiles."""
+
+    def __init__(self, size: int = 64) -> None:
+        """
+        Initialize the window.
+
+        :param size: the number of latest latencies kept.
+        :raises ValueError: if the size is not positive.
+        """
+        if size < 1:
+            raise ValueError(f"The size of the window must be positive, got {size}.")
+        self._latencies: Deque[float] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        """Get the number of latencies kept."""
+        return len(self._latencies)
+
+    def observe(self, seconds: float) -> None:
+        """Record a latency, dropping the oldest one if the window is full."""
+        self._latencies.append(seconds)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Get a percentile of the latencies kept, with the nearest-rank method.
+
+        :param q: the percentile, between 0 and 100.
+        :return: the percentile, or `None` if no latency has been recorded.
+        """
+        if not self._latencies:
+            return None
+        ordered = sorted(self._latencies)
+        rank = max(math.ceil(q / 100 * len(ordered)), 1)
+        return ordered[min(rank, len(ordered)) - 1]
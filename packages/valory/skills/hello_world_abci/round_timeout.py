@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the tuning of the round timeouts from the observed round durations."""
+
+import math
+from typing import Dict, List, Optional
+
+
+# the number of latest durations kept for each round
+DURATIONS_WINDOW = 32
+# the number of durations of a round needed before its timeout is tuned
+MIN_DURATIONS = 8
+# the durations and the timeouts are rounded to the millisecond, so that all the agents agree on their values
+DURATION_DECIMALS = 3
+
+RoundDurations = Dict[str, List[float]]
+
+
+class RoundTimeoutController:
+    """
+    Compute the timeout of a round from the durations of its latest runs.
+
+    The timeout of a round is `multiplier` times the `percentile` of its latest durations, within
+    `[min_timeout, max_timeout]`. A round which timed out lasts at least its timeout,
+    so that a timeout which is too short grows back after consecutive timeouts.
+
+    The durations are measured between the timestamps of the blocks, and are kept in the synchronized
+    data, so every agent computes the same timeouts. Until a round has `MIN_DURATIONS` durations,
+    or if the controller is not `adaptive`, its timeout is always `timeout`.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        timeout: float,
+        min_timeout: Optional[float] = None,
+        max_timeout: Optional[float] = None,
+        percentile: int = 95,
+        multiplier: float = 3.0,
+        adaptive: bool = False,
+    ) -> None:
+        """
+        Initialize the controller.
+
+        :param timeout: the timeout of a round whose durations are not known yet, and of all the rounds if the timeout is not adaptive.
+        :param min_timeout: the shortest timeout. Defaults to `timeout`.
+        :param max_timeout: the longest timeout. Defaults to `timeout`.
+        :param percentile: the percentile of the durations the timeout is derived from, between 0 and 100.
+        :param multiplier: the factor applied to the percentile of the durations.
+        :param adaptive: whether the timeouts adapt to the durations of the rounds.
+        :raises ValueError: if the timeout is adaptive and its configuration is invalid.
+        """
+        self.timeout = timeout
+        self.min_timeout = timeout if min_timeout is None else min_timeout
+        self.max_timeout = timeout if max_timeout is None else max_timeout
+        self.percentile = percentile
+        self.multiplier = multiplier
+        self.adaptive = adaptive
+        if not adaptive:
+            return
+        if not 0 < self.min_timeout <= self.timeout <= self.max_timeout:
+            raise ValueError(
+                f"The round timeout bounds must satisfy 0 < min ({self.min_timeout}) <= "
+                f"timeout ({self.timeout}) <= max ({self.max_timeout})."
+            )
+        if not 0 <= percentile <= 100 or multiplier < 1:
+            raise ValueError(
+                f"The round timeout percentile ({percentile}) must be between 0 and 100, "
+                f"and its multiplier ({multiplier}) at least 1."
+            )
+
+    @staticmethod
+    def observe(
+        durations: Optional[RoundDurations], round_id: str, duration: float
+    ) -> RoundDurations:
+        """
+        Record the duration of a round.
+
+        :param durations: the latest durations of the rounds, which are not modified.
+        :param round_id: the id of the round.
+        :param duration: the duration of the round, in seconds.
+        :return: the latest durations of the rounds, including the given one.
+        """
+        updated = {} if durations is None else dict(durations)
+        latest = [*updated.get(round_id, []), round(duration, DURATION_DECIMALS)]
+        updated[round_id] = latest[-DURATIONS_WINDOW:]
+        return updated
+
+    def next_timeout(self, durations: Optional[RoundDurations], round_id: str) -> float:
+        """
+        Get the timeout of the next run of a round.
+
+        :param durations: the latest durations of the rounds, or `None` if they are unknown.
+        :param round_id: the id of the round.
+        :return: the timeout, in seconds.
+        """
+        latest = [] if durations is None else durations.get(round_id, [])
+        if not self.adaptive or len(latest) < MIN_DURATIONS:
+            return self.timeout
+        ordered = sorted(latest)
+        rank = max(math.ceil(self.percentile / 100 * len(ordered)), 1)
+        timeout = ordered[rank - 1] * self.multiplier
+        return round(
+            min(max(timeout, self.min_timeout), self.max_timeout), DURATION_DECIMALS
+        )
@@ -18,30 +18,61 @@
 # ------------------------------------------------------------------------------
 """This module contains the data classes for the Hello World ABCI application."""
 
+import json
 from abc import ABC
+from bisect import bisect_right, insort
+from collections import Counter
+from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional, Tuple, Type, cast
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple, Type, cast
 
 from packages.valory.skills.abstract_round_abci.base import (
+    ABCIAppInternalError,
     AbciApp,
     AbciAppTransitionFunction,
     AbstractRound,
     AppState,
     BaseSynchronizedData,
+    BaseTxPayload,
     CollectDifferentUntilAllRound,
     CollectSameUntilAllRound,
     CollectSameUntilThresholdRound,
+    TransactionNotValidError,
     get_name,
 )
+from packages.valory.skills.hello_world_abci.history import (
+    DEFAULT_HISTORY_SIZE,
+    PeriodMessages,
+    PrintedMessages,
+    PrintedMessagesHistory,
+)
+from packages.valory.skills.hello_world_abci.keeper import KeeperSelector
 from packages.valory.skills.hello_world_abci.payloads import (
     CollectRandomnessPayload,
+    NON_KEEPER_MESSAGE,
     PrintMessagePayload,
     RegistrationPayload,
     ResetPayload,
     SelectKeeperPayload,
+    parse_printed_message,
+)
+from packages.valory.skills.hello_world_abci.reset_pause import ResetPauseController
+from packages.valory.skills.hello_world_abci.round_timeout import (
+    RoundDurations,
+    RoundTimeoutController,
+)
+from packages.valory.skills.hello_world_abci.work_queue import (
+    QueuedMessage,
+    message_id,
+    parse_batch,
+    slice_of,
 )
 
 
+# the rounds of a period without retries: collect randomness, select keeper, print message and reset
+MINIMAL_PERIOD_ROUNDS = 4
+
+
 class Event(Enum):
     """Event enumeration for the Hello World ABCI demo."""
 
@@ -50,6 +81,8 @@ class Event(Enum):
     ROUND_TIMEOUT = "round_timeout"
     NO_MAJORITY = "no_majority"
     RESET_TIMEOUT = "reset_timeout"
+    KEEPER_SELECTED = "keeper_selected"
+    RANDOMNESS_COLLECTED = "randomness_collected"
 
 
 class SynchronizedData(
@@ -63,13 +96,78 @@ class SynchronizedData(
 
     @property
     def printed_messages(self) -> List[str]:
-        """Get the printed messages list."""
+        """Get the printed messages list, rendered from their stored records."""
+        return PrintedMessages.from_json(
+            self.db.get_strict("printed_messages")
+        ).render()
 
-        return cast(
-            List[str],
-            self.db.get_strict("printed_messages"),
+    @property
+    def message_history(self) -> PrintedMessagesHistory:
+        """Get the bounded history of the printed messages, which is kept across periods."""
+        return PrintedMessagesHistory.from_json(
+            self.db.get("printed_messages_history", None)
         )
 
+    def latest_printed_messages(self, n: Optional[int] = None) -> List[PeriodMessages]:
+        """Get the messages printed in the latest `n` periods, oldest first."""
+        return self.message_history.latest(n)
+
+    @property
+    def last_keeper_address(self) -> Optional[str]:
+        """Get the address of the latest selected keeper, which is kept across periods."""
+        return cast(Optional[str], self.db.get("last_keeper_address", None))
+
+    @property
+    def most_voted_keepers(self) -> Optional[Tuple[str, ...]]:
+        """Get the ordered keepers of the period, if several keepers have been selected."""
+        keepers = self.db.get("most_voted_keepers", None)
+        if keepers is None:
+            return None
+        return tuple(json.loads(keepers))
+
+    @property
+    def keepers(self) -> Tuple[str, ...]:
+        """Get the ordered keepers of the period, the first one being the `most_voted_keeper_address`."""
+        keepers = self.most_voted_keepers
+        if keepers is None:
+            return (self.most_voted_keeper_address,)
+        return keepers
+
+    @property
+    def committed_batch(self) -> List[QueuedMessage]:
+        """Get the ids and messages of the batches printed by the keepers in the current period."""
+        return parse_batch(self.db.get("committed_batch", None)) or []
+
+    @property
+    def reset_pause(self) -> Optional[float]:
+        """Get the pause of the current period, if it is adaptive."""
+        return cast(Optional[float], self.db.get("reset_pause", None))
+
+    @property
+    def period_start_round_count(self) -> Optional[int]:
+        """Get the count of the first round of the current period, if it is known."""
+        return cast(Optional[int], self.db.get("period_start_round_count", None))
+
+    @property
+    def most_voted_randomness_round(self) -> Optional[int]:
+        """Get the drand round of the randomness of the current period, if it is known."""
+        return cast(Optional[int], self.db.get("most_voted_randomness_round", None))
+
+    @property
+    def next_randomness_round(self) -> Optional[int]:
+        """Get the drand round of the randomness of the next period, if it has been agreed on in this one."""
+        return cast(Optional[int], self.db.get("next_randomness_round", None))
+
+    @property
+    def next_randomness(self) -> Optional[str]:
+        """Get the randomness of the next period, if it has been agreed on in this one."""
+        return cast(Optional[str], self.db.get("next_randomness", None))
+
+    @property
+    def round_durations(self) -> Optional[RoundDurations]:
+        """Get the latest durations of the rounds, if the round timeouts are adaptive."""
+        return cast(Optional[RoundDurations], self.db.get("round_durations", None))
+
 
 class HelloWorldABCIAbstractRound(AbstractRound, ABC):
     """Abstract round for the Hello World ABCI skill."""
@@ -81,6 +179,16 @@ class HelloWorldABCIAbstractRound(AbstractRound, ABC):
         """Return the synchronized data."""
         return cast(SynchronizedData, self._synchronized_data)
 
+    def _record_duration(
+        self, result: Optional[Tuple[BaseSynchronizedData, Enum]]
+    ) -> Optional[Tuple[BaseSynchronizedData, Enum]]:
+        """Record the duration of the round in the synchronized data it ends with, if the round timeouts are adaptive."""
+        if result is None or not HelloWorldAbciApp.timeout_controller.adaptive:
+            return result
+        synchronized_data, event = result
+        abci_app = cast(HelloWorldAbciApp, self.context.state.round_sequence.abci_app)
+        return abci_app.record_round_durations(synchronized_data), event
+
 
 class RegistrationRound(CollectSameUntilAllRound, HelloWorldABCIAbstractRound):
     """A round in which the agents get registered"""
@@ -102,7 +210,13 @@ class RegistrationRound(CollectSameUntilAllRound, HelloWorldABCIAbstractRound):
 class CollectRandomnessRound(
     CollectSameUntilThresholdRound, HelloWorldABCIAbstractRound
 ):
-    """A round for collecting randomness"""
+    """
+    A round for collecting randomness
+
+    If `select_keeper_locally` is set, the keeper is derived from the agreed randomness
+    at the end of the round, with the same selector as the `SelectKeeperBehaviour`,
+    and the app transitions straight to the `PrintMessageRound`.
+    """
 
     payload_class = CollectRandomnessPayload
     synchronized_data_class = SynchronizedData
@@ -110,11 +224,53 @@ class CollectRandomnessRound(
     none_event = Event.NONE
     no_majority_event = Event.NO_MAJORITY
     collection_key = get_name(SynchronizedData.participant_to_randomness)
-    selection_key = get_name(SynchronizedData.most_voted_randomness)
+    # the payload values are the drand round and the randomness, in that order
+    selection_key = (
+        "most_voted_randomness_round",
+        get_name(SynchronizedData.most_voted_randomness),
+    )
+    select_keeper_locally: bool = False
+    keeper_selector: KeeperSelector = KeeperSelector()
+
+    def end_block(self) -> Optional[Tuple[BaseSynchronizedData, Enum]]:
+        """Process the end of the block, selecting the keeper if it is derived locally."""
+        res = super().end_block()
+        if res is not None and self.select_keeper_locally and res[1] == Event.DONE:
+            res = (
+                self.select_keeper(
+                    cast(SynchronizedData, res[0]), self.keeper_selector
+                ),
+                Event.KEEPER_SELECTED,
+            )
+        return self._record_duration(res)
+
+    @staticmethod
+    def select_keeper(
+        synchronized_data: SynchronizedData, keeper_selector: KeeperSelector
+    ) -> SynchronizedData:
+        """Derive the keepers from the agreed randomness, storing them in the synchronized data."""
+        keepers = keeper_selector.select_keepers(
+            synchronized_data.participants,
+            synchronized_data.most_voted_randomness,
+            synchronized_data.last_keeper_address,
+        )
+        return cast(
+            SynchronizedData,
+            synchronized_data.update(
+                most_voted_keeper_address=keepers[0],
+                most_voted_keepers=None if len(keepers) == 1 else json.dumps(keepers),
+                last_keeper_address=keepers[0],
+                synchronized_data_class=SynchronizedData,
+            ),
+        )
 
 
 class SelectKeeperRound(CollectSameUntilThresholdRound, HelloWorldABCIAbstractRound):
-    """A round in a which keeper is selected"""
+    """
+    A round in a which keeper is selected
+
+    If several keepers are selected, the agents also agree on all of them, in order.
+    """
 
     payload_class = SelectKeeperPayload
     synchronized_data_class = SynchronizedData
@@ -122,48 +278,282 @@ class SelectKeeperRound(CollectSameUntilThresholdRound, HelloWorldABCIAbstractRo
     none_event = Event.NONE
     no_majority_event = Event.NO_MAJORITY
     collection_key = get_name(SynchronizedData.participant_to_selection)
-    selection_key = get_name(SynchronizedData.most_voted_keeper_address)
+    # the payload values are the first keeper and all the keepers, in that order
+    selection_key = (
+        get_name(SynchronizedData.most_voted_keeper_address),
+        get_name(SynchronizedData.most_voted_keepers),
+    )
+
+    def end_block(self) -> Optional[Tuple[BaseSynchronizedData, Enum]]:
+        """Process the end of the block, remembering the selected keeper for the next periods."""
+        res = super().end_block()
+        if res is None:
+            return None
+        synchronized_data, event = res
+        if event == Event.DONE:
+            synchronized_data = synchronized_data.update(
+                last_keeper_address=self.most_voted_payload,
+                synchronized_data_class=SynchronizedData,
+            )
+        return self._record_duration((synchronized_data, event))
 
 
 class PrintMessageRound(CollectDifferentUntilAllRound, HelloWorldABCIAbstractRound):
-    """A round in which the keeper prints the message"""
+    """
+    A round in which the keeper prints the message
+
+    The printed messages, their records and their senders are kept sorted as the payloads arrive,
+    so that the end of the block does not need to rebuild them from the collection, nor to parse the messages.
+    The messages are stored in the synchronized data as `PrintedMessages` records,
+    and appended to the history of the latest `history_size` periods.
+
+    If several keepers have been selected, each of them must print its own message, and not the message
+    of the agents which are not keepers, so the round only ends once every keeper contributed.
+
+    If `pipeline_randomness` is set, the payloads also carry the randomness of the next period.
+    If at least the consensus threshold of the agents sent the same one, it is stored in the
+    synchronized data, and the next period skips the `CollectRandomnessRound`.
+
+    The keepers may also send the batch of queued messages they printed. A batch is only valid if it is
+    within `max_batch_size` and `max_batch_bytes`, and only holds messages of the slice of its keeper.
+    The batches are committed in the synchronized data, in the order of the keepers.
+    A payload is validated once, when it is checked, and the batch parsed then is reused when it is processed.
+    """
 
     payload_class = PrintMessagePayload
+    history_size: int = DEFAULT_HISTORY_SIZE
+    pipeline_randomness: bool = False
+    max_batch_size: int = 0
+    max_batch_bytes: int = 0
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the round."""
+        super().__init__(*args, **kwargs)
+        self._sorted_messages: List[str] = []
+        # the records of the sorted messages, in the same order
+        self._printed_messages = PrintedMessages()
+        self._sorted_senders: List[str] = []
+        self._seen_messages: Set[str] = set()
+        self._next_randomness_votes: "Counter[Tuple[int, str]]" = Counter()
+        self._batches: Dict[str, List[QueuedMessage]] = {}
+        # the latest checked payload of each sender, with its parsed batch
+        self._checked_payloads: Dict[
+            str, Tuple[PrintMessagePayload, Optional[List[QueuedMessage]]]
+        ] = {}
+
+    def check_payload(self, payload: BaseTxPayload) -> None:
+        """Check Payload, keeping its parsed batch for when it is processed."""
+        payload = cast(PrintMessagePayload, payload)
+        self._checked_payloads[payload.sender] = (payload, self._validate(payload))
+
+    def process_payload(self, payload: BaseTxPayload) -> None:
+        """Process payload, inserting its message in the sorted messages."""
+        payload = cast(PrintMessagePayload, payload)
+        checked_payload, batch = self._checked_payloads.pop(
+            payload.sender, (None, None)
+        )
+        if checked_payload is not payload:
+            # the payload has not just been checked, e.g. it is processed directly
+            try:
+                batch = self._validate(payload)
+            except TransactionNotValidError as exc:
+                raise ABCIAppInternalError(exc.args[0]) from exc
+        # the payload is valid, so it is collected as by the base, without checking it again
+        self.collection[payload.sender] = payload
+        index = bisect_right(self._sorted_messages, payload.message)
+        self._sorted_messages.insert(index, payload.message)
+        self._printed_messages.insert(index, payload.message)
+        insort(self._sorted_senders, payload.sender)
+        self._seen_messages.add(payload.message)
+        if payload.next_round_id is not None and payload.next_randomness is not None:
+            self._next_randomness_votes[
+                (payload.next_round_id, payload.next_randomness)
+            ] += 1
+        if batch:
+            self._batches[payload.sender] = batch
+
+    def _validate(self, payload: PrintMessagePayload) -> Optional[List[QueuedMessage]]:
+        """Validate a payload, whose message must differ from the ones of the other agents, and get its parsed batch."""
+        if (
+            payload.sender not in self.collection
+            and payload.message in self._seen_messages
+        ):
+            raise TransactionNotValidError(
+                f"`CollectDifferentUntilAllRound` encountered a value '{(payload.message,)}' that already exists. "
+                f"All values: {[(message,) for message in self._sorted_messages]}"
+            )
+        batch = self._check_keeper_payload(payload)
+        super().check_payload(payload)
+        return batch
 
-    def end_block(self) -> Optional[Tuple[BaseSynchronizedData, Event]]:
+    def end_block(self) -> Optional[Tuple[BaseSynchronizedData, Enum]]:
         """Process the end of the block."""
         if self.collection_threshold_reached:
+            printed_messages = self._printed_messages
+            history = PrintedMessagesHistory.from_json(
+                self.synchronized_data.db.get("printed_messages_history", None),
+                self.history_size,
+            )
+            history.append(self.synchronized_data.period_count, printed_messages)
+            next_round, next_randomness = self._agreed_next_randomness()
             synchronized_data = self.synchronized_data.update(
-                participants=tuple(sorted(self.collection)),
-                printed_messages=sorted(
-                    [
-                        cast(PrintMessagePayload, payload).message
-                        for payload in self.collection.values()
-                    ]
-                ),
+                participants=tuple(self._sorted_senders),
+                printed_messages=printed_messages.to_json(),
+                printed_messages_history=history.to_json(),
+                next_randomness_round=next_round,
+                next_randomness=next_randomness,
+                committed_batch=self._committed_batch(),
                 synchronized_data_class=SynchronizedData,
             )
-            return synchronized_data, Event.DONE
+            return self._record_duration((synchronized_data, Event.DONE))
         return None
 
+    def _check_keeper_payload(
+        self, payload: PrintMessagePayload
+    ) -> Optional[List[QueuedMessage]]:
+        """Check that the keepers printed their message, and that the batches are valid, returning the batch."""
+        keepers = self.synchronized_data.most_voted_keepers
+        if keepers is not None and payload.sender in keepers:
+            fields = parse_printed_message(payload.message)
+            if (
+                payload.message if fields is None else fields["message"]
+            ) == NON_KEEPER_MESSAGE:
+                raise TransactionNotValidError(
+                    f"Keeper {payload.sender} did not print its message."
+                )
+        if payload.batch is None:
+            return None
+        return self._check_batch(payload.sender, payload.batch)
+
+    def _check_batch(self, sender: str, batch: str) -> List[QueuedMessage]:
+        """Check that a batch is a valid batch of the slice of its keeper, within the budget, and parse it."""
+        messages = parse_batch(batch)
+        if messages is None:
+            raise TransactionNotValidError(f"Invalid batch sent by {sender}.")
+        keepers = self.synchronized_data.keepers
+        if sender not in keepers:
+            raise TransactionNotValidError(
+                f"{sender} is not a keeper, and so cannot print a batch."
+            )
+        if (
+            len(messages) > self.max_batch_size
+            or len(batch.encode("utf-8")) > self.max_batch_bytes
+        ):
+            raise TransactionNotValidError(
+                f"The batch of {sender} exceeds the budget of {self.max_batch_size} messages "
+                f"and {self.max_batch_bytes} bytes."
+            )
+        index = keepers.index(sender)
+        for id_, message in messages:
+            if id_ != message_id(message) or slice_of(id_, len(keepers)) != index:
+                raise TransactionNotValidError(
+                    f"The batch of {sender} holds the message {id_!r}, which is not of its slice."
+                )
+        return messages
+
+    def _committed_batch(self) -> Optional[str]:
+        """Get the batches of the keepers, in their order, as a json list of their ids and messages."""
+        if not self._batches:
+            return None
+        keepers = self.synchronized_data.keepers
+        return json.dumps(
+            [message for keeper in keepers for message in self._batches.get(keeper, [])]
+        )
+
+    def _agreed_next_randomness(self) -> Tuple[Optional[int], Optional[str]]:
+        """Get the drand round and the randomness of the next period, if enough agents agree on them."""
+        if not self.pipeline_randomness or not self._next_randomness_votes:
+            return None, None
+        next_randomness, n_votes = self._next_randomness_votes.most_common(1)[0]
+        if n_votes < self.synchronized_data.consensus_threshold:
+            return None, None
+        return next_randomness
+
 
 class ResetAndPauseRound(CollectSameUntilThresholdRound, HelloWorldABCIAbstractRound):
-    """A round that represents that consensus is reached (the final round)"""
+    """
+    A round that represents that consensus is reached (the final round)
+
+    If the `pause_controller` is adaptive, the pause of the next period is computed
+    from the number of rounds the period went through, and stored in the synchronized data.
+
+    If the randomness of the next period has been agreed on in the `PrintMessageRound`, it is carried over
+    to the next period, which then starts from the `SelectKeeperRound`, or from the `PrintMessageRound`
+    if the keeper is derived locally. A randomness which is not of a later drand round than the randomness
+    of the current period, or which is the same, is discarded, as the next period would draw the same keeper,
+    and the next period collects its randomness instead.
+    """
 
     payload_class = ResetPayload
     _allow_rejoin_payloads = True
     synchronized_data_class = SynchronizedData
+    pause_controller: ResetPauseController = ResetPauseController(10)
 
     def end_block(self) -> Optional[Tuple[BaseSynchronizedData, Event]]:
         """Process the end of the block."""
         if self.threshold_reached:
-            return self.synchronized_data.create(), Event.DONE
+            if not self.pause_controller.adaptive:
+                return self._create_next_period()
+            next_pause = self.pause_controller.next_pause(
+                self.synchronized_data.reset_pause, self._is_period_healthy()
+            )
+            # the next round is the first one of the next period
+            next_start = self.synchronized_data.round_count + 1
+            synchronized_data, event = self._create_next_period()
+            synchronized_data = synchronized_data.update(
+                reset_pause=next_pause,
+                period_start_round_count=next_start,
+                synchronized_data_class=SynchronizedData,
+            )
+            return synchronized_data, event
         if not self.is_majority_possible(
             self.collection, self.synchronized_data.nb_participants
         ):
             return self.synchronized_data, Event.NO_MAJORITY
         return None
 
+    def _create_next_period(self) -> Tuple[BaseSynchronizedData, Event]:
+        """Create the synchronized data of the next period, carrying over the randomness agreed on for it, if any."""
+        next_round = self.synchronized_data.next_randomness_round
+        next_randomness = self.synchronized_data.next_randomness
+        current_round = self.synchronized_data.most_voted_randomness_round
+        current_randomness = self.synchronized_data.db.get(
+            "most_voted_randomness", None
+        )
+        synchronized_data = self.synchronized_data.create()
+        if (
+            next_round is None
+            or next_randomness is None
+            or next_randomness == current_randomness
+            or (current_round is not None and next_round <= current_round)
+        ):
+            return synchronized_data, Event.DONE
+        synchronized_data = synchronized_data.update(
+            most_voted_randomness_round=next_round,
+            most_voted_randomness=next_randomness,
+            synchronized_data_class=SynchronizedData,
+        )
+        if not CollectRandomnessRound.select_keeper_locally:
+            return synchronized_data, Event.RANDOMNESS_COLLECTED
+        return (
+            CollectRandomnessRound.select_keeper(
+                cast(SynchronizedData, synchronized_data),
+                CollectRandomnessRound.keeper_selector,
+            ),
+            Event.KEEPER_SELECTED,
+        )
+
+    def _is_period_healthy(self) -> Optional[bool]:
+        """Check whether the period went through the minimal number of rounds, if its first round is known."""
+        start = self.synchronized_data.period_start_round_count
+        if start is None:
+            return None
+        n_rounds = self.synchronized_data.round_count - start + 1
+        minimal_rounds = MINIMAL_PERIOD_ROUNDS - int(
+            CollectRandomnessRound.select_keeper_locally
+        )
+        return n_rounds <= minimal_rounds
+
 
 class HelloWorldAbciApp(AbciApp[Event]):
     """HelloWorldAbciApp
@@ -177,6 +567,7 @@ class HelloWorldAbciApp(AbciApp[Event]):
             - done: 1.
         1. CollectRandomnessRound
             - done: 2.
+            - keeper selected: 3.
             - none: 1.
             - no majority: 1.
             - round timeout: 1.
@@ -190,6 +581,8 @@ class HelloWorldAbciApp(AbciApp[Event]):
             - round timeout: 0.
         4. ResetAndPauseRound
             - done: 1.
+            - randomness collected: 2.
+            - keeper selected: 3.
             - no majority: 0.
             - reset timeout: 0.
 
@@ -207,6 +600,7 @@ class HelloWorldAbciApp(AbciApp[Event]):
         },
         CollectRandomnessRound: {
             Event.DONE: SelectKeeperRound,
+            Event.KEEPER_SELECTED: PrintMessageRound,
             Event.NONE: CollectRandomnessRound,
             Event.NO_MAJORITY: CollectRandomnessRound,
             Event.ROUND_TIMEOUT: CollectRandomnessRound,
@@ -223,6 +617,8 @@ class HelloWorldAbciApp(AbciApp[Event]):
         },
         ResetAndPauseRound: {
             Event.DONE: CollectRandomnessRound,
+            Event.RANDOMNESS_COLLECTED: SelectKeeperRound,
+            Event.KEEPER_SELECTED: PrintMessageRound,
             Event.NO_MAJORITY: RegistrationRound,
             Event.RESET_TIMEOUT: RegistrationRound,
         },
@@ -231,3 +627,96 @@ class HelloWorldAbciApp(AbciApp[Event]):
         Event.ROUND_TIMEOUT: 30.0,
         Event.RESET_TIMEOUT: 30.0,
     }
+    cross_period_persisted_keys: FrozenSet[str] = frozenset(
+        {
+            "printed_messages_history",
+            get_name(SynchronizedData.last_keeper_address),
+            get_name(SynchronizedData.round_durations),
+        }
+    )
+    timeout_controller: RoundTimeoutController = RoundTimeoutController(30.0)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the app."""
+        super().__init__(*args, **kwargs)
+        # the timestamp of the block at which the current round started
+        self._round_started_at: Optional[datetime] = None
+        # the rounds which timed out since the durations were last recorded, and their durations
+        self._timed_out_rounds: List[Tuple[str, float]] = []
+
+    def schedule_round(self, round_cls: AppState) -> None:
+        """
+        Schedule a round.
+
+        If the `timeout_controller` is adaptive, the round timeout of the round is computed from
+        its latest durations, which are read from the synchronized data, and the app schedules the round
+        with its own timeouts, instead of the ones of its class.
+
+        :param round_cls: the class of the round.
+        """
+        if self.timeout_controller.adaptive:
+            durations = SynchronizedData(self.synchronized_data.db).round_durations
+            self.event_to_timeout = {
+                **type(self).event_to_timeout,
+                Event.ROUND_TIMEOUT: self.timeout_controller.next_timeout(
+                    durations, round_cls.auto_round_id()
+                ),
+            }
+        self._round_started_at = self._last_timestamp
+        super().schedule_round(round_cls)
+
+    def _round_duration(self) -> Optional[float]:
+        """Get the time between the block at which the current round started and the latest block, if they are known."""
+        if self._round_started_at is None or self._last_timestamp is None:
+            return None
+        return (self._last_timestamp - self._round_started_at).total_seconds()
+
+    def record_round_durations(
+        self, synchronized_data: BaseSynchronizedData
+    ) -> BaseSynchronizedData:
+        """
+        Record the duration of the current round in the synchronized data it ends with.
+
+        It is called by the `end_block` of the rounds which can time out, so that the durations are stored
+        as part of the result of the round. The durations of the rounds which timed out since then are recorded too.
+        The durations are measured between the timestamps of the blocks, which all the agents agree on.
+
+        :param synchronized_data: the synchronized data the current round ends with.
+        :return: the synchronized data, with the durations of the rounds if the round timeouts are adaptive.
+        """
+        observed, self._timed_out_rounds = self._timed_out_rounds, []
+        duration = self._round_duration()
+        if self._current_round_cls is not None and duration is not None:
+            observed.append((self._current_round_cls.auto_round_id(), duration))
+        if not self.timeout_controller.adaptive or not observed:
+            return synchronized_data
+        durations = SynchronizedData(synchronized_data.db).round_durations
+        for round_id, round_duration in observed:
+            durations = self.timeout_controller.observe(
+                durations, round_id, round_duration
+            )
+        return synchronized_data.update(round_durations=durations)
+
+    def process_event(
+        self, event: Event, result: Optional[BaseSynchronizedData] = None
+    ) -> None:
+        """
+        Process a round event.
+
+        A round which times out has no result to record its duration in, so if the `timeout_controller`
+        is adaptive, its duration is kept until the next round which records its own.
+
+        :param event: the event.
+        :param result: the synchronized data of the round which ends.
+        """
+        duration = self._round_duration()
+        if (
+            self.timeout_controller.adaptive
+            and event == Event.ROUND_TIMEOUT
+            and self._current_round_cls is not None
+            and duration is not None
+        ):
+            self._timed_out_rounds.append(
+                (self._current_round_cls.auto_round_id(), duration)
+            )
+        super().process_event(event, result)
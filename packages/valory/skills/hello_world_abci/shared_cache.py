@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the randomness cache shared by the agents running on the same host."""
+
+import json
+import os
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from packages.valory.skills.hello_world_abci.randomness import (
+    Observation,
+    is_valid_observation,
+)
+
+
+BEACON_FILE_PREFIX = "round_"
+BEACON_FILE_SUFFIX = ".json"
+LEASE_FILE_SUFFIX = ".lease"
+
+
+class SharedRandomnessCache:
+    """
+    A cache of drand beacons, stored as json files in a directory shared by the agents of a host.
+
+    A beacon is stored in the file of its drand round. It is written to a temporary file which is then
+    renamed, so that a reader sees either the whole beacon or no file at all, and no lock is needed.
+    Before fetching the beacon of a round, an agent takes the lease of the round, so that the other agents
+    wait for its beacon instead of fetching it too. A lease older than `lease_timeout` is considered
+    abandoned, and so an agent which fails or crashes while fetching only delays the others.
+    A lease holds the id of its owner, and an agent only releases the leases it owns, while the abandoned
+    leases and the leases of the rounds before a stored beacon are removed by any agent.
+    Only the latest `keep` beacons are kept.
+    """
+
+    def __init__(
+        self, directory: str, keep: int = 4, lease_timeout: float = 5.0
+    ) -> None:
+        """
+        Initialize the cache.
+
+        :param directory: the shared directory, created if it does not exist.
+        :param keep: the number of beacons kept.
+        :param lease_timeout: the time after which a lease is considered abandoned, in seconds.
+        :raises ValueError: if the configuration is invalid.
+        """
+        if keep < 1:
+            raise ValueError(
+                f"The number of kept beacons must be positive, got {keep}."
+            )
+        if lease_timeout <= 0:
+            raise ValueError(
+                f"The lease timeout must be positive, got {lease_timeout}."
+            )
+        self.directory = Path(directory)
+        self.keep = keep
+        self.lease_timeout = lease_timeout
+        # the id written to the leases taken by this cache, unique among the agents of the host
+        self.owner = f"{os.getpid()}-{uuid.uuid4().hex}"
+
+    def _path(self, drand_round: int) -> Path:
+        """Get the path of the beacon of a round."""
+        # the rounds are zero padded, so that the names sort as the rounds
+        return self.directory / (
+            f"{BEACON_FILE_PREFIX}{drand_round:012d}{BEACON_FILE_SUFFIX}"
+        )
+
+    def _lease(self, drand_round: int) -> Path:
+        """Get the path of the lease of a round."""
+        return self._path(drand_round).with_suffix(LEASE_FILE_SUFFIX)
+
+    def _rounds(self) -> List[Tuple[int, Path]]:
+        """Get the rounds of the stored beacons and their paths, latest first."""
+        if not self.directory.is_dir():
+            return []
+        rounds = []
+        for path in self.directory.glob(f"{BEACON_FILE_PREFIX}*{BEACON_FILE_SUFFIX}"):
+            try:
+                rounds.append((int(path.stem[len(BEACON_FILE_PREFIX) :]), path))
+            except ValueError:
+                continue
+        return sorted(rounds, reverse=True)
+
+    def load(
+        self, min_round: int, max_round: Optional[int] = None
+    ) -> Optional[Observation]:
+        """
+        Load the latest stored beacon whose round is within the given ones.
+
+        :param min_round: the minimum round of the beacon.
+        :param max_round: the maximum round of the beacon, if any.
+        :return: the beacon, or `None` if no readable beacon of a round within the given ones is stored.
+        """
+        for drand_round, path in self._rounds():
+            if max_round is not None and drand_round > max_round:
+                continue
+            if drand_round < min_round:
+                return None
+            try:
+                observation = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                # the beacon may have been removed by another agent since it was listed
+                continue
+            if (
+                is_valid_observation(observation)
+                and observation["round"] == drand_round
+            ):
+                return observation
+        return None
+
+    def store(self, observation: Observation) -> None:
+        """
+        Store a beacon, removing the ones which are no longer kept and releasing the lease of its round.
+
+        :param observation: the beacon.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        drand_round = observation["round"]
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(observation, file)
+            os.replace(tmp_path, self._path(drand_round))
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        self.release(drand_round)
+        # the agents may remove the same stale files concurrently
+        for _, stale in self._rounds()[self.keep :]:
+            stale.unlink(missing_ok=True)
+        for lease in self.directory.glob(f"{BEACON_FILE_PREFIX}*{LEASE_FILE_SUFFIX}"):
+            if lease.stem < self._path(drand_round).stem:
+                lease.unlink(missing_ok=True)
+
+    def acquire(self, drand_round: int, exact: bool = False) -> bool:
+        """
+        Take the lease of the fetch of a round, unless another agent holds it or a usable beacon is already stored.
+
+        An abandoned lease is taken over. Two agents which take over the same abandoned lease at once
+        may both get it, in which case both fetch the beacon, as without the shared cache.
+
+        :param drand_round: the round.
+        :param exact: whether only the beacon of the round is usable, instead of any beacon of a later round too.
+        :return: whether the lease has been taken, and so the beacon has to be fetched.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        lease = self._lease(drand_round)
+        for _ in range(2):
+            try:
+                fd = os.open(lease, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                try:
+                    age = time.time() - lease.stat().st_mtime
+                except FileNotFoundError:
+                    # released in the meantime
+                    continue
+                if age < self.lease_timeout:
+                    return False
+                lease.unlink(missing_ok=True)
+                continue
+            os.write(fd, self.owner.encode("utf-8"))
+            os.close(fd)
+            # the beacon is stored before the lease is released, so it is checked after the lease is taken
+            if self.load(drand_round, drand_round if exact else None) is not None:
+                self.release(drand_round)
+                return False
+            return True
+        return False
+
+    def release(self, drand_round: int) -> None:
+        """Release the lease of the fetch of a round, if this cache owns it."""
+        lease = self._lease(drand_round)
+        try:
+            owner = lease.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return
+        if owner == self.owner:
+            lease.unlink(missing_ok=True)
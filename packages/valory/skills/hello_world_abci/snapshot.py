@@ -0,0 +1,256 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the snapshots of the synchronized data taken at the period boundaries."""
+
+import json
+import os
+import tempfile
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from packages.valory.skills.abstract_round_abci.base import RoundSequence
+from packages.valory.skills.hello_world_abci.history import PrintedMessages
+
+
+SNAPSHOT_VERSION = 3
+SNAPSHOT_FILE_PREFIX = "snapshot_"
+SNAPSHOT_FILE_SUFFIX = ".json"
+
+
+@dataclass(frozen=True)
+class PeriodSnapshot:  # pylint: disable=too-many-instance-attributes
+    """
+    The state of the app at the first block of a period.
+
+    The snapshot keeps the outcome of the previous period, i.e. its participants, randomness, keeper
+    and printed messages, and the serialized database the synchronized data is read from.
+    Restoring the database, instead of rebuilding it from the outcome, gives back the exact app hash,
+    so that Tendermint only replays the blocks committed after the snapshot.
+    The snapshot also keeps the chain id and the genesis time of the chain it was taken on,
+    and is only restored on the same chain.
+
+    The round transition of the snapshot block, i.e. its height, Tendermint height, timestamp and root hash,
+    is restored as well. The blocks themselves are not kept: the restored blockchain starts empty
+    at the height of the snapshot, so that `RoundSequence.last_timestamp` and `Blockchain.last_block`
+    are only available again once the next block is committed.
+    """
+
+    chain_id: str
+    genesis_time: str
+    height: int
+    tm_height: int
+    round_count: int
+    round_id: str
+    timestamp: datetime
+    period_count: int
+    participants: Tuple[str, ...]
+    most_voted_randomness: Optional[str]
+    most_voted_keeper_address: Optional[str]
+    printed_messages: List[str]
+    serialized_db: str
+
+    @classmethod
+    def take(
+        cls, round_sequence: RoundSequence, chain_id: str, genesis_time: str
+    ) -> "PeriodSnapshot":
+        """
+        Take a snapshot of the state of a round sequence.
+
+        The snapshot is only consistent at the block where the current round started,
+        as the payloads collected by a round are not stored in the database until it ends,
+        and the round transition of the snapshot block is the last one of the round sequence.
+
+        :param round_sequence: the round sequence.
+        :param chain_id: the id of the chain.
+        :param genesis_time: the genesis time of the chain.
+        :return: the snapshot.
+        """
+        synchronized_data = round_sequence.latest_synchronized_data
+        db = synchronized_data.db
+        period_count = synchronized_data.period_count
+        previous = db.get_latest_from_reset_index(period_count - 1)
+        printed_messages = previous.get("printed_messages", None)
+        return cls(
+            chain_id=chain_id,
+            genesis_time=genesis_time,
+            height=round_sequence.height,
+            tm_height=round_sequence.last_round_transition_tm_height,
+            round_count=synchronized_data.round_count,
+            round_id=str(round_sequence.current_round_id),
+            timestamp=round_sequence.abci_app.last_timestamp,
+            period_count=period_count,
+            participants=tuple(sorted(synchronized_data.participants)),
+            most_voted_randomness=previous.get("most_voted_randomness", None),
+            most_voted_keeper_address=previous.get("most_voted_keeper_address", None),
+            printed_messages=(
+                []
+                if printed_messages is None
+                else PrintedMessages.from_json(printed_messages).render()
+            ),
+            serialized_db=db.serialize(),
+        )
+
+    def restore(
+        self, round_sequence: RoundSequence, chain_id: str, genesis_time: str
+    ) -> None:
+        """
+        Restore the state of a round sequence which has not received any block yet.
+
+        :param round_sequence: the round sequence.
+        :param chain_id: the id of the chain of the round sequence.
+        :param genesis_time: the genesis time of the chain of the round sequence.
+        :raises ValueError: if the snapshot was taken on another chain,
+            or if the round of the snapshot is not a round of the app.
+        """
+        if (self.chain_id, self.genesis_time) != (chain_id, genesis_time):
+            raise ValueError(
+                f"The snapshot was taken on chain {self.chain_id!r} with genesis time {self.genesis_time!r}, "
+                f"expected chain {chain_id!r} with genesis time {genesis_time!r}."
+            )
+        abci_app = round_sequence.abci_app
+        round_id_to_cls = {
+            cls.auto_round_id(): cls for cls in abci_app.transition_function
+        }
+        round_cls = round_id_to_cls.get(self.round_id, None)
+        if round_cls is None:
+            raise ValueError(f"Unknown round {self.round_id!r} in the snapshot.")
+        round_sequence.init_chain(self.height + 1)
+        round_sequence.sync_db_and_slashing(self.serialized_db)
+        # the round count is incremented when the round is scheduled
+        abci_app.synchronized_data.db.round_count = self.round_count - 1
+        # the timeouts of the round are scheduled from the time of the snapshot
+        abci_app.update_time(self.timestamp)
+        abci_app.schedule_round(round_cls)
+        # the round transition of the snapshot block, as recorded by `RoundSequence._update_round`
+        round_sequence.tm_height = self.tm_height
+        round_sequence._last_round_transition_timestamp = (  # pylint: disable=protected-access
+            self.timestamp
+        )
+        round_sequence._last_round_transition_height = (  # pylint: disable=protected-access
+            self.height
+        )
+        round_sequence._last_round_transition_root_hash = (  # pylint: disable=protected-access
+            round_sequence.root_hash
+        )
+        round_sequence._last_round_transition_tm_height = (  # pylint: disable=protected-access
+            self.tm_height
+        )
+
+    def to_json(self) -> Dict[str, Any]:
+        """Get a json serializable representation of the snapshot."""
+        data = asdict(self)
+        data["timestamp"] = self.timestamp.isoformat()
+        data["participants"] = list(self.participants)
+        return {"version": SNAPSHOT_VERSION, **data}
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "PeriodSnapshot":
+        """
+        Load a snapshot from its json representation.
+
+        :param data: the json representation of the snapshot.
+        :return: the snapshot.
+        :raises ValueError: if the representation is not a snapshot of a supported version.
+        """
+        if not isinstance(data, dict):
+            raise ValueError(f"Invalid snapshot: {data!r}")
+        data = dict(data)
+        version = data.pop("version", None)
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(
+                f"Unsupported snapshot version {version}, expected {SNAPSHOT_VERSION}."
+            )
+        try:
+            data["timestamp"] = datetime.fromisoformat(data["timestamp"])
+            data["participants"] = tuple(data["participants"])
+            return cls(**data)
+        except (KeyError, TypeError) as exc:
+            raise ValueError(f"Invalid snapshot: {exc}") from exc
+
+
+class SnapshotStore:
+    """
+    The snapshots of an agent, stored as json files in a directory.
+
+    A snapshot is written to a temporary file which is then renamed,
+    so that a crash while saving never leaves a partial snapshot behind.
+    Only the latest `keep` snapshots are kept.
+    """
+
+    def __init__(self, directory: str, keep: int = 2) -> None:
+        """
+        Initialize the store.
+
+        :param directory: the directory of the snapshots, created if it does not exist.
+        :param keep: the number of snapshots kept.
+        :raises ValueError: if the number of snapshots kept is not positive.
+        """
+        if keep < 1:
+            raise ValueError(
+                f"The number of kept snapshots must be positive, got {keep}."
+            )
+        self.directory = Path(directory)
+        self.keep = keep
+
+    def _paths(self) -> List[Path]:
+        """Get the paths of the stored snapshots, latest first."""
+        if not self.directory.is_dir():
+            return []
+        return sorted(
+            self.directory.glob(f"{SNAPSHOT_FILE_PREFIX}*{SNAPSHOT_FILE_SUFFIX}"),
+            reverse=True,
+        )
+
+    def save(self, snapshot: PeriodSnapshot) -> Path:
+        """
+        Save a snapshot, removing the ones which are no longer kept.
+
+        :param snapshot: the snapshot.
+        :return: the path of the saved snapshot.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # the heights are zero padded, so that the names sort as the heights
+        path = self.directory / (
+            f"{SNAPSHOT_FILE_PREFIX}{snapshot.height:012d}{SNAPSHOT_FILE_SUFFIX}"
+        )
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(snapshot.to_json(), file)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        for stale in self._paths()[self.keep :]:
+            stale.unlink()
+        return path
+
+    def latest(self) -> Optional[PeriodSnapshot]:
+        """Load the latest snapshot, skipping the ones which cannot be read."""
+        for path in self._paths():
+            try:
+                return PeriodSnapshot.from_json(
+                    json.loads(path.read_text(encoding="utf-8"))
+                )
+            except (OSError, ValueError):
+                continue
+        return None
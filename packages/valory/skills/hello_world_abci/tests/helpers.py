@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Helpers to drive a round sequence of the app through blocks and periods in the tests."""
+
+# pylint: skip-file
+
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Callable, Optional, Tuple, Union, cast
+from unittest import mock
+
+from packages.valory.skills.abstract_round_abci.base import AbciAppDB, RoundSequence
+from packages.valory.skills.hello_world_abci.history import PrintedMessages
+from packages.valory.skills.hello_world_abci.rounds import (
+    Event,
+    HelloWorldAbciApp,
+    SynchronizedData,
+)
+
+
+PARTICIPANTS = ("agent_0", "agent_1", "agent_2", "agent_3")
+GENESIS = datetime(2023, 1, 1)
+CHAIN_ID = "chain-c4daS1"
+GENESIS_TIME = "2022-05-20T16:00:21.735122717Z"
+
+
+def new_round_sequence() -> RoundSequence:
+    """Get a round sequence of the app, which has not received any block yet."""
+    context = mock.MagicMock()
+    round_sequence = RoundSequence(context, HelloWorldAbciApp)
+    # the rounds reach the app through the shared state
+    context.state.round_sequence = round_sequence
+    db = AbciAppDB(
+        setup_data=AbciAppDB.data_to_lists(
+            dict(
+                participants=PARTICIPANTS,
+                all_participants=PARTICIPANTS,
+                consensus_threshold=3,
+                safe_contract_address="0x0",
+            )
+        ),
+        cross_period_persisted_keys=HelloWorldAbciApp.cross_period_persisted_keys,
+    )
+    round_sequence.setup(SynchronizedData(db), logging.getLogger("test"))
+    return round_sequence
+
+
+RoundResult = Tuple[Any, Event]
+
+
+def commit_block(
+    round_sequence: RoundSequence,
+    result: Optional[Union[RoundResult, Callable[[], RoundResult]]] = None,
+    commit: Optional[Callable[[], Any]] = None,
+) -> None:
+    """Commit an empty block, ending the current round with the given result, or the one computed at the end of the block."""
+    height = round_sequence.height + 1
+    header = mock.MagicMock(
+        height=height, timestamp=GENESIS + timedelta(seconds=height)
+    )
+    round_sequence.begin_block(header, mock.MagicMock(), mock.MagicMock())
+    round_sequence.end_block()
+    round_sequence.tm_height = height
+    with mock.patch.object(
+        RoundSequence,
+        "_get_round_result",
+        side_effect=result if callable(result) else lambda: result,
+    ):
+        if commit is None:
+            round_sequence.commit()
+        else:
+            commit()
+
+
+def end_round(
+    round_sequence: RoundSequence, synchronized_data: Any, event: Event
+) -> Callable[[], RoundResult]:
+    """Get the result of a round which can time out, recording its duration at the end of the block as its `end_block` does."""
+    return lambda: (
+        cast(HelloWorldAbciApp, round_sequence.abci_app).record_round_durations(
+            synchronized_data
+        ),
+        event,
+    )
+
+
+def run_period(
+    round_sequence: RoundSequence,
+    period: int,
+    commit: Optional[Callable[[], Any]] = None,
+) -> None:
+    """Go through a period, from the `CollectRandomnessRound` to the first block of the next period."""
+    synchronized_data = round_sequence.latest_synchronized_data
+    commit_block(round_sequence, commit=commit)
+    synchronized_data = synchronized_data.update(
+        most_voted_randomness=f"{period:064x}",
+        most_voted_keeper_address=PARTICIPANTS[period % len(PARTICIPANTS)],
+        printed_messages=PrintedMessages.from_messages([f"message {period}"]).to_json(),
+    )
+    for event in (Event.KEEPER_SELECTED, Event.DONE):
+        commit_block(
+            round_sequence, end_round(round_sequence, synchronized_data, event), commit
+        )
+    # the next period is only created when the reset round ends
+    commit_block(round_sequence, (synchronized_data.create(), Event.DONE), commit)
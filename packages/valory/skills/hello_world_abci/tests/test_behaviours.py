@@ -23,10 +23,14 @@
 
 import json
 import time
+from concurrent.futures import Future
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Type, cast
+from typing import Any, List, Type, cast
 from unittest import mock
 
+import pytest
+from aea.protocols.base import Message
 from aea.skills.base import SkillContext
 
 from packages.valory.skills.abstract_round_abci.base import AbciAppDB
@@ -37,15 +41,24 @@ from packages.valory.skills.abstract_round_abci.test_tools.base import (
 from packages.valory.skills.hello_world_abci import PUBLIC_ID
 from packages.valory.skills.hello_world_abci.behaviours import (
     CollectRandomnessBehaviour,
+    HelloWorldRoundBehaviour,
     PrintMessageBehaviour,
     RegistrationBehaviour,
     ResetAndPauseBehaviour,
     SelectKeeperBehaviour,
 )
+from packages.valory.skills.hello_world_abci.http_pool import PooledHttpClient
+from packages.valory.skills.hello_world_abci.models import BenchmarkTool
+from packages.valory.skills.hello_world_abci.output import OutputSink, OutputTarget
+from packages.valory.skills.hello_world_abci.randomness import StaticRandomnessSource
 from packages.valory.skills.hello_world_abci.rounds import Event, SynchronizedData
+from packages.valory.skills.hello_world_abci.shared_cache import SharedRandomnessCache
+from packages.valory.skills.hello_world_abci.work_queue import MessageQueue, message_id
 
 
 PACKAGE_DIR = Path(__file__).parent.parent
+POLL_INTERVAL = 0.05
+RANDOMNESS = "04d4866c26e03347d2431caa82ab2d7b7bdbec8b58bca9460c96f5265d878feb"
 
 
 def test_skill_public_id() -> None:
@@ -83,6 +96,25 @@ class HelloWorldAbciFSMBehaviourBaseCase(FSMBehaviourBaseCase):
         """Ends round early to cover `wait_for_end` generator."""
         super().end_round(Event.DONE)
 
+    def _respond_to_http_request(self, request: Message, body: bytes) -> None:
+        """Deliver a successful response to an http request taken from the outbox."""
+        self.http_handler.handle(
+            self.build_incoming_message(
+                message_type=type(request),
+                dialogue_reference=(request.dialogue_reference[0], "stub"),
+                performative=cast(Any, request).Performative.RESPONSE,
+                target=request.message_id,
+                message_id=-1,
+                to=str(self.skill.skill_context.skill_id),
+                sender=request.to,
+                version="",
+                status_code=200,
+                status_text="",
+                headers="",
+                body=body,
+            )
+        )
+
 
 class BaseCollectRandomnessBehaviourTest(HelloWorldAbciFSMBehaviourBaseCase):
     """Test CollectRandomnessBehaviour."""
@@ -172,6 +204,385 @@ class BaseCollectRandomnessBehaviourTest(HelloWorldAbciFSMBehaviourBaseCase):
         time.sleep(1)
         self.behaviour.act_wrapper()
 
+    def test_race_mirrors(
+        self,
+    ) -> None:
+        """Test that the first valid response among the randomness api and its mirrors is used."""
+        mirror_url = "https://api.drand.sh/public/latest"
+        self.fast_forward_to_behaviour(
+            self.behaviour,
+            self.collect_randomness_behaviour_class.auto_behaviour_id(),
+            self.synchronized_data,
+        )
+        with mock.patch.object(
+            self.behaviour.context.randomness_sources, "mirrors", [mirror_url]
+        ):
+            self.behaviour.act_wrapper()
+
+        self.assert_quantity_in_outbox(2)
+        requests = [self.get_message_from_outbox() for _ in range(2)]
+        assert sorted(cast(Any, msg).url for msg in requests) == sorted(
+            ["https://drand.cloudflare.com/public/latest", mirror_url]
+        )
+        bodies = (
+            b"",
+            json.dumps({"round": 1283255, "randomness": RANDOMNESS}).encode("utf-8"),
+        )
+        for request, body in zip(requests, bodies):
+            assert request is not None
+            self._respond_to_http_request(request, body)
+
+        self.behaviour.act_wrapper()
+        self.mock_a2a_transaction()
+        self._test_done_flag_set()
+        self.end_round()
+
+        behaviour = cast(BaseBehaviour, self.behaviour.current_behaviour)
+        assert behaviour.behaviour_id == self.next_behaviour_class.auto_behaviour_id()
+
+    def test_pooled_http(
+        self,
+    ) -> None:
+        """Test that the randomness is requested through the pooled http client, if it is enabled."""
+        self.fast_forward_to_behaviour(
+            self.behaviour,
+            self.collect_randomness_behaviour_class.auto_behaviour_id(),
+            self.synchronized_data,
+        )
+        client = PooledHttpClient()
+        response = PooledHttpClient._to_message(
+            200,
+            "OK",
+            {},
+            json.dumps({"round": 1283255, "randomness": RANDOMNESS}).encode("utf-8"),
+        )
+        pooled_http = self.behaviour.context.pooled_http
+        with mock.patch.object(pooled_http, "client", client), mock.patch.object(
+            client, "_send", return_value=response
+        ) as send:
+            self.behaviour.act_wrapper()
+            send.assert_called_once_with(
+                "GET", "https://drand.cloudflare.com/public/latest"
+            )
+            self.assert_quantity_in_outbox(0)
+            while client._responses.empty():
+                time.sleep(0.001)
+            self.behaviour.act_wrapper()
+            assert client.pending == 0
+        client.close()
+
+        self.mock_a2a_transaction()
+        self._test_done_flag_set()
+        self.end_round()
+
+        behaviour = cast(BaseBehaviour, self.behaviour.current_behaviour)
+        assert behaviour.behaviour_id == self.next_behaviour_class.auto_behaviour_id()
+
+    def test_hedged_requests(
+        self,
+    ) -> None:
+        """Test that the requests are sent once more if none of them has answered in time."""
+        self.fast_forward_to_behaviour(
+            self.behaviour,
+            self.collect_randomness_behaviour_class.auto_behaviour_id(),
+            self.synchronized_data,
+        )
+        retries = self.behaviour.context.randomness_retries
+        with mock.patch.object(retries, "hedge_delay", return_value=0.0):
+            self.behaviour.act_wrapper()
+            time.sleep(0.01)
+            self.behaviour.act_wrapper()
+
+        self.assert_quantity_in_outbox(2)
+        requests = [self.get_message_from_outbox() for _ in range(2)]
+        bodies = (
+            json.dumps({"round": 1283255, "randomness": RANDOMNESS}).encode("utf-8"),
+            b"",
+        )
+        n_latencies = len(retries.latencies)
+        for request, body in zip(requests, bodies):
+            assert request is not None
+            self._respond_to_http_request(request, body)
+
+        self.behaviour.act_wrapper()
+        assert len(retries.latencies) == n_latencies + 1
+        self.mock_a2a_transaction()
+        self._test_done_flag_set()
+        self.end_round()
+
+        behaviour = cast(BaseBehaviour, self.behaviour.current_behaviour)
+        assert behaviour.behaviour_id == self.next_behaviour_class.auto_behaviour_id()
+
+    def test_no_retry_after_round_timeout(
+        self,
+    ) -> None:
+        """Test that a retry which would start after the round has timed out is not attempted."""
+        self.fast_forward_to_behaviour(
+            self.behaviour,
+            self.collect_randomness_behaviour_class.auto_behaviour_id(),
+            self.synchronized_data,
+        )
+        backoff = self.behaviour.context.randomness_retries.backoff
+        with mock.patch.object(
+            backoff,
+            "delay",
+            return_value=self.behaviour.context.params.round_timeout_seconds + 1,
+        ) as delay:
+            self.behaviour.act_wrapper()
+            request = self.get_message_from_outbox()
+            assert request is not None
+            self._respond_to_http_request(request, b"")
+            self.behaviour.act_wrapper()
+
+        delay.assert_called_once_with(1, 2.0, 0)
+        self._test_done_flag_set()
+        assert self.behaviour.context.randomness_api.retries_info.retries_attempted == 0
+
+    def test_no_retry_after_adaptive_round_timeout(
+        self,
+    ) -> None:
+        """Test that the deadline of the retries follows the timeout scheduled by the app, not the configured one."""
+        self.fast_forward_to_behaviour(
+            self.behaviour,
+            self.collect_randomness_behaviour_class.auto_behaviour_id(),
+            self.synchronized_data,
+        )
+        abci_app = self.behaviour.context.state.round_sequence.abci_app
+        backoff = self.behaviour.context.randomness_retries.backoff
+        with mock.patch.object(
+            abci_app, "event_to_timeout", {Event.ROUND_TIMEOUT: 1.0}
+        ), mock.patch.object(backoff, "delay", return_value=2.0):
+            self.behaviour.act_wrapper()
+            request = self.get_message_from_outbox()
+            assert request is not None
+            self._respond_to_http_request(request, b"")
+            self.behaviour.act_wrapper()
+
+        assert self.behaviour.context.params.round_timeout_seconds > 2.0
+        self._test_done_flag_set()
+        assert self.behaviour.context.randomness_api.retries_info.retries_attempted == 0
+
+    def test_cached_randomness(
+        self,
+    ) -> None:
+        """Test that a cached beacon of the latest drand round is used without sending any request."""
+        self.fast_forward_to_behaviour(
+            self.behaviour,
+            self.collect_randomness_behaviour_class.auto_behaviour_id(),
+            self.synchronized_data,
+        )
+        cache = self.behaviour.context.randomness_cache
+        beacon = {"round": cache.current_round(), "randomness": RANDOMNESS}
+        with mock.patch.object(cache, "_observation", beacon), mock.patch.object(
+            cache.stats, "hits", 0
+        ):
+            self.behaviour.act_wrapper()
+            assert cache.stats.hits == 1
+
+        self.assert_quantity_in_outbox(0)
+        self.mock_a2a_transaction()
+        self._test_done_flag_set()
+        self.end_round()
+
+        behaviour = cast(BaseBehaviour, self.behaviour.current_behaviour)
+        assert behaviour.behaviour_id == self.next_behaviour_class.auto_behaviour_id()
+
+    def test_unverified_cached_randomness(
+        self,
+    ) -> None:
+        """Test that a cached beacon with an invalid signature is discarded."""
+        self.fast_forward_to_behaviour(
+            self.behaviour,
+            self.collect_randomness_behaviour_class.auto_behaviour_id(),
+            self.synchronized_data,
+        )
+        cache = self.behaviour.context.randomness_cache
+        beacon = {"round": cache.current_round(), "randomness": RANDOMNESS}
+        verifier = mock.MagicMock()
+        verification: "Future[List[bool]]" = Future()
+        verification.set_result([False])
+        verifier.verify_batch_async.return_value = verification
+        with mock.patch.object(cache, "_observation", beacon), mock.patch.object(
+            self.behaviour.context.state, "drand_verifier", verifier
+        ):
+            self.behaviour.act_wrapper()
+
+        verifier.verify_batch_async.assert_called_once_with([beacon])
+        # the randomness is requested from the randomness api instead
+        self.assert_quantity_in_outbox(1)
+
+    def test_slow_verification(
+        self,
+    ) -> None:
+        """Test that the agent keeps acting while the beacons are verified, and discards them if it takes too long."""
+        self.fast_forward_to_behaviour(
+            self.behaviour,
+            self.collect_randomness_behaviour_class.auto_behaviour_id(),
+            self.synchronized_data,
+        )
+        cache = self.behaviour.context.randomness_cache
+        beacon = {"round": cache.current_round(), "randomness": RANDOMNESS}
+        verifier = mock.MagicMock()
+        verifier.verify_batch_async.return_value = Future()
+        params = self.behaviour.context.params
+        params.__dict__["_frozen"] = False
+        with mock.patch.object(cache, "_observation", beacon), mock.patch.object(
+            self.behaviour.context.state, "drand_verifier", verifier
+        ), mock.patch.object(params, "drand_verification_timeout", 0.1):
+            self.behaviour.act_wrapper()
+            # the verification is pending, and the behaviour returned to the agent
+            self.assert_quantity_in_outbox(0)
+            time.sleep(0.2)
+            self.behaviour.act_wrapper()
+        params.__dict__["_frozen"] = True
+
+        # the randomness is requested from the randomness api instead
+        self.assert_quantity_in_outbox(1)
+
+    def test_shared_randomness(self, tmp_path: Path) -> None:
+        """Test that the agent waits for the beacon fetched by another agent of the host."""
+        self.fast_forward_to_behaviour(
+            self.behaviour,
+            self.collect_randomness_behaviour_class.auto_behaviour_id(),
+            self.synchronized_data,
+        )
+        cache = self.behaviour.context.randomness_cache
+        other = SharedRandomnessCache(str(tmp_path))
+        drand_round = cache.current_round()
+        assert other.acquire(drand_round)
+        with mock.patch.object(
+            cache, "shared", SharedRandomnessCache(str(tmp_path))
+        ), mock.patch.object(cache, "_observation", None), mock.patch.object(
+            cache, "shared_poll_interval", POLL_INTERVAL
+        ), mock.patch.object(
+            cache, "acquire_fetch", wraps=cache.acquire_fetch
+        ) as acquire_fetch:
+            self.behaviour.act_wrapper()
+            self.assert_quantity_in_outbox(0)
+            other.store({"round": drand_round, "randomness": RANDOMNESS})
+            # the shared cache is only checked again once the poll interval has elapsed
+            n_checks = acquire_fetch.call_count
+            self.behaviour.act_wrapper()
+            self.assert_quantity_in_outbox(0)
+            assert acquire_fetch.call_count == n_checks
+            time.sleep(POLL_INTERVAL)
+            self.behaviour.act_wrapper()
+
+        self.assert_quantity_in_outbox(0)
+        self.mock_a2a_transaction()
+        self._test_done_flag_set()
+        self.end_round()
+
+        behaviour = cast(BaseBehaviour, self.behaviour.current_behaviour)
+        assert behaviour.behaviour_id == self.next_behaviour_class.auto_behaviour_id()
+
+    def test_shared_randomness_released(self, tmp_path: Path) -> None:
+        """Test that the agent fetches the beacon on its own if the agent fetching it releases it."""
+        self.fast_forward_to_behaviour(
+            self.behaviour,
+            self.collect_randomness_behaviour_class.auto_behaviour_id(),
+            self.synchronized_data,
+        )
+        cache = self.behaviour.context.randomness_cache
+        other = SharedRandomnessCache(str(tmp_path))
+        drand_round = cache.current_round()
+        assert other.acquire(drand_round)
+        with mock.patch.object(
+            cache, "shared", SharedRandomnessCache(str(tmp_path))
+        ), mock.patch.object(cache, "_observation", None), mock.patch.object(
+            cache, "shared_poll_interval", POLL_INTERVAL
+        ):
+            self.behaviour.act_wrapper()
+            self.assert_quantity_in_outbox(0)
+            other.release(drand_round)
+            time.sleep(POLL_INTERVAL)
+            self.behaviour.act_wrapper()
+            self.assert_quantity_in_outbox(1)
+            # the other agents now wait for this one
+            assert not other.acquire(drand_round)
+
+    def test_pinned_drand_round(self) -> None:
+        """Test that the beacon of the drand round at the time of the block is requested, and only it is accepted."""
+        self.fast_forward_to_behaviour(
+            self.behaviour,
+            self.collect_randomness_behaviour_class.auto_behaviour_id(),
+            self.synchronized_data,
+        )
+        cache = self.behaviour.context.randomness_cache
+        drand_round = 1000
+        block_time = datetime.fromtimestamp(
+            cache.genesis_time + (drand_round - 1) * cache.period
+        )
+        params = self.behaviour.context.params
+        params.__dict__["_frozen"] = False
+        round_sequence = self.behaviour.context.state.round_sequence
+        with mock.patch.object(params, "pin_drand_round", True), mock.patch.object(
+            type(round_sequence),
+            "last_round_transition_timestamp",
+            new_callable=mock.PropertyMock,
+            return_value=block_time,
+        ), mock.patch.object(cache, "_observation", None):
+            self.behaviour.act_wrapper()
+        params.__dict__["_frozen"] = True
+
+        self.mock_http_request(
+            request_kwargs=dict(
+                method="GET",
+                headers="",
+                version="",
+                body=b"",
+                url=f"https://drand.cloudflare.com/public/{drand_round}",
+            ),
+            response_kwargs=dict(
+                version="",
+                status_code=200,
+                status_text="",
+                headers="",
+                body=json.dumps(
+                    {"round": drand_round, "randomness": RANDOMNESS}
+                ).encode("utf-8"),
+            ),
+        )
+        collect = cast(CollectRandomnessBehaviour, self.behaviour.current_behaviour)
+        with pytest.raises(StopIteration) as stop:
+            next(
+                collect._first_verified(
+                    [{"round": drand_round + 1, "randomness": RANDOMNESS}]
+                )
+            )
+        assert stop.value.value is None
+        self.behaviour.act_wrapper()
+        self.mock_a2a_transaction()
+        self._test_done_flag_set()
+        self.end_round()
+
+        behaviour = cast(BaseBehaviour, self.behaviour.current_behaviour)
+        assert behaviour.behaviour_id == self.next_behaviour_class.auto_behaviour_id()
+
+    def test_local_source(
+        self,
+    ) -> None:
+        """Test that a local randomness source is used without sending any request."""
+        self.fast_forward_to_behaviour(
+            self.behaviour,
+            self.collect_randomness_behaviour_class.auto_behaviour_id(),
+            self.synchronized_data,
+        )
+        with mock.patch.object(
+            self.behaviour.context.randomness_sources,
+            "local_sources",
+            [StaticRandomnessSource(1, RANDOMNESS)],
+        ):
+            self.behaviour.act_wrapper()
+
+        self.assert_quantity_in_outbox(0)
+        self.mock_a2a_transaction()
+        self._test_done_flag_set()
+        self.end_round()
+
+        behaviour = cast(BaseBehaviour, self.behaviour.current_behaviour)
+        assert behaviour.behaviour_id == self.next_behaviour_class.auto_behaviour_id()
+
     def test_max_retries_reached(
         self,
     ) -> None:
@@ -247,6 +658,7 @@ class BaseSelectKeeperBehaviourTest(HelloWorldAbciFSMBehaviourBaseCase):
                             "56cbde9e9bbcbdcaf92f183c678eaa5288581f06b1c9c7f884ce911776727688"
                         ],
                         most_voted_keeper_address=["most_voted_keeper_address"],
+                        last_keeper_address=["a_1"],
                     ),
                 )
             ),
@@ -258,13 +670,55 @@ class BaseSelectKeeperBehaviourTest(HelloWorldAbciFSMBehaviourBaseCase):
             ).behaviour_id
             == self.select_keeper_behaviour_class.auto_behaviour_id()
         )
-        self.behaviour.act_wrapper()
+        selector = self.behaviour.context.keeper_selection.selector
+        with mock.patch.object(selector, "select", wraps=selector.select) as select:
+            self.behaviour.act_wrapper()
+        select.assert_called_once_with(
+            frozenset(participants),
+            "56cbde9e9bbcbdcaf92f183c678eaa5288581f06b1c9c7f884ce911776727688",
+            "a_1",
+        )
         self.mock_a2a_transaction()
         self._test_done_flag_set()
         self.end_round()
         behaviour = cast(BaseBehaviour, self.behaviour.current_behaviour)
         assert behaviour.behaviour_id == self.next_behaviour_class.auto_behaviour_id()
 
+    def test_select_keepers(
+        self,
+    ) -> None:
+        """Test that all the keepers are sent if several keepers are selected."""
+        participants = (self.skill.skill_context.agent_address, "a_1", "a_2")
+        self.fast_forward_to_behaviour(
+            behaviour=self.behaviour,
+            behaviour_id=self.select_keeper_behaviour_class.auto_behaviour_id(),
+            synchronized_data=SynchronizedData(
+                AbciAppDB(
+                    setup_data=dict(
+                        participants=[participants],
+                        most_voted_randomness=[RANDOMNESS],
+                    ),
+                )
+            ),
+        )
+        selector = self.behaviour.context.keeper_selection.selector
+        # the skill modules are loaded apart from the packages, so the payload class is patched in the module globals
+        module_globals = type(
+            cast(BaseBehaviour, self.behaviour.current_behaviour)
+        ).async_act.__globals__
+        payload_class = mock.MagicMock(wraps=module_globals["SelectKeeperPayload"])
+        with mock.patch.object(selector, "n_keepers", 2), mock.patch.dict(
+            module_globals, SelectKeeperPayload=payload_class
+        ):
+            self.behaviour.act_wrapper()
+            keepers = selector.select_keepers(frozenset(participants), RANDOMNESS)
+
+        assert len(keepers) == 2
+        assert payload_class.call_args.args[1] == keepers[0]
+        assert payload_class.call_args.kwargs == dict(keepers=json.dumps(keepers))
+        self.mock_a2a_transaction()
+        self._test_done_flag_set()
+
 
 class TestRegistrationBehaviour(HelloWorldAbciFSMBehaviourBaseCase):
     """Test case to test RegistrationBehaviour."""
@@ -287,11 +741,63 @@ class TestRegistrationBehaviour(HelloWorldAbciFSMBehaviourBaseCase):
         self.mock_a2a_transaction()
         self._test_done_flag_set()
 
+        # the time spent by the behaviour is recorded once it is done
+        benchmark_tool = cast(BenchmarkTool, self.skill.skill_context.benchmark_tool)
+        histograms = benchmark_tool.latency_histograms[
+            RegistrationBehaviour.auto_behaviour_id()
+        ]
+        assert set(histograms) == {"tx", "wait", "local", "total"}
+        assert all(histogram.count == 1 for histogram in histograms.values())
+
         self.end_round()
         behaviour = cast(BaseBehaviour, self.behaviour.current_behaviour)
         assert behaviour.behaviour_id == CollectRandomnessBehaviour.auto_behaviour_id()
 
 
+class TestHelloWorldRoundBehaviour(HelloWorldAbciFSMBehaviourBaseCase):
+    """Test HelloWorldRoundBehaviour."""
+
+    def test_wake_on_round_transition(self) -> None:
+        """Test that the behaviour of the next round starts as soon as the round transition is notified."""
+        state = self.skill.skill_context.state
+        # the wake-up is opt-in
+        assert self.behaviour.act_wrapper not in state._round_transition_callbacks
+        params = self.behaviour.context.params
+        params.__dict__["_frozen"] = False
+        with mock.patch.object(params, "wake_on_round_transition", True):
+            self.behaviour.setup()
+        params.__dict__["_frozen"] = True
+        assert self.behaviour.act_wrapper in state._round_transition_callbacks
+
+        self.fast_forward_to_behaviour(
+            self.behaviour,
+            RegistrationBehaviour.auto_behaviour_id(),
+            self.synchronized_data,
+        )
+        self.behaviour.act_wrapper()
+        # the app moves to the next round, as when a block is committed, without the behaviour acting
+        with mock.patch.object(self.behaviour, "_process_current_round"):
+            self.end_round()
+        behaviour = cast(BaseBehaviour, self.behaviour.current_behaviour)
+        assert behaviour.behaviour_id == RegistrationBehaviour.auto_behaviour_id()
+
+        state.notify_round_transition()
+        behaviour = cast(BaseBehaviour, self.behaviour.current_behaviour)
+        assert behaviour.behaviour_id == CollectRandomnessBehaviour.auto_behaviour_id()
+
+    def test_tick_interval(self) -> None:
+        """Test that the tick interval is configurable, and must be positive."""
+        behaviour = HelloWorldRoundBehaviour(
+            name="main", skill_context=self.skill.skill_context, tick_interval=0.05
+        )
+        assert behaviour.tick_interval == 0.05
+        assert self.behaviour.tick_interval == 0.001
+        with pytest.raises(ValueError, match="must be positive"):
+            HelloWorldRoundBehaviour(
+                name="main", skill_context=self.skill.skill_context, tick_interval=0
+            )
+
+
 class TestCollectRandomnessBehaviour(BaseCollectRandomnessBehaviourTest):
     """Test CollectRandomnessBehaviour."""
 
@@ -338,6 +844,8 @@ class TestPrintMessageBehaviour(HelloWorldAbciFSMBehaviourBaseCase):
     ) -> None:
         """Test print_message."""
         agent_address_mock.return_value = "most_voted_keeper_address"
+        sink = OutputSink(OutputTarget.MEMORY)
+        self.skill.skill_context.printed_messages_output.sink = sink
         self.fast_forward_to_behaviour(
             self.behaviour,
             PrintMessageBehaviour.auto_behaviour_id(),
@@ -353,11 +861,141 @@ class TestPrintMessageBehaviour(HelloWorldAbciFSMBehaviourBaseCase):
         self.behaviour.act_wrapper()
         self.mock_a2a_transaction()
         self._test_done_flag_set()
+        assert sink.flush(timeout=5)
+        assert len(sink.lines) == 1
+        assert sink.lines[0].endswith(
+            f"says: {self.skill.skill_context.params.hello_world_string}"
+        )
 
         self.end_round()
         behaviour = cast(BaseBehaviour, self.behaviour.current_behaviour)
         assert behaviour.behaviour_id == ResetAndPauseBehaviour.auto_behaviour_id()
 
+    @mock.patch.object(SkillContext, "agent_address", new_callable=mock.PropertyMock)
+    def test_print_message_keeper_slice(
+        self,
+        agent_address_mock: mock.PropertyMock,
+    ) -> None:
+        """Test that each keeper prints its own slice of the message if there are several keepers."""
+        agent_address_mock.return_value = "most_voted_keeper_address"
+        sink = OutputSink(OutputTarget.MEMORY)
+        self.skill.skill_context.printed_messages_output.sink = sink
+        self.fast_forward_to_behaviour(
+            self.behaviour,
+            PrintMessageBehaviour.auto_behaviour_id(),
+            SynchronizedData(
+                AbciAppDB(
+                    setup_data=dict(
+                        most_voted_keeper_address=["other_keeper_address"],
+                        most_voted_keepers=[
+                            json.dumps(
+                                ["other_keeper_address", "most_voted_keeper_address"]
+                            )
+                        ],
+                    ),
+                )
+            ),
+        )
+        self.behaviour.act_wrapper()
+        self.mock_a2a_transaction()
+        self._test_done_flag_set()
+        assert sink.flush(timeout=5)
+        assert sink.lines[0].endswith(
+            f"says: {self.skill.skill_context.params.hello_world_string} (2/2)"
+        )
+
+    @mock.patch.object(SkillContext, "agent_address", new_callable=mock.PropertyMock)
+    def test_print_batch(
+        self, agent_address_mock: mock.PropertyMock, tmp_path: Path
+    ) -> None:
+        """Test that the keeper prints a batch of the queued messages, within the budget, and sends it."""
+        agent_address_mock.return_value = "most_voted_keeper_address"
+        sink = OutputSink(OutputTarget.MEMORY)
+        self.skill.skill_context.printed_messages_output.sink = sink
+        queue = MessageQueue(str(tmp_path))
+        queue.submit(["first", "second", "third"])
+        self.fast_forward_to_behaviour(
+            self.behaviour,
+            PrintMessageBehaviour.auto_behaviour_id(),
+            self.synchronized_data,
+        )
+        # the skill modules are loaded apart from the packages, so the classes are patched in the module globals
+        module_globals = type(
+            cast(BaseBehaviour, self.behaviour.current_behaviour)
+        ).async_act.__globals__
+        payload_class = mock.MagicMock(wraps=module_globals["PrintMessagePayload"])
+        round_class = module_globals["PrintMessageRound"]
+        with mock.patch.object(
+            self.skill.skill_context.work_queue, "queue", queue
+        ), mock.patch.object(round_class, "max_batch_size", 2), mock.patch.object(
+            round_class, "max_batch_bytes", 10_000
+        ), mock.patch.dict(
+            module_globals, PrintMessagePayload=payload_class
+        ):
+            self.behaviour.act_wrapper()
+
+        batch = [(message_id(message), message) for message in ("first", "second")]
+        assert payload_class.call_args.kwargs["batch"] == json.dumps(batch)
+        assert sink.flush(timeout=5)
+        assert [line.rsplit(" ", 1)[-1] for line in list(sink.lines)[1:]] == [
+            "first",
+            "second",
+        ]
+        # the messages stay queued until their batch is committed
+        assert len(queue) == 3
+        self.mock_a2a_transaction()
+        self._test_done_flag_set()
+
+    def test_pipelined_randomness(self) -> None:
+        """Test that the randomness of the next period is sent along with the printed message."""
+        self.fast_forward_to_behaviour(
+            self.behaviour,
+            PrintMessageBehaviour.auto_behaviour_id(),
+            self.synchronized_data,
+        )
+        cache = self.behaviour.context.randomness_cache
+        beacon = {"round": cache.current_round(), "randomness": RANDOMNESS}
+        params = self.behaviour.context.params
+        # the skill modules are loaded apart from the packages, so the payload class is patched in the module globals
+        module_globals = type(
+            cast(BaseBehaviour, self.behaviour.current_behaviour)
+        ).async_act.__globals__
+        payload_class = mock.MagicMock(wraps=module_globals["PrintMessagePayload"])
+        params.__dict__["_frozen"] = False
+        with mock.patch.object(params, "pipeline_randomness", True), mock.patch.object(
+            cache, "_observation", beacon
+        ), mock.patch.dict(module_globals, PrintMessagePayload=payload_class):
+            self.behaviour.act_wrapper()
+        params.__dict__["_frozen"] = True
+
+        assert payload_class.call_args.kwargs == dict(
+            next_round_id=beacon["round"], next_randomness=RANDOMNESS, batch=None
+        )
+        self.mock_a2a_transaction()
+        self._test_done_flag_set()
+
+    def test_pipelined_randomness_of_next_round(self) -> None:
+        """Test that the randomness of the next period is requested from the drand round after the one of this period."""
+        cache = self.behaviour.context.randomness_cache
+        drand_round = cache.current_round()
+        self.fast_forward_to_behaviour(
+            self.behaviour,
+            PrintMessageBehaviour.auto_behaviour_id(),
+            self.synchronized_data.update(most_voted_randomness_round=drand_round),
+        )
+        params = self.behaviour.context.params
+        params.__dict__["_frozen"] = False
+        # the cached beacon is the one of this period
+        with mock.patch.object(params, "pipeline_randomness", True), mock.patch.object(
+            cache, "_observation", {"round": drand_round, "randomness": RANDOMNESS}
+        ):
+            self.behaviour.act_wrapper()
+        params.__dict__["_frozen"] = True
+
+        request = self.get_message_from_outbox()
+        assert request is not None
+        assert cast(Any, request).url.endswith(f"/public/{drand_round + 1}")
+
 
 class TestResetAndPauseBehaviour(HelloWorldAbciFSMBehaviourBaseCase):
     """Test ResetBehaviour."""
@@ -384,13 +1022,51 @@ class TestResetAndPauseBehaviour(HelloWorldAbciFSMBehaviourBaseCase):
         self.behaviour.context.params.__dict__["reset_pause_duration"] = 0.1
         self.behaviour.act_wrapper()
         time.sleep(0.3)
-        self.behaviour.act_wrapper()
+        cache = self.behaviour.context.randomness_cache
+        with mock.patch.object(cache, "prefetch", True):
+            self.behaviour.act_wrapper()
+
+        # the randomness of the next period is prefetched without blocking the behaviour
+        prefetch_request = self.get_message_from_outbox()
+        assert prefetch_request is not None
+        assert (
+            cast(Any, prefetch_request).url
+            == "https://drand.cloudflare.com/public/latest"
+        )
         self.mock_a2a_transaction()
+        beacon = {"round": cache.current_round(), "randomness": RANDOMNESS}
+        with mock.patch.object(cache, "_observation", None):
+            self._respond_to_http_request(
+                prefetch_request, json.dumps(beacon).encode("utf-8")
+            )
+            assert cache.get() == beacon
         self._test_done_flag_set()
         self.end_round()
         behaviour = cast(BaseBehaviour, self.behaviour.current_behaviour)
         assert behaviour.behaviour_id == self.next_behaviour_class.auto_behaviour_id()
 
+    def test_acknowledge_committed_batch(self, tmp_path: Path) -> None:
+        """Test that the messages of the committed batches are removed from the work queue."""
+        queue = MessageQueue(str(tmp_path))
+        ids = queue.submit(["first", "second", "third"])
+        assert ids is not None
+        committed_batch = [(ids[0], "first"), (ids[2], "third")]
+        self.fast_forward_to_behaviour(
+            behaviour=self.behaviour,
+            behaviour_id=self.behaviour_class.auto_behaviour_id(),
+            synchronized_data=SynchronizedData(
+                AbciAppDB(
+                    setup_data=dict(
+                        most_voted_keeper_address=["most_voted_keeper_address"],
+                        committed_batch=[json.dumps(committed_batch)],
+                    ),
+                )
+            ),
+        )
+        with mock.patch.object(self.skill.skill_context.work_queue, "queue", queue):
+            self.behaviour.act_wrapper()
+        assert queue.batch(10, 10_000) == [(ids[1], "second")]
+
     def test_reset_behaviour(
         self,
     ) -> None:
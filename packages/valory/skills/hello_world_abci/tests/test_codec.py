@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Test the codec.py module of the skill."""
+
+# pylint: skip-file
+
+import json
+
+import pytest
+
+from packages.valory.skills.abstract_round_abci.base import BaseTxPayload
+from packages.valory.skills.hello_world_abci.codec import (
+    CODEC_VERSION,
+    decode_payload,
+    decode_payloads,
+    encode_payload,
+    encode_payloads,
+)
+from packages.valory.skills.hello_world_abci.payloads import (
+    CollectRandomnessPayload,
+    PRINTED_MESSAGE_FORMAT,
+    PrintMessagePayload,
+    RegistrationPayload,
+    ResetPayload,
+    SelectKeeperPayload,
+)
+
+
+ADDRESS = "0x" + "ab" * 20
+CHECKSUM_ADDRESS = "0xABaBaBaBABabABabAbAbABAbABabababaBaBABaB"
+RANDOMNESS = "d1c29dce46f979f9748210d24bce4eae8be91272f5ca1a6aea2832d3dd676f51"
+
+
+def _with_round_count(payload: BaseTxPayload, round_count: int) -> BaseTxPayload:
+    """Set the round count of a payload, as `send_a2a_transaction` does."""
+    object.__setattr__(payload, "round_count", round_count)
+    return payload
+
+
+PAYLOADS = (
+    RegistrationPayload(ADDRESS),
+    RegistrationPayload("agent_0"),
+    _with_round_count(RegistrationPayload(CHECKSUM_ADDRESS), 2**40),
+    CollectRandomnessPayload(ADDRESS, 3_000_000, RANDOMNESS),
+    CollectRandomnessPayload(ADDRESS, 0, "not hex"),
+    CollectRandomnessPayload(ADDRESS, 2**64 - 1, RANDOMNESS.upper()),
+    PrintMessagePayload(
+        CHECKSUM_ADDRESS,
+        PRINTED_MESSAGE_FORMAT.format(
+            agent_name="agent_0", address=CHECKSUM_ADDRESS, period=12, message=":|"
+        ),
+    ),
+    PrintMessagePayload(
+        ADDRESS,
+        PRINTED_MESSAGE_FORMAT.format(
+            agent_name="a (address b)", address="", period=0, message="x\ny"
+        ),
+    ),
+    PrintMessagePayload(
+        ADDRESS,
+        PRINTED_MESSAGE_FORMAT.format(
+            agent_name="agent", address=ADDRESS, period="01", message="HELLO"
+        ),
+    ),
+    PrintMessagePayload(ADDRESS, "HELLO_WORLD! ✓"),
+    PrintMessagePayload(ADDRESS, "HELLO_WORLD!", 3_000_000, RANDOMNESS),
+    PrintMessagePayload(ADDRESS, "HELLO_WORLD!", 3_000_000, "not hex"),
+    PrintMessagePayload(
+        ADDRESS,
+        "HELLO_WORLD!",
+        batch=json.dumps([["ab" * 16, "queued ✓"], ["not hex", "queued"]]),
+    ),
+    PrintMessagePayload(ADDRESS, "HELLO_WORLD!", batch="not json"),
+    SelectKeeperPayload(ADDRESS, CHECKSUM_ADDRESS),
+    SelectKeeperPayload(
+        ADDRESS, CHECKSUM_ADDRESS, json.dumps([CHECKSUM_ADDRESS, ADDRESS])
+    ),
+    SelectKeeperPayload(ADDRESS, CHECKSUM_ADDRESS, "not json"),
+    ResetPayload(ADDRESS, 2**70),
+)
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_round_trip(payload: BaseTxPayload) -> None:
+    """Test that a payload is decoded as it was encoded."""
+    encoded = encode_payload(payload)
+    assert encoded[0] == CODEC_VERSION
+    decoded = decode_payload(encoded)
+    assert decoded == payload
+    assert decoded.json == payload.json
+    assert len(encoded) < len(payload.encode())
+
+
+def test_batch_round_trip() -> None:
+    """Test that the addresses of a batch are interned."""
+    payloads = [SelectKeeperPayload(f"0x{i:040x}", CHECKSUM_ADDRESS) for i in range(4)]
+    encoded = encode_payloads(payloads)
+    assert decode_payloads(encoded) == payloads
+    assert len(encoded) < sum(len(encode_payload(p)) for p in payloads)
+    assert encode_payloads([]) == bytes([CODEC_VERSION, 0, 0])
+
+
+def test_unsupported_payload() -> None:
+    """Test that only the payloads of the skill can be encoded."""
+    with pytest.raises(ValueError, match="Cannot encode payload"):
+        encode_payload(BaseTxPayload(ADDRESS))  # type: ignore
+
+
+@pytest.mark.parametrize(
+    "data, match",
+    (
+        (bytes([CODEC_VERSION + 1, 0, 0]), "Unsupported payload codec version"),
+        (bytes([CODEC_VERSION, 0, 1, 0, 0]), "Unknown address index"),
+        (bytes([CODEC_VERSION, 0, 1, 42]), "Unknown payload type"),
+        (bytes([CODEC_VERSION, 0, 0, 0]), "Trailing bytes"),
+        (encode_payload(PAYLOADS[3])[:-1], "Truncated payload encoding"),
+        (bytes([CODEC_VERSION, 1, 7]), "Unknown address kind"),
+        (encode_payloads(PAYLOADS[:2]), "Expected a single payload"),
+    ),
+)
+def test_decode_invalid(data: bytes, match: str) -> None:
+    """Test that invalid encodings are rejected."""
+    with pytest.raises(ValueError, match=match):
+        decode_payload(data)
+
+
+def test_negative_uvarint() -> None:
+    """Test that negative unsigned fields cannot be encoded."""
+    with pytest.raises(ValueError, match="Cannot encode negative integer"):
+        encode_payload(ResetPayload(ADDRESS, -1))
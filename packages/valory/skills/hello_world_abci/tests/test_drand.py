@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Test the drand.py module of the skill."""
+
+# pylint: skip-file
+
+import hashlib
+from typing import Any, Dict, Optional
+from unittest import mock
+
+import pytest
+from py_ecc.bls import G2Basic
+
+from packages.valory.skills.hello_world_abci.drand import DrandVerifier, beacon_message
+
+
+SECRET_KEY = G2Basic.KeyGen(b"hello_world_abci drand test key!")
+PUBLIC_KEY = G2Basic.SkToPk(SECRET_KEY).hex()
+# the public key of the drand mainnet chain
+DRAND_PUBLIC_KEY = "868f005eb8e6e4ca0a47c8a77ceaa5309a47978a7c71bc5cce96366b5d7a569937c529eeda66c7293784a9402801af31"
+
+
+def sign_beacon(round_: int, previous_signature: Optional[str]) -> Dict[str, Any]:
+    """Sign a beacon with the test key, as a drand node would."""
+    signature = G2Basic.Sign(SECRET_KEY, beacon_message(round_, previous_signature))
+    beacon = {
+        "round": round_,
+        "randomness": hashlib.sha256(signature).hexdigest(),
+        "signature": signature.hex(),
+    }
+    if previous_signature is not None:
+        beacon["previous_signature"] = previous_signature
+    return beacon
+
+
+FIRST_BEACON = sign_beacon(1, "ab" * 96)
+SECOND_BEACON = sign_beacon(2, FIRST_BEACON["signature"])
+
+
+def test_beacon_message() -> None:
+    """Test the messages signed by chained and unchained drand schemes."""
+    assert beacon_message(1) == hashlib.sha256((1).to_bytes(8, "big")).digest()
+    assert (
+        beacon_message(2, "abcd")
+        == hashlib.sha256(bytes.fromhex("abcd") + (2).to_bytes(8, "big")).digest()
+    )
+
+
+class TestDrandVerifier:
+    """Test `DrandVerifier`."""
+
+    def test_drand_public_key(self) -> None:
+        """Test that the public key of the drand mainnet chain is accepted."""
+        DrandVerifier(DRAND_PUBLIC_KEY)
+
+    @pytest.mark.parametrize("public_key", ("not hex", "00" * 48, PUBLIC_KEY[:-2]))
+    def test_invalid_public_key(self, public_key: str) -> None:
+        """Test that an invalid public key is rejected."""
+        with pytest.raises(ValueError, match="Invalid drand public key"):
+            DrandVerifier(public_key)
+
+    def test_verify(self) -> None:
+        """Test the verification of a single beacon."""
+        verifier = DrandVerifier(PUBLIC_KEY)
+        assert verifier.verify(FIRST_BEACON)
+
+        # a verified beacon is not verified again
+        with mock.patch.object(verifier, "_check") as check:
+            assert verifier.verify(dict(FIRST_BEACON))
+        check.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "observation",
+        (
+            {**FIRST_BEACON, "randomness": "00" * 32},
+            {**FIRST_BEACON, "round": 3},
+            {**FIRST_BEACON, "previous_signature": "cd" * 96},
+            {**FIRST_BEACON, "signature": "not hex"},
+            {**FIRST_BEACON, "signature": "00" * 96},
+            {"round": 1, "randomness": FIRST_BEACON["randomness"]},
+            None,
+        ),
+    )
+    def test_verify_invalid(self, observation: Any) -> None:
+        """Test that tampered or malformed beacons are rejected."""
+        assert not DrandVerifier(PUBLIC_KEY).verify(observation)
+
+    def test_verify_other_key(self) -> None:
+        """Test that a beacon is rejected against the key of another chain."""
+        assert not DrandVerifier(DRAND_PUBLIC_KEY).verify(FIRST_BEACON)
+
+    def test_verify_batch(self) -> None:
+        """Test that a batch of valid beacons is verified with a single pairing check."""
+        verifier = DrandVerifier(PUBLIC_KEY)
+        with mock.patch.object(
+            verifier, "_check", wraps=verifier._check  # type: ignore
+        ) as check:
+            results = verifier.verify_batch(
+                [FIRST_BEACON, SECOND_BEACON, dict(FIRST_BEACON)]
+            )
+        assert results == [True, True, True]
+        check.assert_called_once()
+
+    def test_verify_batch_async(self) -> None:
+        """Test that a batch is verified in the background, and that the verified beacons are resolved at once."""
+        verifier = DrandVerifier(PUBLIC_KEY)
+        try:
+            verification = verifier.verify_batch_async([FIRST_BEACON, SECOND_BEACON])
+            assert verification.result(timeout=60) == [True, True]
+            with mock.patch.object(verifier, "_check") as check:
+                assert verifier.verify_batch_async([SECOND_BEACON]).done()
+            check.assert_not_called()
+        finally:
+            verifier.close()
+
+    def test_verify_batch_invalid(self) -> None:
+        """Test that the invalid beacons of a batch are found."""
+        forged = {**SECOND_BEACON, "signature": FIRST_BEACON["signature"]}
+        forged["randomness"] = FIRST_BEACON["randomness"]
+        results = DrandVerifier(PUBLIC_KEY).verify_batch(
+            [FIRST_BEACON, forged, None, SECOND_BEACON]
+        )
+        assert results == [True, False, False, True]
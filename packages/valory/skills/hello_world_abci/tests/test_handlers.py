@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 # ------------------------------------------------------------------------------
 #
-#   Copyright 2021-2022 Valory AG
+#   Copyright 2021-2023 Valory AG
 #
 #   Licensed under the Apache License, Version 2.0 (the "License");
 #   you may not use this file except in compliance with the License.
@@ -17,13 +17,288 @@
 #
 # ------------------------------------------------------------------------------
 
-"""Test the dialogues.py module of the skill."""
+"""Test the handlers.py module of the skill."""
+
+# pylint: skip-file
+
+import json
+from pathlib import Path
+from typing import Optional, cast
+from unittest import mock
+
+import pytest
+from aea.protocols.base import Message
 
 import packages.valory.skills.hello_world_abci.handlers  # noqa
+from packages.valory.protocols.http.message import HttpMessage
+from packages.valory.skills.abstract_round_abci.base import RoundSequence
+from packages.valory.skills.abstract_round_abci.handlers import (
+    ABCIRoundHandler as BaseABCIRoundHandler,
+)
+from packages.valory.skills.abstract_round_abci.test_tools.base import (
+    DummyContext,
+    FSMBehaviourBaseCase,
+)
+from packages.valory.skills.hello_world_abci.handlers import ABCIHandler
+from packages.valory.skills.hello_world_abci.http_pool import PooledHttpClient
+from packages.valory.skills.hello_world_abci.instrumentation import BlockType
+from packages.valory.skills.hello_world_abci.models import (
+    BenchmarkTool,
+    PeriodSnapshots,
+)
+from packages.valory.skills.hello_world_abci.rounds import Event
+from packages.valory.skills.hello_world_abci.tests.helpers import (
+    CHAIN_ID,
+    GENESIS_TIME,
+    commit_block,
+    new_round_sequence,
+    run_period,
+)
+from packages.valory.skills.hello_world_abci.work_queue import MessageQueue, message_id
 
 
-# pylint: skip-file
+PACKAGE_DIR = Path(__file__).parent.parent
+HTTP_SERVER_ADDRESS = "valory/http_server:0.22.0"
 
 
 def test_import() -> None:
     """Test that the 'handlers.py' Python module can be imported."""
+
+
+class TestABCIHandler:
+    """Test ABCIHandler."""
+
+    @staticmethod
+    def _handler(
+        round_sequence: RoundSequence,
+        directory: Optional[str],
+        chain_id: str = CHAIN_ID,
+    ) -> ABCIHandler:
+        """Get a handler of the given round sequence, with the snapshots in the given directory."""
+        context = mock.MagicMock()
+        context.state.round_sequence = round_sequence
+        context.params.genesis_config = mock.MagicMock(
+            chain_id=chain_id, genesis_time=GENESIS_TIME
+        )
+        context.period_snapshots = PeriodSnapshots(
+            name="period_snapshots",
+            skill_context=DummyContext(),
+            directory=directory,
+            keep=2,
+        )
+        return ABCIHandler(name="abci", skill_context=context)
+
+    @staticmethod
+    def _run(
+        round_sequence: RoundSequence, handler: ABCIHandler, n_periods: int
+    ) -> None:
+        """Commit the blocks of the registration and of the given number of periods through the handler."""
+
+        def commit() -> None:
+            handler.commit(mock.MagicMock(), mock.MagicMock())
+
+        handler.info(mock.MagicMock(), mock.MagicMock())
+        round_sequence.init_chain(1)
+        commit_block(
+            round_sequence,
+            (round_sequence.latest_synchronized_data, Event.DONE),
+            commit,
+        )
+        for period in range(n_periods):
+            run_period(round_sequence, period, commit)
+
+    def test_snapshots(self, tmp_path: Path) -> None:
+        """Test that a snapshot is saved at the first block of each period, and restored on restart."""
+        round_sequence = new_round_sequence()
+        handler = self._handler(round_sequence, str(tmp_path))
+        self._run(round_sequence, handler, 3)
+        # the snapshots of the periods 2 and 3 are kept
+        assert sorted(path.name for path in tmp_path.iterdir()) == [
+            "snapshot_000000000009.json",
+            "snapshot_000000000013.json",
+        ]
+
+        restored = new_round_sequence()
+        restarted_handler = self._handler(restored, str(tmp_path))
+        restarted_handler.info(mock.MagicMock(), mock.MagicMock())
+        assert restored.height == round_sequence.height
+        assert restored.root_hash == round_sequence.root_hash
+        snapshots = cast(PeriodSnapshots, restarted_handler.context.period_snapshots)
+        assert snapshots.last_period == 3
+
+        # a snapshot is only restored before the first block
+        restarted_handler.info(mock.MagicMock(), mock.MagicMock())
+        assert restored.height == round_sequence.height
+
+    def test_snapshot_of_other_chain(self, tmp_path: Path) -> None:
+        """Test that an agent restarting on another chain starts from a fresh database."""
+        round_sequence = new_round_sequence()
+        self._run(round_sequence, self._handler(round_sequence, str(tmp_path)), 2)
+
+        restored = new_round_sequence()
+        restarted_handler = self._handler(restored, str(tmp_path), "chain-other")
+        restarted_handler.info(mock.MagicMock(), mock.MagicMock())
+        assert restored.height == 0
+        snapshots = cast(PeriodSnapshots, restarted_handler.context.period_snapshots)
+        assert snapshots.last_period is None
+        cast(mock.MagicMock, restarted_handler.context.logger).warning.assert_called()
+
+    def test_disabled(self) -> None:
+        """Test that no snapshot is saved nor restored if the snapshots are disabled."""
+        round_sequence = new_round_sequence()
+        self._run(round_sequence, self._handler(round_sequence, None), 2)
+        assert round_sequence.height == 9
+
+    def test_save_failure(self, tmp_path: Path) -> None:
+        """Test that a snapshot which cannot be saved is skipped."""
+        round_sequence = new_round_sequence()
+        directory = tmp_path / "snapshots"
+        directory.write_text("not a directory")
+        handler = self._handler(round_sequence, str(directory))
+        self._run(round_sequence, handler, 2)
+        assert round_sequence.height == 9
+        cast(mock.MagicMock, handler.context.logger).warning.assert_called()
+
+    @pytest.mark.parametrize("new_round", (True, False))
+    def test_notify_round_transition(self, new_round: bool) -> None:
+        """Test that a round transition is notified once the request which caused it has been handled."""
+        context = mock.MagicMock()
+        context.state.round_sequence.current_round_height = 1
+        handler = ABCIHandler(name="abci", skill_context=context)
+
+        def handle(_: Message) -> None:
+            if new_round:
+                context.state.round_sequence.current_round_height = 2
+            context.state.notify_round_transition.assert_not_called()
+
+        with mock.patch.object(BaseABCIRoundHandler, "handle", side_effect=handle):
+            handler.handle(mock.MagicMock())
+        assert context.state.notify_round_transition.call_count == int(new_round)
+
+
+class TestHttpHandler(FSMBehaviourBaseCase):
+    """Test HttpHandler."""
+
+    path_to_skill = PACKAGE_DIR
+
+    def _request(self, method: str, url: str, body: bytes = b"") -> HttpMessage:
+        """Send a request to the handler, as the http server connection does, and get the response."""
+        self.http_handler.handle(
+            self.build_incoming_message(
+                message_type=HttpMessage,
+                dialogue_reference=("1", ""),
+                performative=HttpMessage.Performative.REQUEST,
+                target=0,
+                message_id=1,
+                to=str(self.skill.skill_context.skill_id),
+                sender=HTTP_SERVER_ADDRESS,
+                method=method,
+                url=url,
+                version="",
+                headers="",
+                body=body,
+            )
+        )
+        self.assert_quantity_in_outbox(1)
+        response = cast(HttpMessage, self.get_message_from_outbox())
+        assert response.performative == HttpMessage.Performative.RESPONSE
+        assert response.to == HTTP_SERVER_ADDRESS
+        return response
+
+    def test_latency(self) -> None:
+        """Test that the latency histograms of the behaviours are served."""
+        benchmark_tool = cast(BenchmarkTool, self.skill.skill_context.benchmark_tool)
+        benchmark_tool.record(
+            "registration_behaviour", {BlockType.TX: 0.2, BlockType.TOTAL: 0.3}
+        )
+
+        response = self._request("GET", "http://localhost:8000/latency")
+        assert response.status_code == 200
+        data = json.loads(response.body)
+        assert set(data["registration_behaviour"]) == {"tx", "total"}
+        assert data["registration_behaviour"]["tx"]["count"] == 1
+        assert data["registration_behaviour"]["total"]["sum"] == 0.3
+
+    def test_connections(self) -> None:
+        """Test that the connection metrics of the pooled http client are served, if it is enabled."""
+        response = self._request("GET", "http://localhost:8000/connections")
+        assert response.status_code == 404
+
+        client = PooledHttpClient()
+        with mock.patch.object(self.skill.skill_context.pooled_http, "client", client):
+            response = self._request("GET", "http://localhost:8000/connections")
+        client.close()
+        assert response.status_code == 200
+        assert json.loads(response.body)["requests"] == 0
+
+    @pytest.mark.parametrize(
+        "method, url, status_code",
+        (
+            ("GET", "http://localhost:8000/unknown", 404),
+            ("POST", "http://localhost:8000/latency", 405),
+        ),
+    )
+    def test_invalid_request(self, method: str, url: str, status_code: int) -> None:
+        """Test the responses to the requests which cannot be served."""
+        response = self._request(method, url)
+        assert response.status_code == status_code
+        assert "error" in json.loads(response.body)
+
+    def test_messages(self, tmp_path: Path) -> None:
+        """Test that the submitted messages are queued, until the queue is full."""
+        url = "http://localhost:8000/messages"
+        response = self._request("GET", url)
+        assert response.status_code == 404
+
+        queue = MessageQueue(str(tmp_path), capacity=2, max_message_bytes=8)
+        with mock.patch.object(self.skill.skill_context.work_queue, "queue", queue):
+            response = self._request("POST", url, b'{"messages": ["a", "b"]}')
+            assert response.status_code == 202
+            assert json.loads(response.body) == {
+                "ids": [message_id("a"), message_id("b")],
+                "queued": 2,
+                "capacity": 2,
+                "full": True,
+            }
+
+            response = self._request("POST", url, b'{"messages": ["c"]}')
+            assert response.status_code == 429
+            assert json.loads(response.body)["full"]
+            reset_pause = self.skill.skill_context.params.reset_pause_duration
+            assert f"Retry-After: {reset_pause}\n" in response.headers
+
+            response = self._request("GET", url)
+            assert response.status_code == 200
+            assert json.loads(response.body)["queued"] == 2
+
+    @pytest.mark.parametrize(
+        "method, body, status_code",
+        (
+            ("PUT", b"", 405),
+            ("POST", b"not json", 400),
+            ("POST", b'{"messages": [1]}', 400),
+            ("POST", b'{"message": "a"}', 400),
+            ("POST", b'{"messages": ["too large"]}', 413),
+        ),
+    )
+    def test_invalid_messages(
+        self, tmp_path: Path, method: str, body: bytes, status_code: int
+    ) -> None:
+        """Test the responses to the submissions which cannot be queued."""
+        queue = MessageQueue(str(tmp_path), max_message_bytes=8)
+        with mock.patch.object(self.skill.skill_context.work_queue, "queue", queue):
+            response = self._request(method, "http://localhost:8000/messages", body)
+        assert response.status_code == status_code
+        assert "error" in json.loads(response.body)
+        assert len(queue) == 0
+
+    def test_messages_not_persisted(self, tmp_path: Path) -> None:
+        """Test that the messages are rejected if the queue cannot be persisted."""
+        queue = MessageQueue(str(tmp_path))
+        with mock.patch.object(
+            self.skill.skill_context.work_queue, "queue", queue
+        ), mock.patch.object(queue, "submit", side_effect=OSError("read-only")):
+            response = self._request(
+                "POST", "http://localhost:8000/messages", b'{"messages": ["a"]}'
+            )
+        assert response.status_code == 503
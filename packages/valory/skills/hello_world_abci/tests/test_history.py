@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Test the history.py module of the skill."""
+
+# pylint: skip-file
+
+import json
+import sys
+from typing import Optional
+
+import pytest
+
+from packages.valory.skills.hello_world_abci.history import (
+    DEFAULT_HISTORY_SIZE,
+    PrintedMessages,
+    PrintedMessagesHistory,
+)
+from packages.valory.skills.hello_world_abci.payloads import PRINTED_MESSAGE_FORMAT
+
+
+ADDRESSES = [f"0x{i + 1:040x}" for i in range(4)]
+MESSAGES = sorted(
+    PRINTED_MESSAGE_FORMAT.format(
+        agent_name=f"agent_{i}",
+        address=address,
+        period=3,
+        message="HELLO_WORLD!" if i == 0 else ":|",
+    )
+    for i, address in enumerate(ADDRESSES)
+) + ["not templated"]
+
+
+class TestPrintedMessages:
+    """Test `PrintedMessages`."""
+
+    def test_from_messages(self) -> None:
+        """Test that the templated messages are stored as records into the tables."""
+        printed_messages = PrintedMessages.from_messages(MESSAGES)
+        assert len(printed_messages) == len(MESSAGES)
+        assert printed_messages.addresses == ADDRESSES
+        assert printed_messages.texts == ["HELLO_WORLD!", ":|"]
+        assert printed_messages.records == [
+            [0, "agent_0", 3, 0],
+            [1, "agent_1", 3, 1],
+            [2, "agent_2", 3, 1],
+            [3, "agent_3", 3, 1],
+            "not templated",
+        ]
+        assert printed_messages.render() == MESSAGES
+
+    def test_insert(self) -> None:
+        """Test that the messages inserted in any order are stored as records at their position."""
+        printed_messages = PrintedMessages()
+        for message in reversed(MESSAGES):
+            printed_messages.insert(0, message)
+        assert printed_messages.render() == MESSAGES
+        assert printed_messages.texts == [":|", "HELLO_WORLD!"]
+        assert printed_messages.to_json()["records"][0] == [3, "agent_0", 3, 1]
+
+    def test_json_roundtrip(self) -> None:
+        """Test that the json representation is smaller than the messages and can be loaded back."""
+        printed_messages = PrintedMessages.from_messages(MESSAGES)
+        data = json.loads(json.dumps(printed_messages.to_json()))
+        assert PrintedMessages.from_json(data).render() == MESSAGES
+        assert len(json.dumps(data)) < len(json.dumps(MESSAGES))
+
+    def test_texts_are_interned(self) -> None:
+        """Test that the texts are interned when the messages are stored or loaded."""
+        printed_messages = PrintedMessages.from_messages(MESSAGES)
+        data = json.loads(json.dumps(printed_messages.to_json()))
+        for texts in (printed_messages.texts, PrintedMessages.from_json(data).texts):
+            assert all(text is sys.intern(text) for text in texts)
+
+    def test_from_json_legacy(self) -> None:
+        """Test loading the rendered messages and the missing messages."""
+        assert PrintedMessages.from_json(MESSAGES).render() == MESSAGES
+        assert PrintedMessages.from_json(None).render() == []
+
+
+class TestPrintedMessagesHistory:
+    """Test `PrintedMessagesHistory`."""
+
+    def test_invalid_capacity(self) -> None:
+        """Test that a non-positive capacity is rejected."""
+        with pytest.raises(ValueError, match="History capacity must be positive"):
+            PrintedMessagesHistory(0)
+
+    def test_append_and_latest(self) -> None:
+        """Test appending periods up to the capacity."""
+        history = PrintedMessagesHistory(3)
+        assert len(history) == 0
+        assert history.latest() == []
+
+        history.append(0, ["a"])
+        history.append(1, ["b"])
+        assert len(history) == 2
+        assert history.latest() == [(0, ["a"]), (1, ["b"])]
+        assert history.latest(1) == [(1, ["b"])]
+        assert history.latest(5) == [(0, ["a"]), (1, ["b"])]
+        assert history.latest(0) == []
+
+    def test_wrap_around(self) -> None:
+        """Test that the oldest periods are evicted once the history is full."""
+        history = PrintedMessagesHistory(3)
+        for period in range(5):
+            history.append(period, [str(period)])
+
+        assert len(history) == history.capacity == 3
+        assert history.latest() == [(2, ["2"]), (3, ["3"]), (4, ["4"])]
+        assert history.latest(2) == [(3, ["3"]), (4, ["4"])]
+
+    def test_records(self) -> None:
+        """Test that the periods are encoded once when appended, and rendered on access."""
+        history = PrintedMessagesHistory()
+        assert history.capacity == DEFAULT_HISTORY_SIZE
+        history.append(0, MESSAGES)
+        history.append(1, PrintedMessages.from_messages(MESSAGES))
+        assert history.latest() == [(0, MESSAGES), (1, MESSAGES)]
+        period, encoded = history.to_json()[-1]
+        assert period == 1
+        assert json.loads(encoded) == PrintedMessages.from_messages(MESSAGES).to_json()
+
+    def test_json_roundtrip(self) -> None:
+        """Test that the json representation can be stored and loaded back, without copying the entries."""
+        history = PrintedMessagesHistory(3)
+        for period in range(4):
+            history.append(period, [str(period)])
+        entries = history.to_json()
+        loaded = PrintedMessagesHistory.from_json(json.loads(json.dumps(entries)), 3)
+        assert loaded.latest() == history.latest()
+        assert loaded.to_json() == entries
+        history.append(4, ["4"])
+        assert history.to_json()[:2] == entries[1:]
+        assert all(a is b for a, b in zip(history.to_json(), entries[1:]))
+
+    def test_from_json_empty(self) -> None:
+        """Test loading a history which has not been stored yet."""
+        assert len(PrintedMessagesHistory.from_json(None)) == 0
+        assert PrintedMessagesHistory.from_json(None, 2).capacity == 2
+
+    @pytest.mark.parametrize(
+        "capacity, expected",
+        ((None, [0, 1, 2]), (2, [1, 2]), (5, [0, 1, 2])),
+    )
+    def test_from_json_resize(self, capacity: Optional[int], expected: list) -> None:
+        """Test that resizing a loaded history keeps its latest periods."""
+        history = PrintedMessagesHistory(3)
+        for period in range(3):
+            history.append(period, [str(period)])
+        loaded = PrintedMessagesHistory.from_json(history.to_json(), capacity)
+        assert [period for period, _ in loaded.latest()] == expected
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Test the http_pool.py module of the skill."""
+
+# pylint: skip-file
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Generator, List
+
+import pytest
+
+from packages.valory.protocols.http.message import HttpMessage
+from packages.valory.skills.hello_world_abci.http_pool import (
+    EXCEPTION_STATUS_CODE,
+    PooledHttpClient,
+)
+
+
+TIMEOUT = 5.0
+BODY = b'{"round": 1, "randomness": "00"}'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """A handler which keeps the connections alive."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        """Respond with the body."""
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args: Any) -> None:
+        """Do not log the requests."""
+
+
+@pytest.fixture
+def url() -> Generator[str, None, None]:
+    """Serve the body on a local port."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/public/latest"
+    server.shutdown()
+    server.server_close()
+
+
+def wait_for_responses(client: PooledHttpClient) -> None:
+    """Dispatch the responses until all of them are dispatched."""
+    deadline = time.monotonic() + TIMEOUT
+    while client.pending > 0 and time.monotonic() < deadline:
+        client.dispatch()
+        time.sleep(0.001)
+
+
+class TestPooledHttpClient:
+    """Test `PooledHttpClient`."""
+
+    @pytest.mark.parametrize(
+        "kwargs", (dict(max_hosts=0), dict(max_connections_per_host=0))
+    )
+    def test_invalid(self, kwargs: dict) -> None:
+        """Test that an invalid configuration is rejected."""
+        with pytest.raises(ValueError, match="must be positive"):
+            PooledHttpClient(**kwargs)
+
+    def test_keep_alive(self, url: str) -> None:
+        """Test that the sequential requests to a host reuse its connection."""
+        client = PooledHttpClient()
+        responses: List[HttpMessage] = []
+        for _ in range(5):
+            client.request("GET", url, responses.append)
+            wait_for_responses(client)
+        client.close()
+
+        assert [response.status_code for response in responses] == [200] * 5
+        assert responses[0].body == BODY
+        assert "Content-Length: " in responses[0].headers
+        metrics = client.metrics.to_json()
+        assert (metrics["requests"], metrics["connections"], metrics["reused"]) == (
+            5,
+            1,
+            4,
+        )
+        assert metrics["connection_setup"]["count"] == 1
+        assert metrics["request_latency"]["count"] == 5
+
+    def test_connections_per_host(self, url: str) -> None:
+        """Test that the concurrent requests to a host do not open more than the allowed connections."""
+        client = PooledHttpClient(max_connections_per_host=2)
+        responses: List[HttpMessage] = []
+        for _ in range(10):
+            client.request("GET", url, responses.append)
+        wait_for_responses(client)
+        client.close()
+
+        assert len(responses) == 10
+        assert client.metrics.connections <= 2
+
+    def test_hosts_do_not_wait_for_each_other(self, url: str) -> None:
+        """Test that a request to a host is not queued behind the requests to a slow host."""
+        release = threading.Event()
+
+        class _SlowHandler(_Handler):
+            def do_GET(self) -> None:
+                """Respond once released."""
+                release.wait(TIMEOUT)
+                super().do_GET()
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _SlowHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        client = PooledHttpClient(max_hosts=2, max_connections_per_host=1)
+        responses: List[HttpMessage] = []
+        client.request(
+            "GET", f"http://127.0.0.1:{server.server_port}/", responses.append
+        )
+        client.request("GET", url, responses.append)
+        deadline = time.monotonic() + TIMEOUT
+        while not responses and time.monotonic() < deadline:
+            client.dispatch()
+            time.sleep(0.001)
+        assert len(responses) == 1
+        assert client.pending == 1
+
+        release.set()
+        wait_for_responses(client)
+        client.close()
+        server.shutdown()
+        server.server_close()
+        assert len(responses) == 2
+
+    def test_dispatch_on_caller_thread(self, url: str) -> None:
+        """Test that the callbacks are only called by `dispatch`, from its thread."""
+        client = PooledHttpClient()
+        threads: List[threading.Thread] = []
+        client.request("GET", url, lambda _: threads.append(threading.current_thread()))
+        while client._responses.empty():
+            time.sleep(0.001)
+        assert threads == []
+        assert client.pending == 1
+
+        assert client.dispatch() == 1
+        assert threads == [threading.current_thread()]
+        assert client.pending == 0
+        client.close()
+
+    def test_error(self) -> None:
+        """Test that a failed request is answered with the exception status code."""
+        client = PooledHttpClient(timeout=1.0)
+        responses: List[HttpMessage] = []
+        client.request("GET", "http://127.0.0.1:1/public/latest", responses.append)
+        wait_for_responses(client)
+        client.close()
+
+        assert responses[0].status_code == EXCEPTION_STATUS_CODE
+        assert b"ConnectionError" in responses[0].body
+        metrics = client.metrics.to_json()
+        assert (metrics["requests"], metrics["errors"], metrics["reused"]) == (1, 1, 0)
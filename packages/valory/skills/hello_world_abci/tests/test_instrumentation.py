@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Test the instrumentation.py module of the skill."""
+
+# pylint: skip-file
+
+from typing import Any, Generator
+from unittest import mock
+
+from packages.valory.skills.hello_world_abci.instrumentation import (
+    BehaviourTimer,
+    BlockType,
+    LatencyHistogram,
+)
+
+
+def _ticking_clock(*times: float) -> Any:
+    """Get a mock of `time.perf_counter` returning the given times."""
+    return mock.patch(
+        "packages.valory.skills.hello_world_abci.instrumentation.time.perf_counter",
+        side_effect=times,
+    )
+
+
+def _generator(value: int) -> Generator[None, None, int]:
+    """A generator yielding once and returning a value."""
+    yield
+    return value
+
+
+def yield_all(generator: Generator[None, None, int]) -> int:
+    """Run a generator until it returns, getting the returned value."""
+    try:
+        while True:
+            next(generator)
+    except StopIteration as e:
+        return e.value
+
+
+class TestLatencyHistogram:
+    """Test `LatencyHistogram`."""
+
+    def test_observe(self) -> None:
+        """Test that the latencies are counted in the right buckets."""
+        histogram = LatencyHistogram(buckets=(1.0, 0.1))
+        for seconds in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(seconds)
+        assert histogram.to_json() == {
+            "buckets": {"0.1": 2, "1.0": 1, "inf": 1},
+            "count": 4,
+            "sum": 2.65,
+            "max": 2.0,
+        }
+
+
+class TestBehaviourTimer:
+    """Test `BehaviourTimer`."""
+
+    def test_measure(self) -> None:
+        """Test that the time spent in the blocks is split from the local time."""
+        timer = BehaviourTimer()
+        with _ticking_clock(0.0, 1.0, 3.0, 3.5, 4.0, 10.0):
+            timer.start()
+            timer.start()
+            result = yield_all(timer.measure(BlockType.TX, _generator(1)))
+            result += yield_all(timer.measure(BlockType.TX, _generator(2)))
+            timings = timer.stop()
+        assert result == 3
+        assert timings == {
+            BlockType.TX: 2.5,
+            BlockType.LOCAL: 7.5,
+            BlockType.TOTAL: 10.0,
+        }
+
+    def test_nested(self) -> None:
+        """Test that the time of a nested block is accounted for the outermost block."""
+        timer = BehaviourTimer()
+
+        def _outer() -> Generator[None, None, int]:
+            return (yield from timer.measure(BlockType.SLEEP, _generator(1)))
+
+        with _ticking_clock(0.0, 1.0, 2.0, 2.0):
+            timer.start()
+            assert yield_all(timer.measure(BlockType.TX, _outer())) == 1
+            timings = timer.stop()
+        assert timings == {
+            BlockType.TX: 1.0,
+            BlockType.LOCAL: 1.0,
+            BlockType.TOTAL: 2.0,
+        }
+
+    def test_not_started(self) -> None:
+        """Test the timings of a timer which has not been started."""
+        assert BehaviourTimer().stop() == {BlockType.LOCAL: 0.0, BlockType.TOTAL: 0.0}
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Test the keeper.py module of the skill."""
+
+# pylint: skip-file
+
+from collections import Counter
+from unittest import mock
+
+import pytest
+
+from packages.valory.skills.hello_world_abci.keeper import (
+    KeeperSelector,
+    randomness_to_int,
+)
+
+
+PARTICIPANTS = frozenset({"0xc", "0xa", "0xb", "0xd"})
+RANDOMNESSES = [f"{i:064x}" for i in range(400)]
+
+
+def test_randomness_to_int() -> None:
+    """Test that the randomness is mapped to a 256 bits integer deterministically."""
+    assert randomness_to_int("ab") == randomness_to_int("ab")
+    assert randomness_to_int("ab") != randomness_to_int("ac")
+    assert 0 <= randomness_to_int("ab") < 2**256
+
+
+class TestKeeperSelector:
+    """Test `KeeperSelector`."""
+
+    def test_negative_weight(self) -> None:
+        """Test that negative weights are rejected."""
+        with pytest.raises(ValueError, match="must not be negative"):
+            KeeperSelector({"0xa": -1})
+
+    def test_invalid_n_keepers(self) -> None:
+        """Test that the number of keepers must be positive."""
+        with pytest.raises(ValueError, match="must be positive"):
+            KeeperSelector(n_keepers=0)
+
+    def test_no_participants(self) -> None:
+        """Test that a keeper cannot be selected without participants."""
+        with pytest.raises(ValueError, match="without participants"):
+            KeeperSelector().select(frozenset(), RANDOMNESSES[0])
+
+    def test_deterministic(self) -> None:
+        """Test that the selection only depends on the participants and the randomness."""
+        selector = KeeperSelector()
+        keepers = [selector.select(PARTICIPANTS, r) for r in RANDOMNESSES]
+        assert keepers == [
+            KeeperSelector().select(set(reversed(sorted(PARTICIPANTS))), r)
+            for r in RANDOMNESSES
+        ]
+        # all the participants are selected at some point
+        assert set(keepers) == PARTICIPANTS
+
+    def test_global_random_untouched(self) -> None:
+        """Test that the global random module is not reseeded."""
+        with mock.patch("random.seed") as seed:
+            KeeperSelector().select(PARTICIPANTS, RANDOMNESSES[0])
+        seed.assert_not_called()
+
+    def test_sorted_participants_cached(self) -> None:
+        """Test that the participants are only sorted when they change."""
+        selector = KeeperSelector()
+        with mock.patch(
+            "packages.valory.skills.hello_world_abci.keeper.sorted", create=True
+        ) as sorted_:
+            sorted_.side_effect = sorted
+            selector.sorted_participants(PARTICIPANTS)
+            selector.sorted_participants(set(PARTICIPANTS))
+            assert sorted_.call_count == 1
+            assert selector.sorted_participants(PARTICIPANTS | {"0xe"})[-1] == "0xe"
+            assert sorted_.call_count == 2
+
+    def test_weights(self) -> None:
+        """Test that the participants are selected according to their weights."""
+        selector = KeeperSelector({"0xa": 0, "0xb": 3})
+        counts = Counter(selector.select(PARTICIPANTS, r) for r in RANDOMNESSES)
+        assert "0xa" not in counts
+        assert counts["0xb"] > counts["0xc"] + counts["0xd"]
+
+    def test_zero_weights(self) -> None:
+        """Test that all the participants are selectable if all the weights are zero."""
+        selector = KeeperSelector({address: 0 for address in PARTICIPANTS})
+        keepers = {selector.select(PARTICIPANTS, r) for r in RANDOMNESSES}
+        assert keepers == PARTICIPANTS
+
+    @pytest.mark.parametrize(
+        "weights, never_selected", (({}, set()), ({"0xa": 0, "0xb": 3}, {"0xa"}))
+    )
+    def test_avoid_previous_keeper(self, weights: dict, never_selected: set) -> None:
+        """Test that the previous keeper is never selected again."""
+        selector = KeeperSelector(weights, avoid_previous_keeper=True)
+        for previous_keeper in sorted(PARTICIPANTS):
+            keepers = {
+                selector.select(PARTICIPANTS, r, previous_keeper) for r in RANDOMNESSES
+            }
+            assert keepers == PARTICIPANTS - {previous_keeper} - never_selected
+
+    def test_avoid_previous_keeper_single_candidate(self) -> None:
+        """Test that the previous keeper is kept if nobody else can be selected."""
+        selector = KeeperSelector({"0xb": 0}, avoid_previous_keeper=True)
+        participants = frozenset({"0xa", "0xb"})
+        assert selector.select(participants, RANDOMNESSES[0], "0xa") == "0xa"
+        assert selector.select(frozenset({"0xa"}), RANDOMNESSES[0], "0xa") == "0xa"
+        assert selector.select(participants, RANDOMNESSES[0], "0xz") == "0xa"
+
+    @pytest.mark.parametrize("n_keepers", (1, 2, 3, 4, 5))
+    def test_select_keepers(self, n_keepers: int) -> None:
+        """Test that distinct keepers are selected, the first one being the keeper selected by `select`."""
+        selector = KeeperSelector(avoid_previous_keeper=True, n_keepers=n_keepers)
+        for r in RANDOMNESSES:
+            keepers = selector.select_keepers(PARTICIPANTS, r, "0xa")
+            assert len(keepers) == min(n_keepers, len(PARTICIPANTS))
+            assert len(set(keepers)) == len(keepers)
+            assert set(keepers) <= PARTICIPANTS
+            assert keepers[0] == selector.select(PARTICIPANTS, r, "0xa")
+            assert keepers == KeeperSelector(
+                avoid_previous_keeper=True, n_keepers=n_keepers
+            ).select_keepers(set(reversed(sorted(PARTICIPANTS))), r, "0xa")
+
+    def test_select_keepers_weights(self) -> None:
+        """Test that the participants without weight are only selected once all the others are."""
+        selector = KeeperSelector({"0xa": 0, "0xb": 0}, n_keepers=2)
+        for r in RANDOMNESSES:
+            assert set(selector.select_keepers(PARTICIPANTS, r)) == {"0xc", "0xd"}
+        selector = KeeperSelector({"0xa": 0, "0xb": 0}, n_keepers=3)
+        third_keepers = Counter(
+            selector.select_keepers(PARTICIPANTS, r)[2] for r in RANDOMNESSES
+        )
+        assert set(third_keepers) == {"0xa", "0xb"}
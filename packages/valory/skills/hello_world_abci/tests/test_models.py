@@ -21,8 +21,25 @@
 
 # pylint: skip-file
 
+from pathlib import Path
+from typing import Optional
+from unittest import mock
+
 from packages.valory.skills.abstract_round_abci.test_tools.base import DummyContext
-from packages.valory.skills.hello_world_abci.models import SharedState
+from packages.valory.skills.hello_world_abci.models import (
+    KeeperSelection,
+    PooledHttp,
+    PrintedMessagesOutput,
+    RandomnessCache,
+    RandomnessRetries,
+    RandomnessSources,
+    ResetPause,
+    RoundTimeouts,
+    SharedState,
+    WorkQueue,
+)
+from packages.valory.skills.hello_world_abci.output import OutputTarget, OverflowPolicy
+from packages.valory.skills.hello_world_abci.randomness import DeterministicBeacon
 
 
 class TestSharedState:
@@ -32,4 +49,309 @@ class TestSharedState:
         self,
     ) -> None:
         """Test initialization."""
-        SharedState(name="", skill_context=DummyContext())
+        shared_state = SharedState(name="", skill_context=DummyContext())
+        assert shared_state.drand_verifier is None
+
+    def test_notify_round_transition(self) -> None:
+        """Test that the registered callbacks are called once each on a round transition."""
+        shared_state = SharedState(name="", skill_context=DummyContext())
+        first, second = mock.MagicMock(), mock.MagicMock()
+        for callback in (first, second, first):
+            shared_state.add_round_transition_callback(callback)
+        shared_state.notify_round_transition()
+        first.assert_called_once_with()
+        second.assert_called_once_with()
+
+
+class TestRandomnessSources:
+    """Test RandomnessSources(Model) class."""
+
+    def test_initialization(
+        self,
+    ) -> None:
+        """Test initialization."""
+        sources = RandomnessSources(
+            name="",
+            skill_context=DummyContext(),
+            mirrors=["https://api.drand.sh/public/latest"],
+            local_beacon_seed=None,
+        )
+        assert sources.mirrors == ["https://api.drand.sh/public/latest"]
+        assert sources.local_sources == []
+
+    def test_local_beacon(
+        self,
+    ) -> None:
+        """Test that a local beacon is configured when a seed is given."""
+        sources = RandomnessSources(
+            name="",
+            skill_context=DummyContext(),
+            mirrors=[],
+            local_beacon_seed="00" * 32,
+        )
+        assert len(sources.local_sources) == 1
+        assert isinstance(sources.local_sources[0], DeterministicBeacon)
+
+
+class TestKeeperSelection:
+    """Test KeeperSelection(Model) class."""
+
+    def test_initialization(
+        self,
+    ) -> None:
+        """Test initialization."""
+        keeper_selection = KeeperSelection(
+            name="",
+            skill_context=DummyContext(),
+            weights={"0xa": 2},
+            avoid_previous_keeper=True,
+            n_keepers=2,
+        )
+        assert keeper_selection.selector.avoid_previous_keeper
+        assert keeper_selection.selector.n_keepers == 2
+        assert keeper_selection.selector.select(frozenset({"0xa"}), "ab") == "0xa"
+
+
+class TestRoundTimeouts:
+    """Test RoundTimeouts(Model) class."""
+
+    def test_initialization(self) -> None:
+        """Test initialization."""
+        round_timeouts = RoundTimeouts(
+            name="",
+            skill_context=DummyContext(),
+            adaptive=True,
+            min_seconds=2.0,
+            max_seconds=30.0,
+            percentile=95,
+            multiplier=3.0,
+        )
+        assert round_timeouts.adaptive
+        assert (round_timeouts.min_seconds, round_timeouts.max_seconds) == (2.0, 30.0)
+        assert (round_timeouts.percentile, round_timeouts.multiplier) == (95, 3.0)
+
+
+class TestResetPause:
+    """Test ResetPause(Model) class."""
+
+    def test_initialization(self) -> None:
+        """Test initialization."""
+        reset_pause = ResetPause(
+            name="",
+            skill_context=DummyContext(),
+            adaptive=True,
+            min_duration=1,
+            max_duration=30,
+        )
+        assert reset_pause.adaptive
+        assert (reset_pause.min_duration, reset_pause.max_duration) == (1, 30)
+
+
+class TestWorkQueue:
+    """Test WorkQueue(Model) class."""
+
+    def test_initialization(self, tmp_path: Path) -> None:
+        """Test that the queue is only created if a directory is configured."""
+        kwargs = dict(
+            capacity=2, max_message_bytes=8, max_batch_size=1, max_batch_bytes=100
+        )
+        work_queue = WorkQueue(
+            name="", skill_context=DummyContext(), directory=None, **kwargs
+        )
+        assert work_queue.queue is None
+        assert (work_queue.max_batch_size, work_queue.max_batch_bytes) == (1, 100)
+
+        work_queue = WorkQueue(
+            name="", skill_context=DummyContext(), directory=str(tmp_path), **kwargs
+        )
+        assert work_queue.queue is not None
+        assert work_queue.queue.capacity == 2
+
+
+class TestPooledHttp:
+    """Test PooledHttp(Model) class."""
+
+    def test_initialization(
+        self,
+    ) -> None:
+        """Test initialization and teardown."""
+        kwargs = dict(max_hosts=2, max_connections_per_host=1, timeout=1.0)
+        pooled_http = PooledHttp(
+            name="", skill_context=DummyContext(), enabled=False, **kwargs
+        )
+        assert pooled_http.client is None
+        pooled_http.teardown()
+
+        pooled_http = PooledHttp(
+            name="", skill_context=DummyContext(), enabled=True, **kwargs
+        )
+        assert pooled_http.client is not None
+        assert pooled_http.client.timeout == 1.0
+        pooled_http.teardown()
+
+
+class TestRandomnessRetries:
+    """Test RandomnessRetries(Model) class."""
+
+    def test_hedge_delay(
+        self,
+    ) -> None:
+        """Test that the requests are only hedged once enough latencies have been recorded."""
+        kwargs = dict(
+            max_backoff=8.0,
+            jitter=0.0,
+            hedge_percentile=50,
+            latency_window=4,
+            min_latency_samples=2,
+        )
+        retries = RandomnessRetries(
+            name="", skill_context=DummyContext(), hedge_requests=True, **kwargs
+        )
+        assert retries.backoff.delay(1.0, 2.0, 5) == 8.0
+        retries.latencies.observe(3.0)
+        assert retries.hedge_delay() is None
+        retries.latencies.observe(1.0)
+        assert retries.hedge_delay() == 1.0
+
+        retries = RandomnessRetries(
+            name="", skill_context=DummyContext(), hedge_requests=False, **kwargs
+        )
+        for latency in (1.0, 2.0):
+            retries.latencies.observe(latency)
+        assert retries.hedge_delay() is None
+
+
+class TestPrintedMessagesOutput:
+    """Test PrintedMessagesOutput(Model) class."""
+
+    def test_initialization(
+        self,
+    ) -> None:
+        """Test initialization and teardown."""
+        output = PrintedMessagesOutput(
+            name="",
+            skill_context=DummyContext(),
+            target="memory",
+            path=None,
+            capacity=8,
+            batch_size=2,
+            overflow_policy="drop_newest",
+        )
+        assert output.sink.target == OutputTarget.MEMORY
+        assert output.sink.policy == OverflowPolicy.DROP_NEWEST
+        assert (output.sink.capacity, output.sink.batch_size) == (8, 2)
+
+        output.sink.write("hello")
+        output.teardown()
+        assert list(output.sink.lines) == ["hello"]
+
+
+class TestRandomnessCache:
+    """Test RandomnessCache(Model) class."""
+
+    def setup(self) -> None:
+        """Set up the tests."""
+        self.cache = self.new_cache()
+
+    @staticmethod
+    def new_cache(shared_directory: Optional[str] = None) -> RandomnessCache:
+        """Get a cache of a chain which started at time 0."""
+        return RandomnessCache(
+            name="",
+            skill_context=DummyContext(),
+            prefetch=True,
+            genesis_time=0,
+            period=30,
+            shared_directory=shared_directory,
+            shared_lease_timeout=1.0,
+            shared_poll_interval=0.1,
+        )
+
+    def test_current_round(self) -> None:
+        """Test the latest round of the drand chain."""
+        assert self.cache.current_round(0) == 1
+        assert self.cache.current_round(29) == 1
+        assert self.cache.current_round(30) == 2
+
+    def test_get(self) -> None:
+        """Test that only a beacon of the latest round is served."""
+        assert self.cache.get(0) is None
+        assert (self.cache.stats.hits, self.cache.stats.misses) == (0, 1)
+
+        self.cache.store({"round": 1, "randomness": "ab"})
+        assert self.cache.get(0) == {"round": 1, "randomness": "ab"}
+        assert (self.cache.stats.hits, self.cache.stats.misses) == (1, 1)
+
+        assert self.cache.get(30) is None
+        assert (self.cache.stats.hits, self.cache.stats.misses) == (1, 2)
+
+    def test_get_round(self) -> None:
+        """Test that only the beacon of a pinned round is served for it."""
+        self.cache.store({"round": 2, "randomness": "cd"})
+        assert self.cache.get(30, 2) == {"round": 2, "randomness": "cd"}
+        assert self.cache.get(30, 1) is None
+        assert self.cache.get(30, 3) is None
+        assert (self.cache.stats.hits, self.cache.stats.misses) == (1, 2)
+
+    def test_store_keeps_latest(self) -> None:
+        """Test that an older beacon does not replace a more recent one."""
+        self.cache.store({"round": 2, "randomness": "cd"})
+        self.cache.store({"round": 1, "randomness": "ab"})
+        assert self.cache.get(30) == {"round": 2, "randomness": "cd"}
+
+    def test_not_shared(self) -> None:
+        """Test that the agent always fetches the beacon itself if the cache is not shared."""
+        assert self.cache.shared is None
+        assert self.cache.get_shared(1) is None
+        assert self.cache.acquire_fetch(0)
+        self.cache.release_fetch(0)
+
+    def test_shared(self, tmp_path: Path) -> None:
+        """Test that a beacon stored by an agent is served to the other agents of the host."""
+        cache, other = (self.new_cache(str(tmp_path)) for _ in range(2))
+        assert cache.acquire_fetch(0)
+        assert not other.acquire_fetch(0)
+
+        cache.store({"round": 1, "randomness": "ab"})
+        assert other.get_shared(1) == {"round": 1, "randomness": "ab"}
+        assert other.get(0) == {"round": 1, "randomness": "ab"}
+        assert (other.stats.hits, other.stats.shared_hits, other.stats.misses) == (
+            1,
+            1,
+            0,
+        )
+        # the beacon is then served from the memory of the agent
+        assert other.get(0) == {"round": 1, "randomness": "ab"}
+        assert (other.stats.hits, other.stats.shared_hits, other.stats.misses) == (
+            2,
+            1,
+            0,
+        )
+
+        assert other.get(30) is None
+        assert other.stats.misses == 1
+        assert cache.acquire_fetch(30)
+        cache.release_fetch(30)
+        assert other.acquire_fetch(30)
+
+    def test_shared_round(self, tmp_path: Path) -> None:
+        """Test that the beacon of a pinned round is served from the shared cache, and fetched if missing."""
+        cache, other = (self.new_cache(str(tmp_path)) for _ in range(2))
+        cache.store({"round": 1, "randomness": "ab"})
+        cache.store({"round": 2, "randomness": "cd"})
+        assert other.get(30, 1) == {"round": 1, "randomness": "ab"}
+        assert other.stats.shared_hits == 1
+        assert other.acquire_fetch(60, 3)
+        assert not cache.acquire_fetch(60, 3)
+        other.release_fetch(60, 3)
+        assert cache.acquire_fetch(60, 3)
+
+    def test_shared_unusable(self, tmp_path: Path) -> None:
+        """Test that the agent falls back to fetching the beacon itself if the shared cache cannot be used."""
+        path = tmp_path / "file"
+        path.write_text("")
+        cache = self.new_cache(str(path))
+        assert cache.acquire_fetch(0)
+        cache.release_fetch(0)
+        cache.store({"round": 1, "randomness": "ab"})
+        assert cache.get(0) == {"round": 1, "randomness": "ab"}
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Test the output.py module of the skill."""
+
+# pylint: skip-file
+
+import threading
+from pathlib import Path
+from typing import Any, List, Optional, TextIO
+
+import pytest
+
+from packages.valory.skills.hello_world_abci.output import (
+    OutputSink,
+    OutputTarget,
+    OverflowPolicy,
+)
+
+
+TIMEOUT = 5.0
+
+
+class GatedSink(OutputSink):
+    """A memory sink whose writer thread waits for the gate to open before each batch."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the sink."""
+        super().__init__(OutputTarget.MEMORY, *args, **kwargs)
+        self.gate = threading.Event()
+        self.batches: List[List[str]] = []
+
+    def _write(self, stream: Optional[TextIO], batch: List[str]) -> int:
+        """Wait for the gate, then write the batch."""
+        self.gate.wait(TIMEOUT)
+        self.batches.append(batch)
+        return super()._write(stream, batch)
+
+
+class TestOutputSink:
+    """Test `OutputSink`."""
+
+    @pytest.mark.parametrize(
+        "kwargs, match",
+        (
+            (dict(target=OutputTarget.FILE), "A path is required"),
+            (dict(capacity=0), "must be positive"),
+            (dict(batch_size=0), "must be positive"),
+            (dict(max_lines=0), "must be positive"),
+        ),
+    )
+    def test_invalid(self, kwargs: dict, match: str) -> None:
+        """Test that an invalid configuration is rejected."""
+        with pytest.raises(ValueError, match=match):
+            OutputSink(**kwargs)
+
+    def test_memory(self) -> None:
+        """Test writing to memory."""
+        sink = OutputSink(OutputTarget.MEMORY)
+        for i in range(10):
+            assert sink.write(str(i))
+        assert sink.flush(TIMEOUT)
+        assert list(sink.lines) == [str(i) for i in range(10)]
+        assert (sink.written, sink.dropped) == (10, 0)
+        sink.stop(TIMEOUT)
+        assert not sink.write("late")
+        assert sink.dropped == 1
+
+    def test_file(self, tmp_path: Path) -> None:
+        """Test appending to a file."""
+        path = tmp_path / "output.txt"
+        path.write_text("existing\n")
+        sink = OutputSink(OutputTarget.FILE, str(path))
+        sink.write("a")
+        sink.write("b")
+        sink.stop(TIMEOUT)
+        assert path.read_text() == "existing\na\nb\n"
+
+    def test_file_cannot_be_opened(self, tmp_path: Path) -> None:
+        """Test that the lines are dropped if the file cannot be opened."""
+        sink = OutputSink(OutputTarget.FILE, str(tmp_path / "missing" / "output.txt"))
+        sink.write("a")
+        assert sink.flush(TIMEOUT)
+        assert sink.dropped == 1
+        assert not sink.write("b")
+
+    @pytest.mark.parametrize(
+        "policy, expected",
+        (
+            (OverflowPolicy.BLOCK, ["0", "1"]),
+            (OverflowPolicy.DROP_NEWEST, ["0", "1"]),
+            (OverflowPolicy.DROP_OLDEST, ["2", "3"]),
+        ),
+    )
+    def test_memory_bounded(self, policy: OverflowPolicy, expected: List[str]) -> None:
+        """Test that a memory sink keeps at most `max_lines` lines, under the policy."""
+        sink = OutputSink(
+            OutputTarget.MEMORY, policy=policy, block_timeout=0.01, max_lines=2
+        )
+        for i in range(4):
+            sink.write(str(i))
+            assert sink.flush(TIMEOUT)
+        assert list(sink.lines) == expected
+        assert sink.dropped == 2
+        assert sink.take_lines() == expected
+        sink.write("4")
+        assert sink.flush(TIMEOUT)
+        assert list(sink.lines) == ["4"]
+        sink.stop(TIMEOUT)
+
+    def test_memory_block_waits_for_room(self) -> None:
+        """Test that a blocked memory sink keeps the line once the lines are taken."""
+        sink = OutputSink(
+            OutputTarget.MEMORY,
+            policy=OverflowPolicy.BLOCK,
+            block_timeout=TIMEOUT,
+            max_lines=1,
+        )
+        sink.write("0")
+        assert sink.flush(TIMEOUT)
+        sink.write("1")
+        timer = threading.Timer(0.05, sink.take_lines)
+        timer.start()
+        assert sink.flush(TIMEOUT)
+        timer.join()
+        assert list(sink.lines) == ["1"]
+        assert sink.dropped == 0
+        sink.stop(TIMEOUT)
+
+    def test_stdout(self, capsys: pytest.CaptureFixture) -> None:
+        """Test writing to stdout."""
+        sink = OutputSink()
+        sink.write("hello")
+        sink.stop(TIMEOUT)
+        assert capsys.readouterr().out == "hello\n"
+
+    def test_batching(self) -> None:
+        """Test that the lines queued while a batch is written are written in batches."""
+        sink = GatedSink(batch_size=3)
+        for i in range(7):
+            sink.write(str(i))
+        sink.gate.set()
+        assert sink.flush(TIMEOUT)
+        assert list(sink.lines) == [str(i) for i in range(7)]
+        assert all(len(batch) <= 3 for batch in sink.batches)
+        assert len(sink.batches) < 7
+
+    @pytest.mark.parametrize(
+        "policy, expected",
+        (
+            (OverflowPolicy.DROP_NEWEST, ["0", "1", "2"]),
+            (OverflowPolicy.DROP_OLDEST, ["0", "3", "4"]),
+        ),
+    )
+    def test_drop_policies(self, policy: OverflowPolicy, expected: List[str]) -> None:
+        """Test which lines are dropped when the queue is full."""
+        sink = GatedSink(capacity=2, batch_size=1, policy=policy, max_lines=10)
+        sink.write("0")
+        # wait for the writer thread to take the first line, which leaves the queue empty
+        while sink._queue:
+            threading.Event().wait(0.001)
+        for i in range(1, 5):
+            sink.write(str(i))
+        sink.gate.set()
+        assert sink.flush(TIMEOUT)
+        assert list(sink.lines) == expected
+        assert sink.dropped == 2
+
+    def test_block_policy(self) -> None:
+        """Test that a write waits for room, and drops the line once the timeout expires."""
+        sink = GatedSink(
+            capacity=1,
+            batch_size=1,
+            policy=OverflowPolicy.BLOCK,
+            block_timeout=0.01,
+            max_lines=10,
+        )
+        sink.write("0")
+        while sink._queue:
+            threading.Event().wait(0.001)
+        assert sink.write("1")
+        assert not sink.write("2")
+        assert sink.dropped == 1
+
+        timer = threading.Timer(0.05, sink.gate.set)
+        timer.start()
+        sink.block_timeout = TIMEOUT
+        assert sink.write("3")
+        assert sink.flush(TIMEOUT)
+        assert list(sink.lines) == ["0", "1", "3"]
+        timer.join()
@@ -21,6 +21,9 @@
 
 # pylint: skip-file
 
+import pytest
+
+from packages.valory.skills.abstract_round_abci.base import BaseTxPayload
 from packages.valory.skills.hello_world_abci.payloads import (
     CollectRandomnessPayload,
     PrintMessagePayload,
@@ -55,7 +58,8 @@ def test_select_keeper_payload() -> None:
     payload = SelectKeeperPayload(sender="sender", keeper="keeper")
 
     assert payload.keeper == "keeper"
-    assert payload.data == {"keeper": "keeper"}
+    assert payload.keepers is None
+    assert payload.data == {"keeper": "keeper", "keepers": None}
 
 
 def test_print_message_payload() -> None:
@@ -64,7 +68,17 @@ def test_print_message_payload() -> None:
     payload = PrintMessagePayload(sender="sender", message="message")
 
     assert payload.message == "message"
-    assert payload.data == {"message": "message"}
+    assert payload.data == {
+        "message": "message",
+        "next_round_id": None,
+        "next_randomness": None,
+        "batch": None,
+    }
+
+    payload = PrintMessagePayload(
+        sender="sender", message="message", next_round_id=1, next_randomness="ab"
+    )
+    assert (payload.next_round_id, payload.next_randomness) == (1, "ab")
 
 
 def test_reset_payload() -> None:
@@ -76,3 +90,38 @@ def test_reset_payload() -> None:
     assert payload.id_
     assert payload.data == {"period_count": 1}
     assert hash(payload)
+
+
+@pytest.mark.parametrize(
+    "payload, field",
+    (
+        (RegistrationPayload(sender="0x" + "ab" * 20), "sender"),
+        (
+            CollectRandomnessPayload(sender="sender", round_id=1, randomness="ab" * 32),
+            "randomness",
+        ),
+        (SelectKeeperPayload(sender="sender", keeper="0x" + "cd" * 20), "keeper"),
+        (
+            SelectKeeperPayload(
+                sender="sender", keeper="keeper", keepers='["keeper", "other"]'
+            ),
+            "keepers",
+        ),
+        (
+            PrintMessagePayload(
+                sender="sender",
+                message="message",
+                next_round_id=1,
+                next_randomness="ab" * 32,
+            ),
+            "next_randomness",
+        ),
+    ),
+)
+def test_interned_fields(payload: BaseTxPayload, field: str) -> None:
+    """Test that the payloads decoded from the same transaction share their interned fields."""
+    encoded = payload.encode()
+    first, second = BaseTxPayload.decode(encoded), BaseTxPayload.decode(encoded)
+    assert first == payload
+    assert getattr(first, field) is getattr(second, field)
+    assert first.sender is second.sender
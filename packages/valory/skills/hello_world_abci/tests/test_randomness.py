@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Test the randomness.py module of the skill."""
+
+# pylint: skip-file
+
+from typing import Any
+
+import pytest
+
+from packages.valory.skills.hello_world_abci.randomness import (
+    DRAND_GENESIS_TIME,
+    DRAND_PERIOD,
+    DeterministicBeacon,
+    StaticRandomnessSource,
+    is_valid_observation,
+    round_url,
+)
+
+
+SEED = "00" * 32
+
+
+@pytest.mark.parametrize(
+    "observation, expected",
+    (
+        ({"round": 1, "randomness": "ab"}, True),
+        ({"round": "1", "randomness": "ab"}, False),
+        ({"round": 1, "randomness": ""}, False),
+        ({"round": 1}, False),
+        (None, False),
+        ("not a dict", False),
+    ),
+)
+def test_is_valid_observation(observation: Any, expected: bool) -> None:
+    """Test `is_valid_observation`."""
+    assert is_valid_observation(observation) is expected
+
+
+def test_round_url() -> None:
+    """Test `round_url`."""
+    assert (
+        round_url("https://api.drand.sh/public/latest", 42)
+        == "https://api.drand.sh/public/42"
+    )
+    with pytest.raises(ValueError, match="not the url of the latest drand beacon"):
+        round_url("https://api.drand.sh/info", 42)
+
+
+class TestDeterministicBeacon:
+    """Test `DeterministicBeacon`."""
+
+    def test_current_round(self) -> None:
+        """Test that the rounds follow the drand schedule."""
+        beacon = DeterministicBeacon(SEED)
+        assert beacon.current_round(DRAND_GENESIS_TIME - 1) == 1
+        assert beacon.current_round(DRAND_GENESIS_TIME) == 1
+        assert beacon.current_round(DRAND_GENESIS_TIME + DRAND_PERIOD) == 2
+
+    def test_randomness(self) -> None:
+        """Test that the randomness is deterministic per seed and round."""
+        beacon = DeterministicBeacon(SEED)
+        assert beacon.randomness(1) == DeterministicBeacon(SEED).randomness(1)
+        assert beacon.randomness(1) != beacon.randomness(2)
+        assert beacon.randomness(1) != DeterministicBeacon("01" * 32).randomness(1)
+
+    def test_get_observation(self) -> None:
+        """Test that the observation is a valid beacon."""
+        observation = DeterministicBeacon(SEED).get_observation()
+        assert is_valid_observation(observation)
+
+    def test_get_observation_of_round(self) -> None:
+        """Test that only the beacons of the past rounds are available."""
+        beacon = DeterministicBeacon(SEED)
+        current_round = beacon.current_round()
+        assert beacon.get_observation(1) == {
+            "round": 1,
+            "randomness": beacon.randomness(1),
+        }
+        assert beacon.get_observation(current_round + 10) is None
+
+
+def test_static_randomness_source() -> None:
+    """Test `StaticRandomnessSource`."""
+    source = StaticRandomnessSource(1, "ab")
+    observation = source.get_observation()
+    assert observation == {"round": 1, "randomness": "ab"}
+    assert observation is not None
+    observation["round"] = 2
+    assert source.get_observation() == {"round": 1, "randomness": "ab"}
+    assert source.get_observation(1) == {"round": 1, "randomness": "ab"}
+    assert source.get_observation(2) is None
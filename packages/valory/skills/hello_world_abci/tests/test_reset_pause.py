@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Test the reset_pause.py module of the skill."""
+
+# pylint: skip-file
+
+from typing import Optional
+
+import pytest
+
+from packages.valory.skills.hello_world_abci.reset_pause import ResetPauseController
+
+
+class TestResetPauseController:
+    """Test `ResetPauseController`."""
+
+    @pytest.mark.parametrize(
+        "min_pause, max_pause", ((11, 20), (0, 9), (-1, 10), (20, 1))
+    )
+    def test_invalid_bounds(self, min_pause: int, max_pause: int) -> None:
+        """Test that the bounds must contain the pause."""
+        with pytest.raises(ValueError, match="reset pause bounds"):
+            ResetPauseController(10, min_pause, max_pause, adaptive=True)
+
+    def test_not_adaptive(self) -> None:
+        """Test that the pause is fixed if it is not adaptive."""
+        controller = ResetPauseController(10, 1, 30)
+        assert controller.longest_pause == 10
+        assert controller.next_pause(4, True) == 10
+        assert controller.next_pause(None, False) == 10
+
+    @pytest.mark.parametrize(
+        "pause, is_healthy, expected",
+        (
+            (None, None, 10),
+            (None, True, 5),
+            (None, False, 20),
+            (1.5, True, 1),
+            (20, False, 30),
+            (4, None, 4),
+            (3.3333, True, 1.667),
+        ),
+    )
+    def test_next_pause(
+        self, pause: Optional[float], is_healthy: Optional[bool], expected: float
+    ) -> None:
+        """Test that the pause shrinks after healthy periods and grows otherwise, within the bounds."""
+        controller = ResetPauseController(10, 1, 30, adaptive=True)
+        assert controller.longest_pause == 30
+        assert controller.next_pause(pause, is_healthy) == expected
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Test the retry.py module of the skill."""
+
+# pylint: skip-file
+
+import random
+
+import pytest
+
+from packages.valory.skills.hello_world_abci.retry import BackoffPolicy, LatencyWindow
+
+
+class TestBackoffPolicy:
+    """Test `BackoffPolicy`."""
+
+    @pytest.mark.parametrize(
+        "kwargs, match",
+        (
+            (dict(max_delay=0.0), "maximum delay must be positive"),
+            (dict(max_delay=1.0, jitter=1.5), "jitter must be between 0 and 1"),
+        ),
+    )
+    def test_invalid(self, kwargs: dict, match: str) -> None:
+        """Test that an invalid configuration is rejected."""
+        with pytest.raises(ValueError, match=match):
+            BackoffPolicy(**kwargs)
+
+    def test_exponential(self) -> None:
+        """Test that the delays grow exponentially, up to the maximum delay."""
+        policy = BackoffPolicy(max_delay=10.0, jitter=0.0)
+        assert [policy.delay(1.0, 2.0, attempt) for attempt in range(6)] == [
+            1.0,
+            2.0,
+            4.0,
+            8.0,
+            10.0,
+            10.0,
+        ]
+        assert policy.delay(1.0, 2.0, 10_000) == 10.0
+
+    def test_jitter(self) -> None:
+        """Test that the jitter takes up to its fraction off the delays, reproducibly for a given seed."""
+        delays = [
+            BackoffPolicy(max_delay=10.0, jitter=0.5, rng=random.Random(0)).delay(
+                4.0, 2.0, 0
+            )
+            for _ in range(2)
+        ]
+        assert delays[0] == delays[1]
+        policy = BackoffPolicy(max_delay=10.0, jitter=0.5, rng=random.Random(1))
+        delays = [policy.delay(4.0, 2.0, 0) for _ in range(100)]
+        assert all(2.0 < delay <= 4.0 for delay in delays)
+        assert len(set(delays)) == 100
+
+
+class TestLatencyWindow:
+    """Test `LatencyWindow`."""
+
+    def test_invalid(self) -> None:
+        """Test that the window must keep a latency."""
+        with pytest.raises(ValueError, match="must be positive"):
+            LatencyWindow(0)
+
+    def test_percentile(self) -> None:
+        """Test the nearest-rank percentiles of the latest latencies."""
+        window = LatencyWindow(size=20)
+        assert window.percentile(95) is None
+        for latency in range(1, 21):
+            window.observe(float(latency))
+        assert len(window) == 20
+        assert window.percentile(95) == 19.0
+        assert window.percentile(50) == 10.0
+        assert window.percentile(0) == 1.0
+        assert window.percentile(100) == 20.0
+
+        # the oldest latencies are dropped
+        for _ in range(20):
+            window.observe(0.5)
+        assert len(window) == 20
+        assert window.percentile(100) == 0.5
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Test the round_timeout.py module of the skill."""
+
+# pylint: skip-file
+
+from typing import Optional
+
+import pytest
+
+from packages.valory.skills.hello_world_abci.round_timeout import (
+    DURATIONS_WINDOW,
+    MIN_DURATIONS,
+    RoundDurations,
+    RoundTimeoutController,
+)
+
+
+ROUND_ID = "collect_randomness"
+
+
+def durations_of(*durations: float) -> RoundDurations:
+    """Get the durations of the round."""
+    result: Optional[RoundDurations] = None
+    for duration in durations:
+        result = RoundTimeoutController.observe(result, ROUND_ID, duration)
+    assert result is not None
+    return result
+
+
+class TestRoundTimeoutController:
+    """Test `RoundTimeoutController`."""
+
+    @pytest.mark.parametrize(
+        "kwargs, match",
+        (
+            (dict(min_timeout=0.0), "must satisfy 0 < min"),
+            (dict(min_timeout=40.0), "must satisfy 0 < min"),
+            (dict(max_timeout=20.0), "must satisfy 0 < min"),
+            (dict(percentile=101), "must be between 0 and 100"),
+            (dict(multiplier=0.5), "at least 1"),
+        ),
+    )
+    def test_invalid(self, kwargs: dict, match: str) -> None:
+        """Test that an invalid adaptive configuration is rejected."""
+        config = {**dict(min_timeout=2.0, max_timeout=30.0), **kwargs}
+        with pytest.raises(ValueError, match=match):
+            RoundTimeoutController(30.0, adaptive=True, **config)
+        RoundTimeoutController(30.0, adaptive=False, **config)
+
+    def test_not_adaptive(self) -> None:
+        """Test that the timeout does not adapt if the controller is not adaptive."""
+        controller = RoundTimeoutController(30.0, 2.0, 60.0)
+        durations = durations_of(*[1.0] * MIN_DURATIONS)
+        assert controller.next_timeout(durations, ROUND_ID) == 30.0
+
+    def test_observe(self) -> None:
+        """Test that the latest durations of each round are kept, rounded, without modifying the given ones."""
+        durations = durations_of(*range(DURATIONS_WINDOW + 2))
+        assert durations[ROUND_ID] == [float(d) for d in range(2, DURATIONS_WINDOW + 2)]
+
+        updated = RoundTimeoutController.observe(durations, "other", 1.23456)
+        assert updated["other"] == [1.235]
+        assert "other" not in durations
+        assert updated[ROUND_ID] == durations[ROUND_ID]
+
+    @pytest.mark.parametrize(
+        "durations, expected_timeout",
+        (
+            (None, 30.0),
+            ([1.0] * (MIN_DURATIONS - 1), 30.0),
+            ([1.0] * (MIN_DURATIONS - 1) + [1.5], 4.5),
+            ([0.1] * MIN_DURATIONS, 2.0),
+            ([1.0] * (MIN_DURATIONS - 1) + [50.0], 60.0),
+            ([1.0] * 19 + [50.0], 3.0),
+        ),
+    )
+    def test_next_timeout(
+        self, durations: Optional[list], expected_timeout: float
+    ) -> None:
+        """Test that the timeout is a multiple of a percentile of the durations, within the bounds."""
+        controller = RoundTimeoutController(30.0, 2.0, 60.0, 95, 3.0, adaptive=True)
+        round_durations = None if durations is None else durations_of(*durations)
+        assert controller.next_timeout(round_durations, ROUND_ID) == expected_timeout
+        assert controller.next_timeout(round_durations, "other") == 30.0
+
+    def test_grows_after_timeouts(self) -> None:
+        """Test that a timeout which is too short grows back to the longest one after consecutive timeouts."""
+        controller = RoundTimeoutController(30.0, 2.0, 60.0, 95, 3.0, adaptive=True)
+        durations = durations_of(*[0.5] * MIN_DURATIONS)
+        timeouts = []
+        for _ in range(6):
+            timeout = controller.next_timeout(durations, ROUND_ID)
+            timeouts.append(timeout)
+            # the round times out
+            durations = controller.observe(durations, ROUND_ID, timeout)
+        assert timeouts == [2.0, 6.0, 18.0, 54.0, 60.0, 60.0]
@@ -21,34 +21,63 @@
 
 # pylint: skip-file
 
+import json
 import logging  # noqa: F401
-from typing import cast
+from datetime import timedelta
+from typing import Dict, Generator, List, Type, cast
+from unittest import mock
 from unittest.mock import MagicMock
 
+import pytest
+
 from packages.valory.skills.abstract_round_abci.base import (
+    ABCIAppInternalError,
     AbciAppDB,
+    AbstractRound,
+    CollectSameUntilThresholdRound,
     CollectionRound,
     MAX_INT_256,
+    RoundSequence,
+    TransactionNotValidError,
 )
 from packages.valory.skills.abstract_round_abci.test_tools.rounds import (
     BaseRoundTestClass as ExternalBaseRoundTestClass,
 )
+from packages.valory.skills.hello_world_abci import history, rounds
+from packages.valory.skills.hello_world_abci.keeper import KeeperSelector
 from packages.valory.skills.hello_world_abci.payloads import (
     CollectRandomnessPayload,
+    PRINTED_MESSAGE_FORMAT,
     PrintMessagePayload,
     RegistrationPayload,
     ResetPayload,
     SelectKeeperPayload,
 )
+from packages.valory.skills.hello_world_abci.reset_pause import ResetPauseController
+from packages.valory.skills.hello_world_abci.round_timeout import (
+    MIN_DURATIONS,
+    RoundTimeoutController,
+)
 from packages.valory.skills.hello_world_abci.rounds import (
     CollectRandomnessRound,
     Event,
+    HelloWorldAbciApp,
     PrintMessageRound,
     RegistrationRound,
     ResetAndPauseRound,
     SelectKeeperRound,
     SynchronizedData,
 )
+from packages.valory.skills.hello_world_abci.snapshot import PeriodSnapshot
+from packages.valory.skills.hello_world_abci.tests.helpers import (
+    CHAIN_ID,
+    GENESIS_TIME,
+    commit_block,
+    end_round,
+    new_round_sequence,
+    run_period,
+)
+from packages.valory.skills.hello_world_abci.work_queue import message_id, slice_of
 
 
 MAX_PARTICIPANTS: int = 4
@@ -146,6 +175,76 @@ class TestCollectRandomnessRound(BaseRoundTestClass):
             ]
         )
         assert event == Event.DONE
+        assert (
+            cast(SynchronizedData, synchronized_data).most_voted_randomness
+            == RANDOMNESS
+        )
+
+    def test_select_keeper_locally(
+        self,
+    ) -> None:
+        """Test that the keeper is selected at the end of the round if it is derived locally."""
+        synchronized_data = self.synchronized_data.update(
+            last_keeper_address=sorted(self.participants)[0]
+        )
+        test_round = CollectRandomnessRound(
+            synchronized_data=synchronized_data,
+            context=MagicMock(),
+        )
+        test_round.select_keeper_locally = True
+        test_round.keeper_selector = KeeperSelector(avoid_previous_keeper=True)
+        for participant in self.participants:
+            test_round.process_payload(
+                CollectRandomnessPayload(
+                    sender=participant, randomness=RANDOMNESS, round_id=0
+                )
+            )
+
+        res = test_round.end_block()
+        assert res is not None
+        synchronized_data, event = res
+        assert event == Event.KEEPER_SELECTED
+        keeper_address = KeeperSelector(avoid_previous_keeper=True).select(
+            self.participants, RANDOMNESS, sorted(self.participants)[0]
+        )
+        synchronized_data = cast(SynchronizedData, synchronized_data)
+        assert synchronized_data.most_voted_randomness == RANDOMNESS
+        assert synchronized_data.most_voted_keeper_address == keeper_address
+        assert synchronized_data.last_keeper_address == keeper_address
+        assert keeper_address != sorted(self.participants)[0]
+        assert synchronized_data.keepers == (keeper_address,)
+        assert (
+            HelloWorldAbciApp.transition_function[CollectRandomnessRound][event]
+            == PrintMessageRound
+        )
+
+    def test_select_keepers_locally(
+        self,
+    ) -> None:
+        """Test that all the keepers are selected at the end of the round if they are derived locally."""
+        test_round = CollectRandomnessRound(
+            synchronized_data=self.synchronized_data,
+            context=MagicMock(),
+        )
+        test_round.select_keeper_locally = True
+        test_round.keeper_selector = KeeperSelector(n_keepers=2)
+        for participant in self.participants:
+            test_round.process_payload(
+                CollectRandomnessPayload(
+                    sender=participant, randomness=RANDOMNESS, round_id=0
+                )
+            )
+
+        res = test_round.end_block()
+        assert res is not None
+        synchronized_data = cast(SynchronizedData, res[0])
+        keepers = KeeperSelector(n_keepers=2).select_keepers(
+            self.participants, RANDOMNESS
+        )
+        assert synchronized_data.keepers == synchronized_data.most_voted_keepers
+        assert synchronized_data.keepers == keepers
+        assert synchronized_data.most_voted_keeper_address == keepers[0]
+        assert synchronized_data.last_keeper_address == keepers[0]
 
 
 class TestSelectKeeperRound(BaseRoundTestClass):
@@ -193,6 +292,33 @@ class TestSelectKeeperRound(BaseRoundTestClass):
             ]
         )
         assert event == Event.DONE
+        assert cast(SynchronizedData, synchronized_data).last_keeper_address == "keeper"
+        assert cast(SynchronizedData, synchronized_data).keepers == ("keeper",)
+
+    def test_multiple_keepers(
+        self,
+    ) -> None:
+        """Test that the agents agree on all the keepers, in order."""
+
+        test_round = SelectKeeperRound(
+            synchronized_data=self.synchronized_data,
+            context=MagicMock(),
+        )
+        keepers = json.dumps(["keeper", "other_keeper"])
+        for participant in self.participants:
+            test_round.process_payload(
+                SelectKeeperPayload(
+                    sender=participant, keeper="keeper", keepers=keepers
+                )
+            )
+
+        res = test_round.end_block()
+        assert res is not None
+        synchronized_data = cast(SynchronizedData, res[0])
+        assert res[1] == Event.DONE
+        assert synchronized_data.most_voted_keeper_address == "keeper"
+        assert synchronized_data.last_keeper_address == "keeper"
+        assert synchronized_data.keepers == ("keeper", "other_keeper")
 
 
 class TestPrintMessageRound(BaseRoundTestClass):
@@ -246,8 +372,329 @@ class TestPrintMessageRound(BaseRoundTestClass):
             cast(SynchronizedData, synchronized_data).printed_messages
             == cast(SynchronizedData, actual_next_behaviour).printed_messages
         )
+        assert cast(SynchronizedData, synchronized_data).latest_printed_messages(1) == [
+            (0, sorted(printed_messages))
+        ]
         assert event == Event.DONE
 
+    def test_history_is_bounded(
+        self,
+    ) -> None:
+        """Test that the printed messages history is kept across periods, within its capacity."""
+
+        history_size = 2
+        synchronized_data = SynchronizedData(
+            AbciAppDB(
+                setup_data=self.synchronized_data.db.setup_data,
+                cross_period_persisted_keys=frozenset({"printed_messages_history"}),
+            )
+        )
+        for period in range(history_size + 1):
+            test_round = PrintMessageRound(
+                synchronized_data=synchronized_data,
+                context=MagicMock(),
+            )
+            test_round.history_size = history_size
+            for participant in self.participants:
+                test_round.process_payload(
+                    PrintMessagePayload(
+                        sender=participant, message=f"{participant}_{period}"
+                    )
+                )
+            res = test_round.end_block()
+            assert res is not None
+            synchronized_data = cast(
+                SynchronizedData, cast(SynchronizedData, res[0]).create()
+            )
+
+        message_history = synchronized_data.message_history
+        assert message_history.capacity == history_size
+        assert synchronized_data.latest_printed_messages() == [
+            (
+                period,
+                sorted(f"{participant}_{period}" for participant in self.participants),
+            )
+            for period in (1, 2)
+        ]
+        assert [
+            period for period, _ in synchronized_data.latest_printed_messages(1)
+        ] == [2]
+
+    @pytest.mark.parametrize(
+        "pipeline_randomness, n_disagreeing, is_agreed",
+        ((True, 0, True), (True, 1, True), (True, 2, False), (False, 0, False)),
+    )
+    def test_pipelined_randomness(
+        self, pipeline_randomness: bool, n_disagreeing: int, is_agreed: bool
+    ) -> None:
+        """Test that the randomness of the next period is agreed on if enough agents sent the same one."""
+        test_round = PrintMessageRound(
+            synchronized_data=self.synchronized_data,
+            context=MagicMock(),
+        )
+        test_round.pipeline_randomness = pipeline_randomness
+        for i, participant in enumerate(sorted(self.participants)):
+            randomness = RANDOMNESS if i >= n_disagreeing else f"{i:064x}"
+            test_round.process_payload(
+                PrintMessagePayload(
+                    sender=participant,
+                    message=f"{participant}_message",
+                    next_round_id=5,
+                    next_randomness=randomness,
+                )
+            )
+
+        res = test_round.end_block()
+        assert res is not None
+        synchronized_data, event = res
+        assert event == Event.DONE
+        synchronized_data = cast(SynchronizedData, synchronized_data)
+        if is_agreed:
+            assert synchronized_data.next_randomness_round == 5
+            assert synchronized_data.next_randomness == RANDOMNESS
+        else:
+            assert synchronized_data.next_randomness_round is None
+            assert synchronized_data.next_randomness is None
+
+    def test_templated_messages_are_stored_as_records(
+        self,
+    ) -> None:
+        """Test that the messages which follow the template are stored as records, and rendered on access."""
+
+        test_round = PrintMessageRound(
+            synchronized_data=self.synchronized_data,
+            context=MagicMock(),
+        )
+        participants = sorted(self.participants)
+        printed_messages = sorted(
+            PRINTED_MESSAGE_FORMAT.format(
+                agent_name=f"agent_{i}",
+                address=participant,
+                period=0,
+                message="HELLO_WORLD!" if i == 0 else ":|",
+            )
+            for i, participant in enumerate(participants)
+        )
+        for participant, message in zip(participants, printed_messages):
+            test_round.process_payload(
+                PrintMessagePayload(sender=participant, message=message)
+            )
+
+        res = test_round.end_block()
+        assert res is not None
+        synchronized_data = cast(SynchronizedData, res[0])
+        stored = synchronized_data.db.get_strict("printed_messages")
+        assert sorted(stored["texts"]) == [":|", "HELLO_WORLD!"]
+        assert all(isinstance(record, list) for record in stored["records"])
+        assert synchronized_data.printed_messages == printed_messages
+
+    def test_incremental_sorting(
+        self,
+    ) -> None:
+        """Test that the messages are kept sorted as the payloads arrive."""
+
+        test_round = PrintMessageRound(
+            synchronized_data=self.synchronized_data,
+            context=MagicMock(),
+        )
+
+        participants = sorted(self.participants)
+        for i, participant in reversed(list(enumerate(participants))):
+            test_round.process_payload(
+                PrintMessagePayload(sender=participant, message=f"message_{i}")
+            )
+
+        res = test_round.end_block()
+        assert res is not None
+        synchronized_data, _ = res
+        assert cast(SynchronizedData, synchronized_data).printed_messages == [
+            f"message_{i}" for i in range(len(participants))
+        ]
+        assert cast(SynchronizedData, synchronized_data).participants == frozenset(
+            participants
+        )
+
+    def test_duplicate_message(
+        self,
+    ) -> None:
+        """Test that a message which was already printed by another agent is rejected."""
+
+        test_round = PrintMessageRound(
+            synchronized_data=self.synchronized_data,
+            context=MagicMock(),
+        )
+
+        first, second, *_ = sorted(self.participants)
+        test_round.process_payload(PrintMessagePayload(sender=first, message=":|"))
+        with pytest.raises(TransactionNotValidError, match="already exists"):
+            test_round.check_payload(PrintMessagePayload(sender=second, message=":|"))
+        with pytest.raises(ABCIAppInternalError, match="already exists"):
+            test_round.process_payload(PrintMessagePayload(sender=second, message=":|"))
+        with pytest.raises(TransactionNotValidError, match="has already sent value"):
+            test_round.check_payload(PrintMessagePayload(sender=first, message="new"))
+
+    def test_batches(
+        self,
+    ) -> None:
+        """Test that the valid batches of the keepers are committed, in the order of the keepers."""
+
+        first, second, third, fourth = sorted(self.participants)
+        test_round = PrintMessageRound(
+            synchronized_data=self.synchronized_data.update(
+                most_voted_keeper_address=second,
+                most_voted_keepers=json.dumps([second, first]),
+            ),
+            context=MagicMock(),
+        )
+        queued = [(message_id(f"m{i}"), f"m{i}") for i in range(20)]
+        slices = [
+            [item for item in queued if slice_of(item[0], 2) == index][:2]
+            for index in range(2)
+        ]
+
+        def payload(sender: str, message: str, batch: object) -> PrintMessagePayload:
+            """Get a payload with a batch."""
+            return PrintMessagePayload(
+                sender=sender, message=message, batch=json.dumps(batch)
+            )
+
+        invalid = (
+            (payload(third, ":|", slices[0]), "is not a keeper"),
+            (payload(second, "m", slices[1]), "not of its slice"),
+            (payload(second, "m", [(slices[0][0][0], "tampered")]), "not of its slice"),
+            (payload(second, "m", queued), "exceeds the budget"),
+            (payload(second, "m", {"a": 1}), "Invalid batch"),
+        )
+        with mock.patch.object(
+            PrintMessageRound, "max_batch_size", 2
+        ), mock.patch.object(PrintMessageRound, "max_batch_bytes", 10_000):
+            for invalid_payload, match in invalid:
+                with pytest.raises(TransactionNotValidError, match=match):
+                    test_round.check_payload(invalid_payload)
+                with pytest.raises(ABCIAppInternalError, match=match):
+                    test_round.process_payload(invalid_payload)
+
+            for sender, message, batch in (
+                (first, "m (2/2)", slices[1]),
+                (second, "m (1/2)", slices[0]),
+                (third, ":|", None),
+                (fourth, ":| ", None),
+            ):
+                test_round.process_payload(
+                    PrintMessagePayload(
+                        sender=sender,
+                        message=message,
+                        batch=None if batch is None else json.dumps(batch),
+                    )
+                )
+
+        res = test_round.end_block()
+        assert res is not None
+        synchronized_data = cast(SynchronizedData, res[0])
+        assert synchronized_data.committed_batch == slices[0] + slices[1]
+
+    def test_messages_parsed_once(
+        self,
+    ) -> None:
+        """Test that the records of the messages are built as the payloads arrive, and not again at the end of the block."""
+
+        test_round = PrintMessageRound(
+            synchronized_data=self.synchronized_data,
+            context=MagicMock(),
+        )
+        payloads = [
+            PrintMessagePayload(
+                sender=participant,
+                message=PRINTED_MESSAGE_FORMAT.format(
+                    agent_name=f"agent_{i}",
+                    address=participant,
+                    period=0,
+                    message=":|",
+                ),
+            )
+            for i, participant in enumerate(self.participants)
+        ]
+        with mock.patch.object(
+            history, "parse_printed_message", wraps=history.parse_printed_message
+        ) as parse_printed_message:
+            for payload in reversed(payloads):
+                test_round.process_payload(payload)
+            assert parse_printed_message.call_count == len(payloads)
+            res = test_round.end_block()
+            assert parse_printed_message.call_count == len(payloads)
+
+        assert res is not None
+        assert cast(SynchronizedData, res[0]).printed_messages == sorted(
+            payload.message for payload in payloads
+        )
+
+    def test_batch_checked_once(
+        self,
+    ) -> None:
+        """Test that the batch of a checked payload is not validated again when the payload is processed."""
+
+        first, second, *_ = sorted(self.participants)
+        test_round = PrintMessageRound(
+            synchronized_data=self.synchronized_data.update(
+                most_voted_keeper_address=first,
+                most_voted_keepers=json.dumps([first]),
+            ),
+            context=MagicMock(),
+        )
+        batch = json.dumps([(message_id("m"), "m")])
+        checked = PrintMessagePayload(sender=first, message="m", batch=batch)
+        with mock.patch.object(
+            PrintMessageRound, "max_batch_size", 2
+        ), mock.patch.object(
+            PrintMessageRound, "max_batch_bytes", 10_000
+        ), mock.patch.object(
+            rounds, "parse_batch", wraps=rounds.parse_batch
+        ) as parse_batch:
+            test_round.check_payload(checked)
+            test_round.process_payload(checked)
+            assert parse_batch.call_count == 1
+
+            # a payload which has not been checked itself is validated when it is processed
+            test_round.check_payload(PrintMessagePayload(sender=second, message=":|"))
+            with pytest.raises(ABCIAppInternalError, match="is not a keeper"):
+                test_round.process_payload(
+                    PrintMessagePayload(sender=second, message=":|", batch=batch)
+                )
+
+        assert test_round._batches == {first: [(message_id("m"), "m")]}
+
+    def test_every_keeper_contributes(
+        self,
+    ) -> None:
+        """Test that the keepers must print their message if several keepers have been selected."""
+
+        first, second, third, _ = sorted(self.participants)
+        test_round = PrintMessageRound(
+            synchronized_data=self.synchronized_data.update(
+                most_voted_keeper_address=first,
+                most_voted_keepers=json.dumps([first, second]),
+            ),
+            context=MagicMock(),
+        )
+
+        for keeper in (first, second):
+            for message in (
+                ":|",
+                PRINTED_MESSAGE_FORMAT.format(
+                    agent_name="agent", address=keeper, period=0, message=":|"
+                ),
+            ):
+                with pytest.raises(
+                    TransactionNotValidError, match="did not print its message"
+                ):
+                    test_round.check_payload(
+                        PrintMessagePayload(sender=keeper, message=message)
+                    )
+        test_round.check_payload(
+            PrintMessagePayload(sender=first, message="HELLO_WORLD! (1/2)")
+        )
+        test_round.check_payload(PrintMessagePayload(sender=third, message=":|"))
+
 
 class TestResetAndPauseRound(BaseRoundTestClass):
     """Tests for ResetAndPauseRound."""
@@ -288,6 +735,238 @@ class TestResetAndPauseRound(BaseRoundTestClass):
 
         assert event == Event.DONE
 
+    @pytest.mark.parametrize(
+        "select_keeper_locally, expected_event",
+        ((False, Event.RANDOMNESS_COLLECTED), (True, Event.KEEPER_SELECTED)),
+    )
+    def test_pipelined_randomness(
+        self, select_keeper_locally: bool, expected_event: Event
+    ) -> None:
+        """Test that the randomness agreed on for the next period is carried over to it."""
+        self.synchronized_data.update(
+            next_randomness_round=5, next_randomness=RANDOMNESS
+        )
+        test_round = ResetAndPauseRound(
+            synchronized_data=self.synchronized_data,
+            context=MagicMock(),
+        )
+        for participant in self.participants:
+            test_round.process_payload(ResetPayload(sender=participant, period_count=1))
+
+        with mock.patch.object(
+            CollectRandomnessRound, "select_keeper_locally", select_keeper_locally
+        ):
+            res = test_round.end_block()
+        assert res is not None
+        synchronized_data, event = res
+        assert event == expected_event
+        synchronized_data = cast(SynchronizedData, synchronized_data)
+        assert synchronized_data.period_count == 1
+        assert synchronized_data.most_voted_randomness == RANDOMNESS
+        assert synchronized_data.next_randomness is None
+        if select_keeper_locally:
+            assert synchronized_data.most_voted_keeper_address in self.participants
+        assert HelloWorldAbciApp.transition_function[ResetAndPauseRound][event] == (
+            PrintMessageRound if select_keeper_locally else SelectKeeperRound
+        )
+
+    @pytest.mark.parametrize(
+        "next_round, next_randomness",
+        ((5, RANDOMNESS), (4, "0" * 64), (3, "0" * 64)),
+    )
+    def test_pipelined_randomness_reused(
+        self, next_round: int, next_randomness: str
+    ) -> None:
+        """Test that the randomness of the current period, or of an earlier drand round, is not carried over."""
+        self.synchronized_data.update(
+            most_voted_randomness_round=4,
+            most_voted_randomness=RANDOMNESS,
+            next_randomness_round=next_round,
+            next_randomness=next_randomness,
+        )
+        test_round = ResetAndPauseRound(
+            synchronized_data=self.synchronized_data,
+            context=MagicMock(),
+        )
+        for participant in self.participants:
+            test_round.process_payload(ResetPayload(sender=participant, period_count=1))
+
+        res = test_round.end_block()
+        assert res is not None
+        assert res[1] == Event.DONE
+        synchronized_data = cast(SynchronizedData, res[0])
+        assert synchronized_data.most_voted_randomness_round is None
+        assert synchronized_data.next_randomness is None
+
+    @pytest.mark.parametrize(
+        "period_start_round_count, round_count, expected_pause",
+        (
+            (None, 10, 8.0),
+            (7, 10, 4.0),
+            (3, 10, 16.0),
+        ),
+    )
+    def test_adaptive_pause(
+        self,
+        period_start_round_count: int,
+        round_count: int,
+        expected_pause: float,
+    ) -> None:
+        """Test that the pause of the next period adapts to the number of rounds of the period."""
+        self.synchronized_data.update(
+            reset_pause=8.0, period_start_round_count=period_start_round_count
+        )
+        self.synchronized_data.db.round_count = round_count
+        test_round = ResetAndPauseRound(
+            synchronized_data=self.synchronized_data,
+            context=MagicMock(),
+        )
+        test_round.pause_controller = ResetPauseController(
+            10, min_pause=1, max_pause=30, adaptive=True
+        )
+        for participant in self.participants:
+            payload = ResetPayload(sender=participant, period_count=1)
+            object.__setattr__(payload, "round_count", round_count)
+            test_round.process_payload(payload)
+
+        res = test_round.end_block()
+        assert res is not None
+        synchronized_data, event = res
+        assert event == Event.DONE
+        synchronized_data = cast(SynchronizedData, synchronized_data)
+        assert synchronized_data.period_count == 1
+        assert synchronized_data.reset_pause == expected_pause
+        assert synchronized_data.period_start_round_count == round_count + 1
+
+
+class TestHelloWorldAbciApp:
+    """Tests for HelloWorldAbciApp."""
+
+    @pytest.fixture(autouse=True)
+    def adaptive_timeouts(self) -> Generator[None, None, None]:
+        """Make the round timeouts adaptive."""
+        controller = RoundTimeoutController(30.0, 2.0, 30.0, 95, 3.0, adaptive=True)
+        with mock.patch.object(HelloWorldAbciApp, "timeout_controller", controller):
+            yield
+
+    @staticmethod
+    def round_sequence() -> RoundSequence:
+        """Get a round sequence at the first block of its period after enough of them for the timeouts to adapt."""
+        round_sequence = new_round_sequence()
+        round_sequence.init_chain(1)
+        commit_block(
+            round_sequence, (round_sequence.latest_synchronized_data, Event.DONE)
+        )
+        for period in range(MIN_DURATIONS):
+            run_period(round_sequence, period)
+        return round_sequence
+
+    def test_adaptive_round_timeout(self) -> None:
+        """Test that the round timeouts are derived from the durations of the rounds, measured with the block timestamps."""
+        round_sequence = self.round_sequence()
+        synchronized_data = cast(
+            SynchronizedData, round_sequence.latest_synchronized_data
+        )
+        # the blocks are a second apart
+        assert synchronized_data.round_durations == {
+            CollectRandomnessRound.auto_round_id(): [2.0] * MIN_DURATIONS,
+            PrintMessageRound.auto_round_id(): [1.0] * MIN_DURATIONS,
+        }
+        abci_app = round_sequence.abci_app
+        assert round_sequence.current_round_id == CollectRandomnessRound.auto_round_id()
+        assert abci_app.event_to_timeout[Event.ROUND_TIMEOUT] == 6.0
+
+        commit_block(round_sequence)
+        commit_block(
+            round_sequence,
+            (round_sequence.latest_synchronized_data, Event.KEEPER_SELECTED),
+        )
+        assert round_sequence.current_round_id == PrintMessageRound.auto_round_id()
+        assert abci_app.event_to_timeout[Event.ROUND_TIMEOUT] == 3.0
+
+        # the stalled round times out after its tuned timeout, instead of the configured one
+        header = mock.MagicMock(
+            height=round_sequence.height + 1,
+            timestamp=abci_app.last_timestamp + timedelta(seconds=3.5),
+        )
+        round_sequence.begin_block(header, mock.MagicMock(), mock.MagicMock())
+        assert round_sequence.current_round_id == RegistrationRound.auto_round_id()
+        print_message_id = PrintMessageRound.auto_round_id()
+
+        def _durations() -> Dict[str, List[float]]:
+            """Get the durations of the rounds stored in the synchronized data."""
+            durations = cast(
+                SynchronizedData, round_sequence.latest_synchronized_data
+            ).round_durations
+            assert durations is not None
+            return durations
+
+        # the timed out round has no result, so its duration is recorded by the next round which can time out
+        assert _durations()[print_message_id] == [1.0] * MIN_DURATIONS
+        round_sequence.end_block()
+        round_sequence.tm_height = round_sequence.height + 1
+        with mock.patch.object(
+            RoundSequence,
+            "_get_round_result",
+            return_value=(round_sequence.latest_synchronized_data, Event.DONE),
+        ):
+            round_sequence.commit()
+        assert _durations()[print_message_id] == [1.0] * MIN_DURATIONS
+        assert round_sequence.current_round_id == CollectRandomnessRound.auto_round_id()
+        commit_block(
+            round_sequence,
+            end_round(
+                round_sequence, round_sequence.latest_synchronized_data, Event.DONE
+            ),
+        )
+        # a round which timed out lasts until the block at which the timeout was noticed
+        assert _durations()[print_message_id] == [1.0] * MIN_DURATIONS + [3.5]
+
+    @pytest.mark.parametrize(
+        "round_cls", (CollectRandomnessRound, SelectKeeperRound, PrintMessageRound)
+    )
+    def test_rounds_record_durations(self, round_cls: Type[AbstractRound]) -> None:
+        """Test that the rounds which can time out record their duration from their `end_block`."""
+        round_sequence = self.round_sequence()
+        abci_app = round_sequence.abci_app
+        test_round = round_cls(
+            round_sequence.latest_synchronized_data, abci_app.context
+        )
+        recorded = mock.MagicMock()
+        with mock.patch.object(
+            CollectSameUntilThresholdRound,
+            "end_block",
+            return_value=(test_round.synchronized_data, Event.NONE),
+        ), mock.patch.object(
+            PrintMessageRound,
+            "collection_threshold_reached",
+            new_callable=mock.PropertyMock,
+            return_value=True,
+        ), mock.patch.object(
+            abci_app, "record_round_durations", return_value=recorded
+        ) as record_round_durations:
+            res = test_round.end_block()
+        assert res is not None
+        assert res[0] is recorded
+        record_round_durations.assert_called_once()
+
+    def test_deterministic(self) -> None:
+        """Test that the agents which went through the same blocks, or restored a snapshot of them, agree on the timeouts."""
+        round_sequence, other = self.round_sequence(), self.round_sequence()
+        restored = new_round_sequence()
+        PeriodSnapshot.take(round_sequence, CHAIN_ID, GENESIS_TIME).restore(
+            restored, CHAIN_ID, GENESIS_TIME
+        )
+        for sequence in (round_sequence, other, restored):
+            run_period(sequence, MIN_DURATIONS)
+            commit_block(sequence)
+        assert round_sequence.root_hash == other.root_hash == restored.root_hash
+        assert (
+            round_sequence.abci_app.event_to_timeout
+            == other.abci_app.event_to_timeout
+            == restored.abci_app.event_to_timeout
+        )
+
 
 def test_synchronized_data() -> None:  # pylint:too-many-locals
     """Test SynchronizedData."""
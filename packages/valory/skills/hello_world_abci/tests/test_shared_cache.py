@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Test the shared_cache.py module of the skill."""
+
+# pylint: skip-file
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional
+
+import pytest
+
+from packages.valory.skills.hello_world_abci.randomness import Observation
+from packages.valory.skills.hello_world_abci.shared_cache import SharedRandomnessCache
+
+
+def beacon(drand_round: int) -> Observation:
+    """Get a beacon of a round."""
+    return {"round": drand_round, "randomness": f"{drand_round:064x}"}
+
+
+class TestSharedRandomnessCache:
+    """Test `SharedRandomnessCache`."""
+
+    @pytest.mark.parametrize(
+        "kwargs, match",
+        (
+            (dict(keep=0), "number of kept beacons must be positive"),
+            (dict(lease_timeout=0.0), "lease timeout must be positive"),
+        ),
+    )
+    def test_invalid(self, tmp_path: Path, kwargs: dict, match: str) -> None:
+        """Test that an invalid configuration is rejected."""
+        with pytest.raises(ValueError, match=match):
+            SharedRandomnessCache(str(tmp_path), **kwargs)
+
+    def test_store_and_load(self, tmp_path: Path) -> None:
+        """Test that the latest beacon is loaded if its round is recent enough, and that the latest ones are kept."""
+        cache = SharedRandomnessCache(str(tmp_path / "shared"), keep=2)
+        assert cache.load(1) is None
+
+        for drand_round in (1, 3, 2):
+            cache.store(beacon(drand_round))
+        assert sorted(path.name for path in cache.directory.iterdir()) == [
+            "round_000000000002.json",
+            "round_000000000003.json",
+        ]
+        assert cache.load(2) == beacon(3)
+        assert cache.load(4) is None
+
+        # a beacon which cannot be read is skipped
+        (cache.directory / "round_000000000003.json").write_text("{")
+        assert cache.load(2) == beacon(2)
+        assert cache.load(3) is None
+
+    def test_load_round(self, tmp_path: Path) -> None:
+        """Test that the beacon of a pinned round is loaded, instead of the latest one."""
+        cache = SharedRandomnessCache(str(tmp_path))
+        for drand_round in (1, 2, 3):
+            cache.store(beacon(drand_round))
+        assert cache.load(2, 2) == beacon(2)
+        assert cache.load(4, 4) is None
+
+    def test_lease(self, tmp_path: Path) -> None:
+        """Test that a single agent holds the lease of a round until it stores its beacon or releases it."""
+        cache, other = (SharedRandomnessCache(str(tmp_path)) for _ in range(2))
+        assert cache.acquire(1)
+        assert not other.acquire(1)
+        assert other.acquire(2)
+
+        # the beacon of the round no longer has to be fetched
+        cache.store(beacon(1))
+        assert not other.acquire(1)
+        other.release(2)
+        other.release(2)
+        assert cache.acquire(2)
+
+        # the leases of the older rounds are removed with the beacons
+        cache.release(2)
+        cache.store(beacon(3))
+        assert sorted(path.suffix for path in cache.directory.iterdir()) == [
+            ".json",
+            ".json",
+        ]
+
+    def test_release_owned_only(self, tmp_path: Path) -> None:
+        """Test that an agent only releases the leases it owns."""
+        cache, other = (SharedRandomnessCache(str(tmp_path)) for _ in range(2))
+        assert cache.acquire(1)
+        lease = tmp_path / "round_000000000001.lease"
+        assert lease.read_text() == cache.owner != other.owner
+        other.release(1)
+        assert lease.exists()
+        assert not other.acquire(1)
+        cache.release(1)
+        assert not lease.exists()
+        assert other.acquire(1)
+
+    def test_exact_lease(self, tmp_path: Path) -> None:
+        """Test that a beacon of a later round does not prevent the fetch of the beacon of a pinned round."""
+        cache = SharedRandomnessCache(str(tmp_path))
+        cache.store(beacon(3))
+        assert not cache.acquire(2)
+        assert cache.acquire(2, exact=True)
+
+    def test_abandoned_lease(self, tmp_path: Path) -> None:
+        """Test that an abandoned lease is taken over."""
+        cache, other = (
+            SharedRandomnessCache(str(tmp_path), lease_timeout=1.0) for _ in range(2)
+        )
+        assert cache.acquire(1)
+        lease = tmp_path / "round_000000000001.lease"
+        past = time.time() - 2
+        os.utime(lease, (past, past))
+        assert other.acquire(1)
+        assert not cache.acquire(1)
+
+    def test_concurrent(self, tmp_path: Path) -> None:
+        """Test that concurrent writers and readers only ever see whole beacons, and that a single one fetches each round."""
+        n_agents, n_rounds = 8, 50
+        errors: List[Optional[Observation]] = []
+        fetched: List[int] = []
+        barrier = threading.Barrier(n_agents)
+
+        def _agent() -> None:
+            """Fetch or load the beacon of every round."""
+            cache = SharedRandomnessCache(str(tmp_path), keep=2, lease_timeout=60.0)
+            for drand_round in range(1, n_rounds + 1):
+                barrier.wait()
+                if cache.acquire(drand_round):
+                    fetched.append(drand_round)
+                    cache.store(beacon(drand_round))
+                observation = None
+                while observation is None:
+                    observation = cache.load(drand_round)
+                if observation != beacon(drand_round):
+                    errors.append(observation)
+
+        threads = [threading.Thread(target=_agent) for _ in range(n_agents)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=60)
+
+        assert errors == []
+        assert sorted(fetched) == list(range(1, n_rounds + 1))
@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Test the snapshot.py module of the skill."""
+
+# pylint: skip-file
+
+import json
+from dataclasses import replace
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+import pytest
+
+from packages.valory.skills.abstract_round_abci.base import (
+    ABCIAppInternalError,
+    RoundSequence,
+)
+from packages.valory.skills.hello_world_abci.rounds import CollectRandomnessRound, Event
+from packages.valory.skills.hello_world_abci.snapshot import (
+    PeriodSnapshot,
+    SnapshotStore,
+)
+from packages.valory.skills.hello_world_abci.tests.helpers import (
+    CHAIN_ID,
+    GENESIS_TIME,
+    PARTICIPANTS,
+    commit_block,
+    new_round_sequence,
+    run_period,
+)
+
+
+@pytest.fixture
+def round_sequence() -> RoundSequence:
+    """Get a round sequence at the first block of its third period."""
+    round_sequence = new_round_sequence()
+    round_sequence.init_chain(1)
+    commit_block(round_sequence, (round_sequence.latest_synchronized_data, Event.DONE))
+    for period in range(2):
+        run_period(round_sequence, period)
+    return round_sequence
+
+
+class TestPeriodSnapshot:
+    """Test `PeriodSnapshot`."""
+
+    def test_take(self, round_sequence: RoundSequence) -> None:
+        """Test that a snapshot keeps the outcome of the previous period."""
+        snapshot = PeriodSnapshot.take(round_sequence, CHAIN_ID, GENESIS_TIME)
+        assert snapshot.chain_id == CHAIN_ID
+        assert snapshot.genesis_time == GENESIS_TIME
+        assert snapshot.height == round_sequence.height == 9
+        assert snapshot.round_id == CollectRandomnessRound.auto_round_id()
+        assert snapshot.period_count == 2
+        assert snapshot.participants == PARTICIPANTS
+        assert snapshot.most_voted_randomness == f"{1:064x}"
+        assert snapshot.most_voted_keeper_address == PARTICIPANTS[1]
+        assert snapshot.printed_messages == ["message 1"]
+
+    def test_restore(self, round_sequence: RoundSequence) -> None:
+        """Test that a restored round sequence commits the next blocks as the original one."""
+        snapshot = PeriodSnapshot.from_json(
+            json.loads(
+                json.dumps(
+                    PeriodSnapshot.take(
+                        round_sequence, CHAIN_ID, GENESIS_TIME
+                    ).to_json()
+                )
+            )
+        )
+        restored = new_round_sequence()
+        snapshot.restore(restored, CHAIN_ID, GENESIS_TIME)
+
+        assert restored.height == round_sequence.height
+        assert restored.root_hash == round_sequence.root_hash
+        assert restored.current_round_id == round_sequence.current_round_id
+        synchronized_data = restored.latest_synchronized_data
+        assert synchronized_data.round_count == snapshot.round_count
+        assert synchronized_data.period_count == snapshot.period_count
+        assert restored.abci_app.last_timestamp == snapshot.timestamp
+        for attribute in (
+            "tm_height",
+            "last_round_transition_timestamp",
+            "last_round_transition_height",
+            "last_round_transition_root_hash",
+            "last_round_transition_tm_height",
+        ):
+            assert getattr(restored, attribute) == getattr(round_sequence, attribute)
+
+        # only the tail is replayed
+        for sequence in (round_sequence, restored):
+            run_period(sequence, 2)
+        assert restored.height == round_sequence.height
+        assert restored.root_hash == round_sequence.root_hash
+        assert restored.current_round_id == round_sequence.current_round_id
+
+    def test_restore_without_blocks(self, round_sequence: RoundSequence) -> None:
+        """Test that the blocks are not restored, and that the last timestamp is back after the next block."""
+        snapshot = PeriodSnapshot.take(round_sequence, CHAIN_ID, GENESIS_TIME)
+        restored = new_round_sequence()
+        snapshot.restore(restored, CHAIN_ID, GENESIS_TIME)
+        assert restored.blockchain.length == 0
+        with pytest.raises(ABCIAppInternalError, match="last timestamp is None"):
+            restored.last_timestamp
+        for sequence in (round_sequence, restored):
+            commit_block(sequence)
+        assert restored.blockchain.length == 1
+        assert restored.last_timestamp == round_sequence.last_timestamp
+
+    def test_restore_timeout(self, round_sequence: RoundSequence) -> None:
+        """Test that the timeouts of the restored round expire as in the original one."""
+        snapshot = PeriodSnapshot.take(round_sequence, CHAIN_ID, GENESIS_TIME)
+        restored = new_round_sequence()
+        snapshot.restore(restored, CHAIN_ID, GENESIS_TIME)
+        for sequence in (round_sequence, restored):
+            commit_block(sequence)
+            header = mock.MagicMock(
+                height=sequence.height + 1,
+                timestamp=sequence.abci_app.last_timestamp + timedelta(seconds=60),
+            )
+            sequence.begin_block(header, mock.MagicMock(), mock.MagicMock())
+            # the round has timed out, and has been scheduled again
+            assert (
+                sequence.latest_synchronized_data.round_count
+                == snapshot.round_count + 1
+            )
+        assert restored.current_round_id == round_sequence.current_round_id
+        assert restored.root_hash == round_sequence.root_hash
+
+    def test_restore_unknown_round(self, round_sequence: RoundSequence) -> None:
+        """Test that a snapshot of a round which is not a round of the app is not restored."""
+        snapshot = replace(
+            PeriodSnapshot.take(round_sequence, CHAIN_ID, GENESIS_TIME),
+            round_id="unknown",
+        )
+        restored = new_round_sequence()
+        with pytest.raises(ValueError, match="Unknown round 'unknown'"):
+            snapshot.restore(restored, CHAIN_ID, GENESIS_TIME)
+        assert restored.height == 0
+
+    @pytest.mark.parametrize(
+        "chain_id, genesis_time",
+        ((CHAIN_ID, "2023-01-01T00:00:00Z"), ("chain-other", GENESIS_TIME)),
+    )
+    def test_restore_other_chain(
+        self, round_sequence: RoundSequence, chain_id: str, genesis_time: str
+    ) -> None:
+        """Test that a snapshot taken on another chain is not restored."""
+        snapshot = PeriodSnapshot.take(round_sequence, CHAIN_ID, GENESIS_TIME)
+        restored = new_round_sequence()
+        with pytest.raises(ValueError, match="The snapshot was taken on chain"):
+            snapshot.restore(restored, chain_id, genesis_time)
+        assert restored.height == 0
+
+    @pytest.mark.parametrize(
+        "data, match",
+        (
+            ([], "Invalid snapshot"),
+            ({"version": 1}, "Unsupported snapshot version"),
+            ({"version": 3, "height": 1}, "Invalid snapshot"),
+        ),
+    )
+    def test_from_json_invalid(self, data: Any, match: str) -> None:
+        """Test that an invalid representation is rejected."""
+        with pytest.raises(ValueError, match=match):
+            PeriodSnapshot.from_json(data)
+
+
+class TestSnapshotStore:
+    """Test `SnapshotStore`."""
+
+    def test_invalid(self, tmp_path: Path) -> None:
+        """Test that a store must keep a snapshot."""
+        with pytest.raises(ValueError, match="must be positive"):
+            SnapshotStore(str(tmp_path), keep=0)
+
+    def test_save_and_latest(
+        self, round_sequence: RoundSequence, tmp_path: Path
+    ) -> None:
+        """Test that the latest snapshots are kept, and that the latest readable one is loaded."""
+        store = SnapshotStore(str(tmp_path / "snapshots"), keep=2)
+        assert store.latest() is None
+
+        snapshots = []
+        for period in range(2, 5):
+            snapshots.append(
+                PeriodSnapshot.take(round_sequence, CHAIN_ID, GENESIS_TIME)
+            )
+            store.save(snapshots[-1])
+            run_period(round_sequence, period)
+        assert sorted(path.name for path in store.directory.iterdir()) == [
+            "snapshot_000000000013.json",
+            "snapshot_000000000017.json",
+        ]
+        assert store.latest() == snapshots[-1]
+
+        (store.directory / "snapshot_000000000017.json").write_text("{")
+        assert store.latest() == snapshots[-2]
+
+    def test_save_failure(self, round_sequence: RoundSequence, tmp_path: Path) -> None:
+        """Test that a snapshot which cannot be written leaves no file behind."""
+        store = SnapshotStore(str(tmp_path))
+        with mock.patch.object(json, "dump", side_effect=OSError("disk full")):
+            with pytest.raises(OSError, match="disk full"):
+                store.save(PeriodSnapshot.take(round_sequence, CHAIN_ID, GENESIS_TIME))
+        assert list(tmp_path.iterdir()) == []
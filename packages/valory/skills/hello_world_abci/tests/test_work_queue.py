@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Test the work_queue.py module of the skill."""
+
+# pylint: skip-file
+
+import json
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from packages.valory.skills.hello_world_abci.work_queue import (
+    BLOCK_BYTES_SHARE,
+    MessageQueue,
+    QUEUE_FILE,
+    batch_budget,
+    batch_bytes,
+    message_id,
+    parse_batch,
+    slice_of,
+)
+
+
+MESSAGES = [f"message {i}" for i in range(10)]
+
+
+def test_message_id() -> None:
+    """Test that the id of a message only depends on its content."""
+    assert message_id("a") == message_id("a")
+    assert message_id("a") != message_id("b")
+    assert len(message_id("a")) == 32
+    assert 0 <= slice_of(message_id("a"), 3) < 3
+
+
+def test_batch_budget() -> None:
+    """Test that the batches are capped so that their transaction fits in a block."""
+    assert batch_budget(1000, 1_000_000) == 1000
+    assert batch_budget(1000, 400) == 400 // BLOCK_BYTES_SHARE
+
+
+@pytest.mark.parametrize(
+    "batch", ("not json", '{"a": 1}', '[["a"]]', '[["a", 1]]', '[[1, "a"]]')
+)
+def test_parse_invalid_batch(batch: str) -> None:
+    """Test that an invalid batch is not parsed."""
+    assert parse_batch(batch) is None
+
+
+class TestMessageQueue:
+    """Test `MessageQueue`."""
+
+    @pytest.mark.parametrize("kwargs", (dict(capacity=0), dict(max_message_bytes=0)))
+    def test_invalid(self, tmp_path: Path, kwargs: dict) -> None:
+        """Test that an invalid configuration is rejected."""
+        with pytest.raises(ValueError, match="must be positive"):
+            MessageQueue(str(tmp_path), **kwargs)
+
+    def test_submit(self, tmp_path: Path) -> None:
+        """Test that the messages are queued once, and persisted."""
+        queue = MessageQueue(str(tmp_path))
+        ids = queue.submit(MESSAGES[:2])
+        assert ids == [message_id(message) for message in MESSAGES[:2]]
+        assert queue.submit(MESSAGES[:1]) == ids[:1]
+        assert len(queue) == 2
+
+        reloaded = MessageQueue(str(tmp_path))
+        assert len(reloaded) == 2
+        assert reloaded.batch(10, 10_000) == list(zip(ids, MESSAGES[:2]))
+
+    def test_capacity(self, tmp_path: Path) -> None:
+        """Test that either all the messages are queued, or none if they do not fit."""
+        queue = MessageQueue(str(tmp_path), capacity=3)
+        assert queue.submit(MESSAGES[:2]) is not None
+        assert queue.submit(MESSAGES[2:4]) is None
+        assert len(queue) == 2
+        # the messages which are already queued do not take any room
+        assert queue.submit(MESSAGES[1:3]) is not None
+        assert queue.is_full
+        assert queue.to_json() == {"queued": 3, "capacity": 3, "full": True}
+
+    def test_message_too_large(self, tmp_path: Path) -> None:
+        """Test that a message larger than the maximum size is rejected."""
+        queue = MessageQueue(str(tmp_path), max_message_bytes=3)
+        with pytest.raises(ValueError, match="larger than 3 bytes"):
+            queue.submit(["abc", "✓✓"])
+        assert len(queue) == 0
+
+    def test_submit_not_persisted(self, tmp_path: Path) -> None:
+        """Test that the messages which cannot be persisted are not queued."""
+        queue = MessageQueue(str(tmp_path))
+        with mock.patch("os.replace", side_effect=OSError("read-only")):
+            with pytest.raises(OSError, match="read-only"):
+                queue.submit(MESSAGES[:2])
+        assert len(queue) == 0
+        assert list(tmp_path.iterdir()) == []
+
+    def test_invalid_file(self, tmp_path: Path) -> None:
+        """Test that an invalid persisted queue is rejected."""
+        (tmp_path / QUEUE_FILE).write_text(json.dumps({"version": 0}))
+        with pytest.raises(ValueError, match="Unsupported message queue"):
+            MessageQueue(str(tmp_path))
+        (tmp_path / QUEUE_FILE).write_text(json.dumps({"version": 1, "messages": 1}))
+        with pytest.raises(ValueError, match="Invalid message queue"):
+            MessageQueue(str(tmp_path))
+
+    def test_batch(self, tmp_path: Path) -> None:
+        """Test that the batches hold the oldest messages of a slice, within the budget."""
+        queue = MessageQueue(str(tmp_path))
+        queue.submit(MESSAGES)
+        queued = list(zip(map(message_id, MESSAGES), MESSAGES))
+
+        assert queue.batch(3, 10_000) == queued[:3]
+        full_size = batch_bytes(queued[:3])
+        assert queue.batch(10, full_size) == queued[:3]
+        assert queue.batch(10, full_size - 1) == queued[:2]
+        assert queue.batch(10, 1) == []
+
+        slices = [queue.batch(10, 10_000, index, 3) for index in range(3)]
+        assert sorted(message for batch in slices for message in batch) == sorted(
+            queued
+        )
+        for index, batch in enumerate(slices):
+            assert all(slice_of(id_, 3) == index for id_, _ in batch)
+        # the batches do not remove the messages from the queue
+        assert len(queue) == len(MESSAGES)
+
+    def test_acknowledge(self, tmp_path: Path) -> None:
+        """Test that the acknowledged messages are removed from the queue."""
+        queue = MessageQueue(str(tmp_path))
+        ids = queue.submit(MESSAGES[:3])
+        assert ids is not None
+        assert queue.acknowledge([ids[0], ids[0], "unknown"]) == 1
+        assert queue.acknowledge(["unknown"]) == 0
+        assert [id_ for id_, _ in MessageQueue(str(tmp_path)).batch(10, 10_000)] == ids[
+            1:
+        ]
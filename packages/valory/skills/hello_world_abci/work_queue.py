@@ -0,0 +1,252 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""This module contains the queue of the messages submitted to an agent, which the keepers print in batches."""
+
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+QUEUE_VERSION = 1
+QUEUE_FILE = "queue.json"
+# the batch is json encoded in the payload, which is json encoded again in the transaction, so its
+# escaped characters may double its size, and the block also holds the transactions of the other agents
+BLOCK_BYTES_SHARE = 4
+
+QueuedMessage = Tuple[str, str]
+
+
+def message_id(message: str) -> str:
+    """Get the id of a message, the first 16 bytes of its sha256 hash, so that a message submitted twice is only queued once."""
+    return hashlib.sha256(message.encode("utf-8")).hexdigest()[:32]
+
+
+def slice_of(id_: str, n_slices: int) -> int:
+    """Get the slice of the work a message belongs to, out of `n_slices` disjoint ones."""
+    return int(id_, 16) % n_slices
+
+
+def batch_bytes(batch: Sequence[QueuedMessage]) -> int:
+    """Get the size of a batch, as encoded in a payload."""
+    return len(json.dumps(batch).encode("utf-8"))
+
+
+def batch_budget(max_batch_bytes: int, block_max_bytes: int) -> int:
+    """
+    Get the largest size of a batch, so that its transaction fits in a block.
+
+    :param max_batch_bytes: the configured largest size of a batch.
+    :param block_max_bytes: the `max_bytes` of the blocks, from the consensus parameters of the genesis.
+    :return: the largest size of a batch, in bytes.
+    """
+    return min(max_batch_bytes, block_max_bytes // BLOCK_BYTES_SHARE)
+
+
+def parse_batch(batch: Optional[str]) -> Optional[List[QueuedMessage]]:
+    """
+    Parse a batch, as encoded in a payload.
+
+    :param batch: the json list of the ids and messages of the batch.
+    :return: the ids and messages, or `None` if the batch is not a valid json list of them.
+    """
+    if batch is None:
+        return None
+    try:
+        return _to_messages(json.loads(batch))
+    except ValueError:
+        return None
+
+
+def _to_messages(items: Any) -> Optional[List[QueuedMessage]]:
+    """Get the ids and messages of a json list of them, or `None` if it is not one."""
+    if not isinstance(items, list) or not all(
+        isinstance(item, list)
+        and len(item) == 2
+        and all(isinstance(value, str) for value in item)
+        for item in items
+    ):
+        return None
+    return list(map(tuple, items))
+
+
+class MessageQueue:
+    """
+    A bounded queue of the messages submitted to an agent, persisted in a directory.
+
+    The messages are kept in the order they were submitted, by their id, until they are acknowledged,
+    i.e. until a batch which holds them has been committed. The queue is written to a temporary file
+    which is then renamed after every change, so that a crash never loses an accepted message.
+    """
+
+    def __init__(
+        self, directory: str, capacity: int = 1000, max_message_bytes: int = 1024
+    ) -> None:
+        """
+        Initialize the queue, loading the messages persisted in the directory.
+
+        :param directory: the directory of the queue, created if it does not exist.
+        :param capacity: the maximum number of queued messages.
+        :param max_message_bytes: the maximum size of a message, utf-8 encoded.
+        :raises ValueError: if the configuration is invalid.
+        """
+        if capacity < 1 or max_message_bytes < 1:
+            raise ValueError(
+                f"The capacity ({capacity}) and the maximum message size "
+                f"({max_message_bytes}) of the queue must be positive."
+            )
+        self.path = Path(directory) / QUEUE_FILE
+        self.capacity = capacity
+        self.max_message_bytes = max_message_bytes
+        self._messages: "OrderedDict[str, str]" = OrderedDict(self._load())
+
+    def __len__(self) -> int:
+        """Get the number of queued messages."""
+        return len(self._messages)
+
+    @property
+    def is_full(self) -> bool:
+        """Get whether the queue cannot take any new message."""
+        return len(self._messages) >= self.capacity
+
+    def _load(self) -> List[QueuedMessage]:
+        """Load the persisted messages, if any."""
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return []
+        if not isinstance(data, dict) or data.get("version") != QUEUE_VERSION:
+            raise ValueError(f"Unsupported message queue in {self.path}.")
+        messages = _to_messages(data.get("messages"))
+        if messages is None:
+            raise ValueError(f"Invalid message queue in {self.path}.")
+        return messages
+
+    def _save(self) -> None:
+        """Persist the queued messages."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(
+                    {
+                        "version": QUEUE_VERSION,
+                        "messages": list(self._messages.items()),
+                    },
+                    file,
+                )
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    def submit(self, messages: Sequence[str]) -> Optional[List[str]]:
+        """
+        Queue messages, either all of them or none.
+
+        A message which is already queued is not queued again, and does not take any room.
+
+        :param messages: the messages.
+        :return: the ids of the messages, or `None` if the queue does not have room for all of them.
+        :raises ValueError: if a message is larger than the maximum message size.
+        :raises OSError: if the queue cannot be persisted, in which case no message is queued.
+        """
+        too_large = [
+            message
+            for message in messages
+            if len(message.encode("utf-8")) > self.max_message_bytes
+        ]
+        if too_large:
+            raise ValueError(
+                f"{len(too_large)} message(s) are larger than {self.max_message_bytes} bytes."
+            )
+        ids = [message_id(message) for message in messages]
+        new = {
+            id_: message
+            for id_, message in zip(ids, messages)
+            if id_ not in self._messages
+        }
+        if len(self._messages) + len(new) > self.capacity:
+            return None
+        if new:
+            self._messages.update(new)
+            try:
+                self._save()
+            except OSError:
+                # the messages which could not be persisted are not accepted
+                for id_ in new:
+                    del self._messages[id_]
+                raise
+        return ids
+
+    def batch(
+        self,
+        max_count: int,
+        max_bytes: int,
+        slice_index: int = 0,
+        n_slices: int = 1,
+    ) -> List[QueuedMessage]:
+        """
+        Get the oldest messages of a slice, within a budget, without removing them from the queue.
+
+        :param max_count: the maximum number of messages of the batch.
+        :param max_bytes: the maximum size of the batch, as encoded in a payload.
+        :param slice_index: the index of the slice of the messages.
+        :param n_slices: the number of disjoint slices the messages are split in.
+        :return: the ids and messages of the batch, oldest first.
+        """
+        batch: List[QueuedMessage] = []
+        # the size of the empty json list
+        size = 2
+        for id_, message in self._messages.items():
+            if len(batch) >= max_count:
+                break
+            if slice_of(id_, n_slices) != slice_index:
+                continue
+            # the size of the message, and of the separator from the previous one
+            message_bytes = batch_bytes([(id_, message)]) - 2 + int(bool(batch)) * 2
+            if size + message_bytes > max_bytes:
+                break
+            batch.append((id_, message))
+            size += message_bytes
+        return batch
+
+    def acknowledge(self, ids: Iterable[str]) -> int:
+        """
+        Remove the messages of a committed batch.
+
+        :param ids: the ids of the messages.
+        :return: the number of removed messages, which were queued.
+        """
+        removed = [id_ for id_ in set(ids) if self._messages.pop(id_, None) is not None]
+        if removed:
+            self._save()
+        return len(removed)
+
+    def to_json(self) -> Dict[str, Any]:
+        """Get a json serializable representation of the state of the queue."""
+        return {
+            "queued": len(self._messages),
+            "capacity": self.capacity,
+            "full": self.is_full,
+        }
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""
+Compare the size and the speed of the binary payload codec with the json encoding.
+
+For each payload type of the Hello World ABCI app, the script reports the size of a payload encoded
+by `BaseTxPayload.encode` and by the binary codec, alone and within a batch of the payloads of all
+the agents, where the addresses are interned, as well as the encoding and decoding times.
+
+Usage:
+    python scripts/benchmark_payload_codec.py --agents 4 --repeat 2000
+    python scripts/benchmark_payload_codec.py --json
+"""
+
+import argparse
+import json
+import sys
+import timeit
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Sequence
+
+
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.append(str(ROOT_DIR))
+
+# pylint: disable=wrong-import-position
+from packages.valory.skills.abstract_round_abci.base import BaseTxPayload  # noqa: E402
+from packages.valory.skills.hello_world_abci.codec import (  # noqa: E402
+    decode_payload,
+    encode_payload,
+    encode_payloads,
+)
+from packages.valory.skills.hello_world_abci.payloads import (  # noqa: E402
+    CollectRandomnessPayload,
+    PRINTED_MESSAGE_FORMAT,
+    PrintMessagePayload,
+    RegistrationPayload,
+    ResetPayload,
+    SelectKeeperPayload,
+)
+
+
+DEFAULT_AGENTS = 4
+DEFAULT_REPEAT = 2000
+RANDOMNESS = "d1c29dce46f979f9748210d24bce4eae8be91272f5ca1a6aea2832d3dd676f51"
+PERIOD = 1234
+ROUND_COUNT = 6170
+
+
+@dataclass
+class CodecResult:  # pylint: disable=too-many-instance-attributes
+    """The result of the benchmark of a payload type."""
+
+    payload_type: str
+    json_bytes: int
+    binary_bytes: int
+    batched_binary_bytes: float
+    json_encode_us: float
+    binary_encode_us: float
+    json_decode_us: float
+    binary_decode_us: float
+
+
+def build_payloads(n_agents: int) -> Dict[str, List[BaseTxPayload]]:
+    """Build the payloads of all the agents, for each payload type, as they are sent in a period."""
+    agents = [f"0x{i + 1:040x}" for i in range(n_agents)]
+    keeper = agents[0]
+    payloads: Dict[str, List[BaseTxPayload]] = {
+        RegistrationPayload.__name__: [RegistrationPayload(a) for a in agents],
+        CollectRandomnessPayload.__name__: [
+            CollectRandomnessPayload(a, 3_000_000, RANDOMNESS) for a in agents
+        ],
+        SelectKeeperPayload.__name__: [SelectKeeperPayload(a, keeper) for a in agents],
+        PrintMessagePayload.__name__: [
+            PrintMessagePayload(
+                a,
+                PRINTED_MESSAGE_FORMAT.format(
+                    agent_name=f"agent_{i}",
+                    address=a,
+                    period=PERIOD,
+                    message="HELLO_WORLD!" if a == keeper else ":|",
+                ),
+            )
+            for i, a in enumerate(agents)
+        ],
+        ResetPayload.__name__: [ResetPayload(a, PERIOD) for a in agents],
+    }
+    for type_payloads in payloads.values():
+        for payload in type_payloads:
+            object.__setattr__(payload, "round_count", ROUND_COUNT)
+    return payloads
+
+
+def _time_us(function: Callable[[], Any], repeat: int) -> float:
+    """Get the mean time of a call, in microseconds."""
+    return 1e6 * timeit.timeit(function, number=repeat) / repeat
+
+
+def run_benchmark(payloads: Sequence[BaseTxPayload], repeat: int) -> CodecResult:
+    """
+    Benchmark the encodings of the payloads of a single type.
+
+    :param payloads: the payloads of all the agents.
+    :param repeat: the number of encodings and decodings to time.
+    :return: the result of the benchmark.
+    """
+    payload = payloads[0]
+    json_encoded = payload.encode()
+    binary_encoded = encode_payload(payload)
+    if decode_payload(binary_encoded) != payload:  # pragma: nocover
+        raise ValueError(f"The codec does not round-trip {payload}.")
+    return CodecResult(
+        payload_type=type(payload).__name__,
+        json_bytes=len(json_encoded),
+        binary_bytes=len(binary_encoded),
+        batched_binary_bytes=len(encode_payloads(payloads)) / len(payloads),
+        json_encode_us=_time_us(payload.encode, repeat),
+        binary_encode_us=_time_us(lambda: encode_payload(payload), repeat),
+        json_decode_us=_time_us(lambda: BaseTxPayload.decode(json_encoded), repeat),
+        binary_decode_us=_time_us(lambda: decode_payload(binary_encoded), repeat),
+    )
+
+
+def format_results(results: Sequence[CodecResult]) -> str:
+    """Format the results as a table."""
+    header = [
+        "payload",
+        "json B",
+        "binary B",
+        "batched B",
+        "json enc us",
+        "bin enc us",
+        "json dec us",
+        "bin dec us",
+    ]
+    rows = [header]
+    for result in results:
+        rows.append(
+            [
+                result.payload_type,
+                str(result.json_bytes),
+                str(result.binary_bytes),
+                f"{result.batched_binary_bytes:.1f}",
+                f"{result.json_encode_us:.2f}",
+                f"{result.binary_encode_us:.2f}",
+                f"{result.json_decode_us:.2f}",
+                f"{result.binary_decode_us:.2f}",
+            ]
+        )
+    widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+    return "\n".join(
+        "  ".join(cell.rjust(width) for cell, width in zip(row, widths)) for row in rows
+    )
+
+
+def get_args() -> argparse.Namespace:
+    """Get the script arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument(
+        "--agents",
+        type=int,
+        default=DEFAULT_AGENTS,
+        help="the number of agents whose payloads are batched.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=DEFAULT_REPEAT,
+        help="the number of encodings and decodings to time.",
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="print the results as json."
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    args = get_args()
+    results = [
+        run_benchmark(payloads, args.repeat)
+        for payloads in build_payloads(args.agents).values()
+    ]
+    if args.json:
+        print(json.dumps([asdict(result) for result in results], indent=2))
+    else:
+        print(format_results(results))
+
+
+if __name__ == "__main__":
+    main()
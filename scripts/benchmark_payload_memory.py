@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""
+Measure the memory held by the payloads of the Hello World ABCI app.
+
+The payloads of N agents over P periods are decoded from their json encoding, as when the transactions
+of the blocks are delivered or replayed while catching up, and kept alive, as the rounds keep them in
+the synchronized data. The script reports the bytes held per payload and the decoding time, with and
+without the interning of the shared string fields of the payloads.
+
+Usage:
+    python scripts/benchmark_payload_memory.py --agents 64 --periods 50
+    python scripts/benchmark_payload_memory.py --json
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Generator, List, Sequence, Type
+
+
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.append(str(ROOT_DIR))
+
+# pylint: disable=wrong-import-position
+from packages.valory.skills.abstract_round_abci.base import BaseTxPayload  # noqa: E402
+from packages.valory.skills.hello_world_abci.payloads import (  # noqa: E402
+    CollectRandomnessPayload,
+    HelloWorldABCIBasePayload,
+    PRINTED_MESSAGE_FORMAT,
+    PrintMessagePayload,
+    RegistrationPayload,
+    ResetPayload,
+    SelectKeeperPayload,
+)
+
+
+DEFAULT_AGENTS = 64
+DEFAULT_PERIODS = 50
+PAYLOAD_TYPES: Sequence[Type[HelloWorldABCIBasePayload]] = (
+    RegistrationPayload,
+    CollectRandomnessPayload,
+    SelectKeeperPayload,
+    PrintMessagePayload,
+    ResetPayload,
+)
+
+
+@dataclass
+class MemoryResult:
+    """The result of the benchmark of a payload type."""
+
+    payload_type: str
+    interned: bool
+    bytes_per_payload: float
+    decode_us: float
+
+
+@contextmanager
+def interning_disabled() -> Generator[None, None, None]:
+    """Disable the interning of the fields of the payloads, to measure the baseline."""
+    initial = {cls: cls.interned_fields for cls in PAYLOAD_TYPES}
+    try:
+        for cls in PAYLOAD_TYPES:
+            cls.interned_fields = ()
+        yield
+    finally:
+        for cls, interned_fields in initial.items():
+            cls.interned_fields = interned_fields
+
+
+def encode_payloads(
+    payload_type: Type[HelloWorldABCIBasePayload], n_agents: int, n_periods: int
+) -> List[bytes]:
+    """Encode the payloads of a type sent by all the agents over all the periods."""
+    agents = [f"0x{i + 1:040x}" for i in range(n_agents)]
+    encoded = []
+    for period in range(n_periods):
+        randomness = f"{period:064x}"
+        keeper = agents[period % n_agents]
+        for i, agent in enumerate(agents):
+            payload: BaseTxPayload
+            if payload_type is CollectRandomnessPayload:
+                payload = CollectRandomnessPayload(agent, period, randomness)
+            elif payload_type is SelectKeeperPayload:
+                payload = SelectKeeperPayload(agent, keeper)
+            elif payload_type is PrintMessagePayload:
+                message = PRINTED_MESSAGE_FORMAT.format(
+                    agent_name=f"agent_{i}", address=agent, period=period, message=":|"
+                )
+                payload = PrintMessagePayload(agent, message)
+            elif payload_type is ResetPayload:
+                payload = ResetPayload(agent, period)
+            else:
+                payload = RegistrationPayload(agent)
+            encoded.append(payload.encode())
+    return encoded
+
+
+def run_benchmark(encoded: Sequence[bytes], payload_type: str) -> MemoryResult:
+    """
+    Decode the payloads, keeping them alive, and measure the memory they hold.
+
+    :param encoded: the encoded payloads.
+    :param payload_type: the name of the payload type.
+    :return: the result of the benchmark.
+    """
+    interned = bool(PAYLOAD_TYPES[0].interned_fields)
+    tracemalloc.start()
+    try:
+        payloads = [BaseTxPayload.decode(data) for data in encoded]
+        held, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del payloads
+
+    # the decoding is timed separately, as tracing slows it down
+    start = time.perf_counter()
+    payloads = [BaseTxPayload.decode(data) for data in encoded]
+    seconds = time.perf_counter() - start
+    return MemoryResult(
+        payload_type=payload_type,
+        interned=interned,
+        bytes_per_payload=held / len(payloads),
+        decode_us=1e6 * seconds / len(payloads),
+    )
+
+
+def format_results(results: Sequence[MemoryResult]) -> str:
+    """Format the results as a table."""
+    header = ["payload", "interned", "B/payload", "decode us"]
+    rows = [header]
+    for result in results:
+        rows.append(
+            [
+                result.payload_type,
+                str(result.interned),
+                f"{result.bytes_per_payload:.1f}",
+                f"{result.decode_us:.2f}",
+            ]
+        )
+    widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+    return "\n".join(
+        "  ".join(cell.rjust(width) for cell, width in zip(row, widths)) for row in rows
+    )
+
+
+def get_args() -> argparse.Namespace:
+    """Get the script arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument(
+        "--agents",
+        type=int,
+        default=DEFAULT_AGENTS,
+        help="the number of simulated agents.",
+    )
+    parser.add_argument(
+        "--periods",
+        type=int,
+        default=DEFAULT_PERIODS,
+        help="the number of periods whose payloads are kept.",
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="print the results as json."
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    args = get_args()
+    results = []
+    for payload_type in PAYLOAD_TYPES:
+        encoded = encode_payloads(payload_type, args.agents, args.periods)
+        with interning_disabled():
+            results.append(run_benchmark(encoded, payload_type.__name__))
+        results.append(run_benchmark(encoded, payload_type.__name__))
+
+    if args.json:
+        output: List[Dict] = [asdict(result) for result in results]
+        print(json.dumps(output, indent=2))
+    else:
+        print(format_results(results))
+
+
+if __name__ == "__main__":
+    main()
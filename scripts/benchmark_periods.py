@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""
+Benchmark the period throughput of the Hello World ABCI app, without Tendermint.
+
+The app is instantiated in-process and the synthetic payloads of N simulated agents are fed
+through the `check_payload`, `process_payload` and `end_block` of every round, as the ABCI
+handler would do once the transactions are delivered. The benchmark reports the periods per
+second, the mean latency of each round and the memory allocated per period.
+
+Usage:
+    python scripts/benchmark_periods.py --agents 1 4 16 --periods 50
+    python scripts/benchmark_periods.py --select-keeper-locally --json
+    python scripts/benchmark_periods.py --pipeline-randomness
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, cast
+
+
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.append(str(ROOT_DIR))
+
+# pylint: disable=wrong-import-position
+from packages.valory.skills.abstract_round_abci.base import (  # noqa: E402
+    AbciAppDB,
+    AbstractRound,
+    BaseTxPayload,
+)
+from packages.valory.skills.hello_world_abci.keeper import KeeperSelector  # noqa: E402
+from packages.valory.skills.hello_world_abci.payloads import (  # noqa: E402
+    CollectRandomnessPayload,
+    PrintMessagePayload,
+    RegistrationPayload,
+    ResetPayload,
+    SelectKeeperPayload,
+)
+from packages.valory.skills.hello_world_abci.rounds import (  # noqa: E402
+    CollectRandomnessRound,
+    Event,
+    HelloWorldAbciApp,
+    PrintMessageRound,
+    RegistrationRound,
+    ResetAndPauseRound,
+    SelectKeeperRound,
+    SynchronizedData,
+)
+
+
+DEFAULT_AGENTS = (1, 4, 16, 64, 256)
+DEFAULT_PERIODS = 20
+CLEANUP_HISTORY_DEPTH = 1
+SAFE_CONTRACT_ADDRESS = "0x" + "0" * 40
+
+
+@dataclass
+class BenchmarkResult:  # pylint: disable=too-many-instance-attributes
+    """The result of a benchmark run."""
+
+    n_agents: int
+    n_periods: int
+    select_keeper_locally: bool
+    pipeline_randomness: bool = False
+    seconds: float = 0.0
+    round_seconds: Dict[str, List[float]] = field(
+        default_factory=lambda: defaultdict(list)
+    )
+    peak_bytes_per_period: int = 0
+    allocated_blocks_per_period: int = 0
+
+    @property
+    def periods_per_second(self) -> float:
+        """Get the throughput of the app."""
+        return self.n_periods / self.seconds if self.seconds else float("inf")
+
+    def mean_round_ms(self) -> Dict[str, float]:
+        """Get the mean latency of each round, in milliseconds."""
+        return {
+            round_id: 1000 * sum(latencies) / len(latencies)
+            for round_id, latencies in self.round_seconds.items()
+        }
+
+    def to_json(self) -> Dict[str, Any]:
+        """Get a json serializable summary of the result."""
+        return {
+            "n_agents": self.n_agents,
+            "n_periods": self.n_periods,
+            "select_keeper_locally": self.select_keeper_locally,
+            "pipeline_randomness": self.pipeline_randomness,
+            "seconds": self.seconds,
+            "periods_per_second": self.periods_per_second,
+            "mean_round_ms": self.mean_round_ms(),
+            "peak_bytes_per_period": self.peak_bytes_per_period,
+            "allocated_blocks_per_period": self.allocated_blocks_per_period,
+        }
+
+
+class PeriodDriver:
+    """Drive the Hello World ABCI app with the payloads of simulated agents."""
+
+    def __init__(self, n_agents: int, randomness_seed: str = "benchmark") -> None:
+        """Initialize the driver and set up the app."""
+        self.agents = tuple(f"0x{i:040x}" for i in range(n_agents))
+        self._randomness_seed = randomness_seed
+        self._keeper_selector = KeeperSelector()
+        db = AbciAppDB(
+            setup_data=AbciAppDB.data_to_lists(
+                dict(
+                    all_participants=self.agents,
+                    participants=self.agents,
+                    consensus_threshold=None,
+                    safe_contract_address=SAFE_CONTRACT_ADDRESS,
+                )
+            ),
+            cross_period_persisted_keys=HelloWorldAbciApp.cross_period_persisted_keys,
+        )
+        logger = logging.getLogger("benchmark_periods")
+        logger.setLevel(logging.WARNING)
+        # the rounds of the app do not use the skill context
+        self.app = HelloWorldAbciApp(SynchronizedData(db), logger, cast(Any, None))
+        self.app.setup()
+
+    @property
+    def synchronized_data(self) -> SynchronizedData:
+        """Get the synchronized data of the app."""
+        return cast(SynchronizedData, self.app.synchronized_data)
+
+    def _randomness(self, period: int) -> str:
+        """Get the synthetic randomness of a period."""
+        return f"{self._randomness_seed}-{period}".encode("utf-8").hex()
+
+    def _payloads(self, round_: AbstractRound) -> List[BaseTxPayload]:
+        """Build the payloads of all the agents for the given round."""
+        synchronized_data = self.synchronized_data
+        period = synchronized_data.period_count
+        payloads: List[BaseTxPayload]
+        if isinstance(round_, RegistrationRound):
+            payloads = [RegistrationPayload(agent) for agent in self.agents]
+        elif isinstance(round_, CollectRandomnessRound):
+            randomness = self._randomness(period)
+            payloads = [
+                CollectRandomnessPayload(agent, period, randomness)
+                for agent in self.agents
+            ]
+        elif isinstance(round_, SelectKeeperRound):
+            keeper = self._keeper_selector.select(
+                synchronized_data.participants,
+                synchronized_data.most_voted_randomness,
+            )
+            payloads = [SelectKeeperPayload(agent, keeper) for agent in self.agents]
+        elif isinstance(round_, PrintMessageRound):
+            next_round_id, next_randomness = (
+                (period + 1, self._randomness(period + 1))
+                if round_.pipeline_randomness
+                else (None, None)
+            )
+            payloads = [
+                PrintMessagePayload(
+                    agent,
+                    f"Agent {agent} in period {period} says: :|",
+                    next_round_id,
+                    next_randomness,
+                )
+                for agent in self.agents
+            ]
+        elif isinstance(round_, ResetAndPauseRound):
+            payloads = [ResetPayload(agent, period) for agent in self.agents]
+        else:  # pragma: nocover
+            raise ValueError(f"Unknown round {round_.round_id}.")
+
+        for payload in payloads:
+            # set by `send_a2a_transaction` in the behaviours
+            object.__setattr__(payload, "round_count", synchronized_data.round_count)
+        return payloads
+
+    def run_round(self) -> Tuple[str, float]:
+        """
+        Run the current round until its end.
+
+        :return: the id of the round and the time spent by the app, excluding the creation of the payloads.
+        """
+        round_ = self.app.current_round
+        payloads = self._payloads(round_)
+        start = time.perf_counter()
+        for payload in payloads:
+            round_.check_payload(payload)
+            round_.process_payload(payload)
+        res = round_.end_block()
+        if res is None:
+            raise ValueError(f"Round {round_.round_id} did not end.")
+        synchronized_data, event = res
+        self.app.process_event(cast(Event, event), synchronized_data)
+        return round_.round_id, time.perf_counter() - start
+
+    def run_period(self, latencies: Optional[Dict[str, List[float]]] = None) -> None:
+        """Run the rounds of a period, until the app is reset."""
+        while True:
+            round_id, seconds = self.run_round()
+            if latencies is not None:
+                latencies[round_id].append(seconds)
+            if round_id == ResetAndPauseRound.auto_round_id():
+                break
+        self.app.cleanup(CLEANUP_HISTORY_DEPTH)
+
+
+def run_benchmark(
+    n_agents: int,
+    n_periods: int,
+    select_keeper_locally: bool = False,
+    pipeline_randomness: bool = False,
+) -> BenchmarkResult:
+    """
+    Benchmark the app with the given number of agents.
+
+    The first period, which includes the registration, is not measured.
+    The time spent creating the synthetic payloads is not accounted for.
+
+    :param n_agents: the number of simulated agents.
+    :param n_periods: the number of measured periods.
+    :param select_keeper_locally: whether to skip the `SelectKeeperRound`.
+    :param pipeline_randomness: whether to agree on the randomness of each period in the previous one.
+    :return: the result of the benchmark.
+    """
+    result = BenchmarkResult(
+        n_agents, n_periods, select_keeper_locally, pipeline_randomness
+    )
+    initial_select_keeper_locally = CollectRandomnessRound.select_keeper_locally
+    initial_pipeline_randomness = PrintMessageRound.pipeline_randomness
+    CollectRandomnessRound.select_keeper_locally = select_keeper_locally
+    PrintMessageRound.pipeline_randomness = pipeline_randomness
+    try:
+        driver = PeriodDriver(n_agents)
+        driver.run_period()
+
+        for _ in range(n_periods):
+            driver.run_period(result.round_seconds)
+        result.seconds = sum(map(sum, result.round_seconds.values()))
+
+        # the allocations are measured separately, as tracing slows the app down
+        tracemalloc.start()
+        try:
+            before = tracemalloc.take_snapshot()
+            tracemalloc.reset_peak()
+            driver.run_period()
+            _, result.peak_bytes_per_period = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+        result.allocated_blocks_per_period = sum(
+            max(stat.count_diff, 0) for stat in after.compare_to(before, "filename")
+        )
+    finally:
+        CollectRandomnessRound.select_keeper_locally = initial_select_keeper_locally
+        PrintMessageRound.pipeline_randomness = initial_pipeline_randomness
+    return result
+
+
+def format_results(results: Sequence[BenchmarkResult]) -> str:
+    """Format the results as a table."""
+    round_ids = sorted({r for result in results for r in result.round_seconds})
+    header = ["agents", "periods/s", "peak KiB", *[f"{r} ms" for r in round_ids]]
+    rows = [header]
+    for result in results:
+        mean_round_ms = result.mean_round_ms()
+        rows.append(
+            [
+                str(result.n_agents),
+                f"{result.periods_per_second:.1f}",
+                f"{result.peak_bytes_per_period / 1024:.1f}",
+                *[
+                    f"{mean_round_ms[r]:.3f}" if r in mean_round_ms else "-"
+                    for r in round_ids
+                ],
+            ]
+        )
+    widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+    return "\n".join(
+        "  ".join(cell.rjust(width) for cell, width in zip(row, widths)) for row in rows
+    )
+
+
+def get_args() -> argparse.Namespace:
+    """Get the script arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument(
+        "--agents",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_AGENTS),
+        help="the numbers of simulated agents to benchmark.",
+    )
+    parser.add_argument(
+        "--periods",
+        type=int,
+        default=DEFAULT_PERIODS,
+        help="the number of measured periods.",
+    )
+    parser.add_argument(
+        "--select-keeper-locally",
+        action="store_true",
+        help="derive the keeper at the end of the CollectRandomnessRound.",
+    )
+    parser.add_argument(
+        "--pipeline-randomness",
+        action="store_true",
+        help="agree on the randomness of each period in the PrintMessageRound of the previous one.",
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="print the results as json."
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    args = get_args()
+    results = [
+        run_benchmark(
+            n_agents,
+            args.periods,
+            args.select_keeper_locally,
+            args.pipeline_randomness,
+        )
+        for n_agents in args.agents
+    ]
+    if args.json:
+        print(json.dumps([result.to_json() for result in results], indent=2))
+    else:
+        print(format_results(results))
+
+
+if __name__ == "__main__":
+    main()
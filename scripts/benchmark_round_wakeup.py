@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""
+Benchmark the gap between a round transition and the start of the behaviour of the next round.
+
+A single agent runs the real `HelloWorldRoundBehaviour` on an asyncio loop, called every `tick_interval`
+seconds by the `PeriodicCaller` of the framework, as in the agent loop. The behaviours get no response
+from the decision maker nor from the http servers, so that the agent is idle between the transitions.
+The app is moved to the next round at random times, and, if `wake_on_round_transition` is set,
+the round transition is then notified, as the ABCI handler does once it has handled the request.
+
+The benchmark reports the gap between each transition and the start of the next behaviour,
+the number of acts per second and the share of a cpu used by the agent.
+
+Usage:
+    python scripts/benchmark_round_wakeup.py
+    python scripts/benchmark_round_wakeup.py --tick-intervals 0.001 0.05 --transitions 100 --json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import statistics
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any, Dict, List, Sequence, cast
+
+
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.append(str(ROOT_DIR))
+
+# pylint: disable=wrong-import-position
+from aea.helpers.async_utils import PeriodicCaller  # noqa: E402
+
+from scripts.simulate_service import SimulatedAgent, SkillFactory  # noqa: E402
+
+from packages.valory.skills.abstract_round_abci.behaviours import (  # noqa: E402
+    AbstractRoundBehaviour,
+)
+from packages.valory.skills.hello_world_abci.history import (  # noqa: E402
+    PrintedMessages,
+)
+from packages.valory.skills.hello_world_abci.rounds import (  # noqa: E402
+    Event,
+    SynchronizedData,
+)
+
+
+DEFAULT_TICK_INTERVALS = (0.001, 0.01, 0.1)
+DEFAULT_TRANSITIONS = 50
+# the range of the random time between two transitions, in seconds
+MIN_ROUND_SECONDS = 0.1
+MAX_ROUND_SECONDS = 0.2
+ADDRESS = "0x" + "00" * 19 + "01"
+RANDOMNESS = "00" * 32
+
+
+@dataclass
+class WakeupResult:
+    """The result of a benchmark run."""
+
+    tick_interval: float
+    wake_on_round_transition: bool
+    seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    acts: int = 0
+    gaps: List[float] = field(default_factory=list)
+
+    @property
+    def mean_gap_ms(self) -> float:
+        """Get the mean gap between a transition and the start of the next behaviour, in milliseconds."""
+        return 1000 * statistics.mean(self.gaps)
+
+    @property
+    def max_gap_ms(self) -> float:
+        """Get the longest gap between a transition and the start of the next behaviour, in milliseconds."""
+        return 1000 * max(self.gaps)
+
+    @property
+    def acts_per_second(self) -> float:
+        """Get the number of periodic acts per second."""
+        return self.acts / self.seconds
+
+    @property
+    def cpu_share(self) -> float:
+        """Get the share of a cpu used by the agent."""
+        return self.cpu_seconds / self.seconds
+
+    def to_json(self) -> Dict[str, Any]:
+        """Get a json serializable summary of the result."""
+        return {
+            "tick_interval": self.tick_interval,
+            "wake_on_round_transition": self.wake_on_round_transition,
+            "transitions": len(self.gaps),
+            "mean_gap_ms": self.mean_gap_ms,
+            "max_gap_ms": self.max_gap_ms,
+            "acts_per_second": self.acts_per_second,
+            "cpu_share": self.cpu_share,
+        }
+
+
+def _create_agent(wake_on_round_transition: bool, log_dir: str) -> SimulatedAgent:
+    """Create and set up an agent, whose behaviours get no response."""
+    skill_factory = SkillFactory(
+        {
+            "benchmark_tool": {"log_dir": log_dir},
+            "params": {
+                "setup": {
+                    "all_participants": [ADDRESS],
+                    "safe_contract_address": "0x" + "00" * 20,
+                    "consensus_threshold": None,
+                },
+                "wake_on_round_transition": wake_on_round_transition,
+            },
+            "printed_messages_output": {"target": "memory"},
+            "randomness_cache": {"prefetch": False},
+        }
+    )
+    agent = SimulatedAgent("agent_0", ADDRESS, skill_factory)
+    for components in (agent.skill.handlers, agent.skill.behaviours):
+        for component in components.values():
+            component.setup()
+    for model in agent.skill.models.values():
+        model.setup()
+    agent.round_sequence.end_sync()
+    return agent
+
+
+async def _run_transitions(
+    agent: SimulatedAgent, result: WakeupResult, n_transitions: int
+) -> None:
+    """Move the app to the next round at random times, recording when the next behaviour starts."""
+    behaviour = cast(AbstractRoundBehaviour, agent.context.behaviours.main)
+    abci_app = agent.round_sequence.abci_app
+    synchronized_data = cast(SynchronizedData, abci_app.synchronized_data).update(
+        participants=(ADDRESS,),
+        most_voted_randomness=RANDOMNESS,
+        most_voted_keeper_address=ADDRESS,
+        printed_messages=PrintedMessages.from_messages([]).to_json(),
+    )
+    started: List[float] = []
+    is_started = asyncio.Event()
+    instantiate_behaviour_cls = behaviour.instantiate_behaviour_cls
+
+    def _instantiate_behaviour_cls(*args: Any) -> Any:
+        started.append(time.perf_counter())
+        is_started.set()
+        return instantiate_behaviour_cls(*args)
+
+    behaviour.instantiate_behaviour_cls = _instantiate_behaviour_cls  # type: ignore
+    rng = random.Random(0)  # nosec
+    # the transitions are scheduled independently of the gaps, so that all the runs last as long
+    deadline = time.perf_counter()
+    for _ in range(n_transitions):
+        deadline += rng.uniform(MIN_ROUND_SECONDS, MAX_ROUND_SECONDS)
+        await asyncio.sleep(max(deadline - time.perf_counter(), 0))
+        is_started.clear()
+        abci_app.process_event(Event.DONE, synchronized_data)
+        transition = time.perf_counter()
+        if result.wake_on_round_transition:
+            agent.context.state.notify_round_transition()
+        await is_started.wait()
+        result.gaps.append(started[-1] - transition)
+
+
+def run_benchmark(
+    tick_interval: float, wake_on_round_transition: bool, n_transitions: int
+) -> WakeupResult:
+    """
+    Benchmark the gap between the round transitions and the start of the next behaviours.
+
+    :param tick_interval: the interval between two acts of the behaviour, in seconds.
+    :param wake_on_round_transition: whether the behaviour acts as soon as a round transition is notified.
+    :param n_transitions: the number of measured transitions.
+    :return: the result of the benchmark.
+    """
+    result = WakeupResult(tick_interval, wake_on_round_transition)
+    with TemporaryDirectory() as log_dir:
+        agent = _create_agent(wake_on_round_transition, log_dir)
+        behaviour = cast(AbstractRoundBehaviour, agent.context.behaviours.main)
+
+        def _act() -> None:
+            result.acts += 1
+            behaviour.act_wrapper()
+
+        loop = asyncio.new_event_loop()
+        caller = PeriodicCaller(_act, period=tick_interval, loop=loop)
+        start, cpu_start = time.perf_counter(), time.process_time()
+        try:
+            caller.start()
+            loop.run_until_complete(_run_transitions(agent, result, n_transitions))
+        finally:
+            caller.stop()
+            loop.close()
+            result.seconds = time.perf_counter() - start
+            result.cpu_seconds = time.process_time() - cpu_start
+            for model in agent.skill.models.values():
+                model.teardown()
+    return result
+
+
+def format_results(results: Sequence[WakeupResult]) -> str:
+    """Format the results as a table."""
+    rows = [["tick s", "wake", "mean gap ms", "max gap ms", "acts/s", "cpu %"]]
+    for result in results:
+        rows.append(
+            [
+                f"{result.tick_interval:g}",
+                "yes" if result.wake_on_round_transition else "no",
+                f"{result.mean_gap_ms:.3f}",
+                f"{result.max_gap_ms:.3f}",
+                f"{result.acts_per_second:.0f}",
+                f"{100 * result.cpu_share:.1f}",
+            ]
+        )
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    return "\n".join(
+        "  ".join(cell.rjust(width) for cell, width in zip(row, widths)) for row in rows
+    )
+
+
+def get_args() -> argparse.Namespace:
+    """Get the script arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument(
+        "--tick-intervals",
+        type=float,
+        nargs="+",
+        default=list(DEFAULT_TICK_INTERVALS),
+        help="the intervals between two acts of the behaviour to benchmark, in seconds.",
+    )
+    parser.add_argument(
+        "--transitions",
+        type=int,
+        default=DEFAULT_TRANSITIONS,
+        help="the number of measured round transitions.",
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="print the results as json."
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Run the benchmarks."""
+    args = get_args()
+    logging.getLogger("aea").setLevel(logging.ERROR)
+    results = [
+        run_benchmark(tick_interval, wake_on_round_transition, args.transitions)
+        for tick_interval in args.tick_intervals
+        for wake_on_round_transition in (False, True)
+    ]
+    if args.json:
+        print(json.dumps([result.to_json() for result in results], indent=2))
+    else:
+        print(format_results(results))
+
+
+if __name__ == "__main__":
+    main()
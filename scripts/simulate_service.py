@@ -0,0 +1,735 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""
+Simulate the Hello World service in-process, with N agents and a local stand-in for Tendermint.
+
+Each agent loads its own instance of the `hello_world_abci` skill and runs the real
+`HelloWorldRoundBehaviour`. Instead of the multiplexer, the decision maker and Tendermint,
+the `LocalConsensusEngine`:
+
+- signs the payloads with a stub signature,
+- answers the `broadcast_tx_sync` and `tx` requests sent to the Tendermint rpc,
+- orders the broadcast transactions deterministically, by arrival time then sender,
+  and delivers them in blocks to the ABCI app of every agent, as the ABCI connection would do.
+
+A broadcast transaction reaches the mempool after the configured latency, in simulated seconds,
+and is dropped with the configured probability, in which case the agent sends it again.
+The blocks are produced on a simulated clock, so the round timeouts do not depend on the speed of the
+machine. The local randomness beacon of the agents follows the simulated clock too.
+
+The script reports the periods per second, in wall-clock time, the periods per minute, in simulated time,
+and the number of messages exchanged. With `--pipeline-randomness`, the randomness of each period is agreed on
+in the `PrintMessageRound` of the previous one, which can be compared against the sequential periods.
+
+Usage:
+    python scripts/simulate_service.py --agents 4 --periods 10
+    python scripts/simulate_service.py --agents 100 --periods 3 --latency 0.5 --loss 0.01 --json
+    python scripts/simulate_service.py --agents 4 --periods 20 --pipeline-randomness
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from hashlib import sha256
+from logging import Logger
+from pathlib import Path
+from queue import Empty, Queue
+from tempfile import TemporaryDirectory
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Tuple, Type, cast
+from urllib.parse import parse_qs, urlparse
+
+
+ROOT_DIR = Path(__file__).parent.parent
+sys.path.append(str(ROOT_DIR))
+
+# pylint: disable=wrong-import-position
+from aea.configurations.base import PackageType, SkillConfig  # noqa: E402
+from aea.configurations.loader import ConfigLoaders  # noqa: E402
+from aea.context.base import AgentContext  # noqa: E402
+from aea.helpers.io import open_file  # noqa: E402
+from aea.helpers.logging import AgentLoggerAdapter  # noqa: E402
+from aea.identity.base import Identity  # noqa: E402
+from aea.multiplexer import MultiplexerStatus, OutBox  # noqa: E402
+from aea.protocols.base import Message  # noqa: E402
+from aea.skills.base import Skill, SkillContext  # noqa: E402
+from aea.skills.tasks import TaskManager  # noqa: E402
+
+from packages.open_aea.protocols.signing import SigningMessage  # noqa: E402
+from packages.open_aea.protocols.signing.custom_types import SignedMessage  # noqa: E402
+from packages.valory.connections.http_client.connection import (  # noqa: E402
+    PUBLIC_ID as HTTP_CLIENT_PUBLIC_ID,
+)
+from packages.valory.protocols.abci.custom_types import (  # noqa: E402
+    BlockID,
+    ConsensusVersion,
+    Evidences,
+    Header,
+    LastCommitInfo,
+    PartSetHeader,
+    Timestamp,
+)
+from packages.valory.protocols.http import HttpMessage  # noqa: E402
+from packages.valory.skills.abstract_round_abci.base import (  # noqa: E402
+    ERROR_CODE,
+    LateArrivingTransaction,
+    OK_CODE,
+    RoundSequence,
+    SignatureNotValidError,
+    Transaction,
+    TransactionNotValidError,
+    TransactionTypeNotRecognizedError,
+)
+from packages.valory.skills.abstract_round_abci.behaviours import (  # noqa: E402
+    AbstractRoundBehaviour,
+)
+from packages.valory.skills.abstract_round_abci.handlers import (  # noqa: E402
+    exception_to_info_msg,
+)
+from packages.valory.skills.hello_world_abci.randomness import (  # noqa: E402
+    DeterministicBeacon,
+)
+from packages.valory.skills.hello_world_abci.rounds import (  # noqa: E402
+    SynchronizedData,
+)
+
+
+SKILL_DIR = ROOT_DIR / "packages" / "valory" / "skills" / "hello_world_abci"
+DEFAULT_AGENTS = 4
+DEFAULT_PERIODS = 5
+DEFAULT_BLOCK_INTERVAL = 1.0
+# the maximum number of times the agents act between two blocks, if they keep exchanging messages
+MAX_STEPS_PER_BLOCK = 20
+# the blocks produced before giving up, per period to run
+MAX_BLOCKS_PER_PERIOD = 200
+CHAIN_ID = "simulated-chain"
+BEACON_SEED = "00" * 32
+STUB_SIGNATURE = "0x" + "00" * 65
+
+
+@dataclass
+class SimulationResult:  # pylint: disable=too-many-instance-attributes
+    """The result of a simulation."""
+
+    n_agents: int
+    latency: float
+    loss: float
+    pipeline_randomness: bool = False
+    periods: int = 0
+    blocks: int = 0
+    seconds: float = 0.0
+    simulated_seconds: float = 0.0
+    messages: Counter = field(default_factory=Counter)
+
+    @property
+    def periods_per_second(self) -> float:
+        """Get the wall-clock throughput of the service."""
+        return self.periods / self.seconds if self.seconds else float("inf")
+
+    @property
+    def periods_per_minute(self) -> float:
+        """Get the throughput of the service, in simulated time."""
+        return (
+            60 * self.periods / self.simulated_seconds
+            if self.simulated_seconds
+            else float("inf")
+        )
+
+    def to_json(self) -> Dict[str, Any]:
+        """Get a json serializable summary of the result."""
+        return {
+            "n_agents": self.n_agents,
+            "latency": self.latency,
+            "loss": self.loss,
+            "pipeline_randomness": self.pipeline_randomness,
+            "periods": self.periods,
+            "blocks": self.blocks,
+            "seconds": self.seconds,
+            "simulated_seconds": self.simulated_seconds,
+            "periods_per_second": self.periods_per_second,
+            "periods_per_minute": self.periods_per_minute,
+            "messages": dict(self.messages),
+        }
+
+
+class SimulatedBeacon(DeterministicBeacon):
+    """A local randomness beacon following the simulated clock."""
+
+    def __init__(self, seed: str, engine: "LocalConsensusEngine") -> None:
+        """Initialize the beacon."""
+        super().__init__(seed)
+        self._engine = engine
+
+    def current_round(self, now: Optional[float] = None) -> int:
+        """Get the round of the beacon at the simulated time."""
+        return super().current_round(self._engine.now if now is None else now)
+
+
+class SimulatedOutbox:  # pylint: disable=too-few-public-methods
+    """Collect the messages sent by a skill, in place of the multiplexer."""
+
+    def __init__(self) -> None:
+        """Initialize the outbox."""
+        self.messages: List[Message] = []
+
+    def put_message(self, message: Message, context: Any = None) -> None:
+        """Collect a message."""
+        del context
+        self.messages.append(message)
+
+
+class SkillFactory:  # pylint: disable=too-few-public-methods
+    """
+    Load the Hello World ABCI skill once, and instantiate its components for each agent.
+
+    Loading a skill executes all the python modules of its directory, so loading it for each agent
+    would take most of the time of a simulation with many agents.
+    """
+
+    def __init__(self, args_overrides: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Load the skill configuration.
+
+        :param args_overrides: the overrides of the arguments of the models, by model name.
+        """
+        loader = ConfigLoaders.from_package_type(PackageType.SKILL)
+        with open_file(SKILL_DIR / "skill.yaml") as fp:
+            self.configuration: SkillConfig = loader.load(fp)
+        self.configuration.directory = SKILL_DIR
+        for name, args in args_overrides.items():
+            self.configuration.models.read(name).args.update(args)
+        self._component_classes: Optional[Dict[str, Dict[str, Type]]] = None
+
+    def create(self, agent_context: AgentContext) -> Skill:
+        """Create an instance of the skill for an agent."""
+        if self._component_classes is None:
+            skill = Skill.from_config(self.configuration, agent_context)
+            self._component_classes = {
+                kind: {name: type(component) for name, component in components.items()}
+                for kind, components in (
+                    ("handlers", skill.handlers),
+                    ("behaviours", skill.behaviours),
+                    ("models", skill.models),
+                )
+            }
+            return skill
+
+        skill_context = SkillContext()
+        skill_context.set_agent_context(agent_context)
+        logger_name = f"aea.{agent_context.agent_name}.packages.{self.configuration.author}.skills.{self.configuration.name}"
+        skill_context.logger = cast(
+            Logger,
+            AgentLoggerAdapter(
+                logging.getLogger(logger_name), agent_context.agent_name
+            ),
+        )
+        skill = Skill(self.configuration, skill_context)
+        for kind, classes in self._component_classes.items():
+            configurations = getattr(self.configuration, kind)
+            components = getattr(skill, kind)
+            for name, class_ in classes.items():
+                configuration = configurations.read(name)
+                components[name] = class_(
+                    name=name,
+                    configuration=configuration,
+                    skill_context=skill_context,
+                    **configuration.args,
+                )
+        skill._set_models_on_context()  # pylint: disable=protected-access
+        return skill
+
+
+class SimulatedAgent:
+    """An agent running its own instance of the Hello World ABCI skill."""
+
+    def __init__(self, name: str, address: str, skill_factory: SkillFactory) -> None:
+        """Create the skill of the agent."""
+        self.name = name
+        self.address = address
+        self.outbox = SimulatedOutbox()
+        self.decision_maker_queue: Queue = Queue()
+        identity = Identity(name, address=address, public_key=address)
+        agent_context = AgentContext(
+            identity=identity,
+            connection_status=MultiplexerStatus(),
+            outbox=cast(OutBox, self.outbox),
+            decision_maker_message_queue=self.decision_maker_queue,
+            decision_maker_handler_context=SimpleNamespace(),
+            task_manager=TaskManager(),
+            default_ledger_id=identity.default_address_key,
+            currency_denominations={},
+            default_connection=None,
+            default_routing={},
+            search_service_address="simulated/search:0.1.0",
+            decision_maker_address="simulated_decision_maker",
+            data_dir=os.getcwd(),
+        )
+        self.skill = skill_factory.create(agent_context)
+        self.context = self.skill.skill_context
+        # the agents do not pause in real time between the periods; bypasses the validation of the params
+        self.context.params.__dict__["reset_pause_duration"] = 0
+        # the results of the transactions delivered to the app of the agent, by hash
+        self.tx_results: Dict[str, Tuple[int, str]] = {}
+
+    def setup(self, engine: "LocalConsensusEngine") -> None:
+        """Set up the handlers, the behaviours and the models, as the agent does on start."""
+        for handler in self.skill.handlers.values():
+            handler.setup()
+        for behaviour in self.skill.behaviours.values():
+            behaviour.setup()
+        for model in self.skill.models.values():
+            model.setup()
+        self.context.randomness_sources.local_sources[:] = [
+            SimulatedBeacon(BEACON_SEED, engine)
+        ]
+        self.round_sequence.end_sync()
+
+    @property
+    def round_sequence(self) -> RoundSequence:
+        """Get the round sequence of the ABCI app of the agent."""
+        return self.context.state.round_sequence
+
+    @property
+    def synchronized_data(self) -> SynchronizedData:
+        """Get the synchronized data of the agent."""
+        return cast(SynchronizedData, self.context.state.synchronized_data)
+
+    def act(self) -> None:
+        """Run the behaviour of the agent until it waits for a message or a condition."""
+        cast(AbstractRoundBehaviour, self.context.behaviours.main).act_wrapper()
+
+    def take_messages(self) -> List[Message]:
+        """Take the messages sent by the agent to the decision maker and to the connections."""
+        messages, self.outbox.messages = self.outbox.messages, []
+        while True:
+            try:
+                messages.append(self.decision_maker_queue.get_nowait())
+            except Empty:
+                return messages
+
+    def receive(self, message: Message) -> None:
+        """Handle a message sent to the agent."""
+        if isinstance(message, SigningMessage):
+            self.context.handlers.signing.handle(message)
+        else:
+            self.context.handlers.http.handle(message)
+
+
+@dataclass(order=True)
+class PendingTransaction:
+    """A transaction broadcast to the mempool, ordered by arrival time and sender."""
+
+    arrival: float
+    sender: str
+    sequence: int
+    tx_hash: str = field(compare=False)
+    transaction: Transaction = field(compare=False)
+
+
+class LocalConsensusEngine:  # pylint: disable=too-many-instance-attributes
+    """A deterministic stand-in for Tendermint, the decision maker and the http client of the agents."""
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        n_agents: int,
+        log_dir: str,
+        latency: float = 0.0,
+        loss: float = 0.0,
+        block_interval: float = DEFAULT_BLOCK_INTERVAL,
+        seed: int = 0,
+        pipeline_randomness: bool = False,
+    ) -> None:
+        """
+        Initialize the engine and the agents.
+
+        :param n_agents: the number of agents.
+        :param log_dir: the directory of the benchmark logs of the agents.
+        :param latency: the simulated seconds a broadcast transaction takes to reach the mempool.
+        :param loss: the probability that a broadcast transaction is dropped.
+        :param block_interval: the simulated seconds between two blocks.
+        :param seed: the seed of the transactions' losses.
+        :param pipeline_randomness: whether the randomness of each period is agreed on in the previous one.
+        """
+        self.latency = latency
+        self.loss = loss
+        self.block_interval = block_interval
+        self.pipeline_randomness = pipeline_randomness
+        self.now = float(int(time.time()))
+        self.height = 0
+        self.messages: Counter = Counter()
+        self._random = random.Random(seed)
+        self._mempool: List[PendingTransaction] = []
+        self._committed: Dict[str, int] = {}
+        self._lost: set = set()
+        self._sequence = 0
+        # the `tx` queries waiting for their transaction to be committed
+        self._tx_queries: List[Tuple[SimulatedAgent, HttpMessage, str]] = []
+        self._log_dir = log_dir
+
+        addresses = [f"0x{i + 1:040x}" for i in range(n_agents)]
+        skill_factory = SkillFactory(self._args_overrides(addresses))
+        self.agents = [
+            SimulatedAgent(f"agent_{i}", address, skill_factory)
+            for i, address in enumerate(addresses)
+        ]
+        for agent in self.agents:
+            agent.setup(self)
+
+    def _args_overrides(self, addresses: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get the overrides of the arguments of the models of the skill, for the simulation."""
+        return {
+            "benchmark_tool": {"log_dir": self._log_dir},
+            "params": {
+                "setup": {
+                    "all_participants": addresses,
+                    "safe_contract_address": "0x" + "00" * 20,
+                    "consensus_threshold": None,
+                },
+                # the agents do not wait in real time between the attempts
+                "request_retry_delay": 0.0,
+                "sleep_time": 0,
+                "pipeline_randomness": self.pipeline_randomness,
+            },
+            "printed_messages_output": {"target": "memory"},
+            "randomness_cache": {"prefetch": False},
+        }
+
+    @property
+    def period_count(self) -> int:
+        """Get the number of periods completed by all the agents."""
+        return min(agent.synchronized_data.period_count for agent in self.agents)
+
+    @staticmethod
+    def _respond_http(
+        agent: SimulatedAgent, request: HttpMessage, status_code: int, body: Dict
+    ) -> None:
+        """Send the response to an http request of an agent."""
+        response = HttpMessage(
+            performative=HttpMessage.Performative.RESPONSE,
+            dialogue_reference=(request.dialogue_reference[0], "simulated"),
+            message_id=-1,
+            target=request.message_id,
+            version=request.version,
+            status_code=status_code,
+            status_text="",
+            headers="",
+            body=json.dumps(body).encode("utf-8"),
+        )
+        response.sender = str(HTTP_CLIENT_PUBLIC_ID)
+        response.to = str(agent.skill.public_id)
+        agent.receive(response)
+
+    def _sign(self, agent: SimulatedAgent, request: SigningMessage) -> None:
+        """Sign a payload with a stub signature, in place of the decision maker."""
+        self.messages["signing"] += 1
+        response = SigningMessage(
+            performative=SigningMessage.Performative.SIGNED_MESSAGE,
+            dialogue_reference=(request.dialogue_reference[0], "simulated"),
+            message_id=-1,
+            target=request.message_id,
+            signed_message=SignedMessage(request.raw_message.ledger_id, STUB_SIGNATURE),
+        )
+        response.sender = agent.context.decision_maker_address
+        response.to = str(agent.skill.public_id)
+        agent.receive(response)
+
+    def _broadcast(self, agent: SimulatedAgent, request: HttpMessage, tx: str) -> None:
+        """Add a transaction to the mempool, unless it is lost."""
+        self.messages["broadcast_tx"] += 1
+        tx_bytes = bytes.fromhex(tx[2:])
+        tx_hash = sha256(tx_bytes).hexdigest()
+        if self._random.random() < self.loss:
+            self.messages["lost_tx"] += 1
+            self._lost.add(tx_hash)
+        else:
+            self._sequence += 1
+            self._mempool.append(
+                PendingTransaction(
+                    self.now + self.latency,
+                    agent.address,
+                    self._sequence,
+                    tx_hash,
+                    Transaction.decode(tx_bytes),
+                )
+            )
+        self._respond_http(
+            agent, request, 200, {"result": {"hash": tx_hash, "code": OK_CODE}}
+        )
+
+    def _answer_tx_query(
+        self, agent: SimulatedAgent, request: HttpMessage, tx_hash: str
+    ) -> bool:
+        """Answer a `tx` query, returning whether its transaction was committed or lost."""
+        if tx_hash in agent.tx_results:
+            code, info = agent.tx_results[tx_hash]
+            body = {
+                "result": {
+                    "hash": tx_hash,
+                    "height": str(self._committed[tx_hash]),
+                    "tx_result": {"code": code, "info": info},
+                }
+            }
+            self._respond_http(agent, request, 200, body)
+            return True
+        if tx_hash in self._lost:
+            error = {
+                "code": -32603,
+                "message": "Internal error",
+                "data": f"tx ({tx_hash}) not found",
+            }
+            self._respond_http(agent, request, 500, {"error": error})
+            return True
+        return False
+
+    def _route(self, agent: SimulatedAgent, message: Message) -> None:
+        """Route a message sent by an agent."""
+        if isinstance(message, SigningMessage):
+            self._sign(agent, message)
+            return
+        request = cast(HttpMessage, message)
+        url = urlparse(request.url)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        if url.path.endswith("/broadcast_tx_sync"):
+            self._broadcast(agent, request, query["tx"])
+        elif url.path.endswith("/tx"):
+            self.messages["tx_query"] += 1
+            tx_hash = query["hash"][2:]
+            if not self._answer_tx_query(agent, request, tx_hash):
+                self._tx_queries.append((agent, request, tx_hash))
+        else:
+            self.messages["other_http"] += 1
+            self._respond_http(agent, request, 404, {"error": "not simulated"})
+
+    def step(self) -> None:
+        """Let the agents act and exchange messages, until they wait for the next block."""
+        for _ in range(MAX_STEPS_PER_BLOCK):
+            is_idle = True
+            for agent in self.agents:
+                agent.act()
+                for message in agent.take_messages():
+                    is_idle = False
+                    self._route(agent, message)
+            if is_idle:
+                return
+
+    def _header(self) -> Header:
+        """Get the header of the next block."""
+        seconds = int(self.now)
+        return Header(
+            ConsensusVersion(0, 0),
+            CHAIN_ID,
+            self.height,
+            Timestamp(seconds, int((self.now - seconds) * 10**9)),
+            BlockID(b"", PartSetHeader(0, b"")),
+            b"",
+            b"",
+            b"",
+            b"",
+            b"",
+            b"",
+            b"",
+            b"",
+            b"",
+        )
+
+    def commit_block(self) -> None:
+        """Deliver the transactions which reached the mempool in a new block, to all the agents."""
+        self.now += self.block_interval
+        self.height += 1
+        self._mempool.sort()
+        n_ready = next(
+            (i for i, tx in enumerate(self._mempool) if tx.arrival > self.now),
+            len(self._mempool),
+        )
+        block, self._mempool = self._mempool[:n_ready], self._mempool[n_ready:]
+        header = self._header()
+        for agent in self.agents:
+            round_sequence = agent.round_sequence
+            round_sequence.begin_block(header, Evidences([]), LastCommitInfo(0, []))
+            for pending in block:
+                try:
+                    round_sequence.check_is_finished()
+                    round_sequence.deliver_tx(pending.transaction)
+                    result = (OK_CODE, "deliver_tx succeeded")
+                except (
+                    SignatureNotValidError,
+                    TransactionNotValidError,
+                    TransactionTypeNotRecognizedError,
+                    LateArrivingTransaction,
+                ) as exception:
+                    result = (ERROR_CODE, exception_to_info_msg(exception))
+                agent.tx_results[pending.tx_hash] = result
+            round_sequence.tm_height = self.height
+            round_sequence.end_block()
+            round_sequence.commit()
+        for pending in block:
+            self._committed[pending.tx_hash] = self.height
+        self.messages["block"] += 1
+        self.messages["delivered_tx"] += len(block)
+
+        waiting, self._tx_queries = self._tx_queries, []
+        for agent, request, tx_hash in waiting:
+            if not self._answer_tx_query(agent, request, tx_hash):
+                self._tx_queries.append((agent, request, tx_hash))
+
+    def run(self, n_periods: int) -> SimulationResult:
+        """
+        Run the service until all the agents complete the given number of periods.
+
+        :param n_periods: the number of periods to run.
+        :return: the result of the simulation.
+        """
+        result = SimulationResult(
+            len(self.agents), self.latency, self.loss, self.pipeline_randomness
+        )
+        start_time, start_now = time.perf_counter(), self.now
+        max_blocks = MAX_BLOCKS_PER_PERIOD * n_periods
+        while self.period_count < n_periods:
+            if self.height >= max_blocks:
+                raise RuntimeError(
+                    f"The agents did not complete {n_periods} periods in {max_blocks} blocks."
+                )
+            self.step()
+            self.commit_block()
+        result.seconds = time.perf_counter() - start_time
+        result.simulated_seconds = self.now - start_now
+        result.periods = self.period_count
+        result.blocks = self.height
+        result.messages = Counter(self.messages)
+        return result
+
+    def teardown(self) -> None:
+        """Tear down the agents."""
+        for agent in self.agents:
+            for model in agent.skill.models.values():
+                model.teardown()
+
+
+def run_simulation(  # pylint: disable=too-many-arguments
+    n_agents: int,
+    n_periods: int,
+    latency: float = 0.0,
+    loss: float = 0.0,
+    block_interval: float = DEFAULT_BLOCK_INTERVAL,
+    seed: int = 0,
+    pipeline_randomness: bool = False,
+) -> SimulationResult:
+    """Simulate the service with the given number of agents, until they complete `n_periods` periods."""
+    with TemporaryDirectory() as log_dir:
+        engine = LocalConsensusEngine(
+            n_agents, log_dir, latency, loss, block_interval, seed, pipeline_randomness
+        )
+        try:
+            return engine.run(n_periods)
+        finally:
+            engine.teardown()
+
+
+def format_result(result: SimulationResult) -> str:
+    """Format a result as a table."""
+    rows = [
+        ("agents", str(result.n_agents)),
+        ("periods", str(result.periods)),
+        ("blocks", str(result.blocks)),
+        ("seconds", f"{result.seconds:.2f}"),
+        ("simulated seconds", f"{result.simulated_seconds:.1f}"),
+        ("periods/s", f"{result.periods_per_second:.2f}"),
+        ("simulated periods/min", f"{result.periods_per_minute:.2f}"),
+        *((f"{kind} messages", str(n)) for kind, n in sorted(result.messages.items())),
+    ]
+    width = max(len(name) for name, _ in rows)
+    return "\n".join(f"{name.ljust(width)}  {value}" for name, value in rows)
+
+
+def get_args() -> argparse.Namespace:
+    """Get the script arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument(
+        "--agents",
+        type=int,
+        default=DEFAULT_AGENTS,
+        help="the number of simulated agents.",
+    )
+    parser.add_argument(
+        "--periods",
+        type=int,
+        default=DEFAULT_PERIODS,
+        help="the number of periods to run.",
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="the simulated seconds a transaction takes to reach the mempool.",
+    )
+    parser.add_argument(
+        "--loss",
+        type=float,
+        default=0.0,
+        help="the probability that a broadcast transaction is dropped.",
+    )
+    parser.add_argument(
+        "--block-interval",
+        type=float,
+        default=DEFAULT_BLOCK_INTERVAL,
+        help="the simulated seconds between two blocks.",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="the seed of the transactions' losses."
+    )
+    parser.add_argument(
+        "--pipeline-randomness",
+        action="store_true",
+        help="agree on the randomness of each period in the PrintMessageRound of the previous one.",
+    )
+    parser.add_argument(
+        "--json", action="store_true", help="print the results as json."
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Run the simulation."""
+    args = get_args()
+    logging.getLogger("aea").setLevel(logging.WARNING)
+    result = run_simulation(
+        args.agents,
+        args.periods,
+        args.latency,
+        args.loss,
+        args.block_interval,
+        args.seed,
+        args.pipeline_randomness,
+    )
+    if args.json:
+        print(json.dumps(result.to_json(), indent=2))
+    else:
+        print(format_result(result))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+#
+#   Copyright 2023 Valory AG
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# ------------------------------------------------------------------------------
+
+"""Smoke test of the scripts/benchmark_round_wakeup.py script."""
+
+import json
+import subprocess  # nosec
+import sys
+from pathlib import Path
+
+
+ROOT_DIR = Path(__file__).parent.parent
+SCRIPT = ROOT_DIR / "scripts" / "benchmark_round_wakeup.py"
+TIMEOUT = 120
+
+
+def test_benchmark_round_wakeup() -> None:
+    """Test that the benchmark runs a few transitions, with and without the wake-up on round transition."""
+    process = subprocess.run(  # nosec
+        [
+            sys.executable,
+            str(SCRIPT),
+            "--tick-intervals",
+            "0.01",
+            "--transitions",
+            "2",
+            "--json",
+        ],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        timeout=TIMEOUT,
+        check=False,
+    )
+    assert process.returncode == 0, process.stderr
+    results = json.loads(process.stdout)
+    assert [result["wake_on_round_transition"] for result in results] == [
+        False,
+        True,
+    ]
+    for result in results:
+        assert result["tick_interval"] == 0.01
+        assert result["transitions"] == 2
+        assert result["max_gap_ms"] >= result["mean_gap_ms"] > 0